@@ -4,6 +4,7 @@ Provides REST API and WebSocket for real-time tennis data
 """
 
 from flask import Flask, Response, jsonify, request, send_from_directory, redirect
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from flask_socketio import SocketIO, emit
 import time
@@ -14,10 +15,12 @@ import threading
 import subprocess
 import json
 import re
+import hashlib
 import requests
+from requests.adapters import HTTPAdapter
 import atexit
 from datetime import datetime
-from tennis_api import tennis_fetcher
+from tennis_api import get_tennis_fetcher
 from config import Config
 
 try:
@@ -26,6 +29,26 @@ try:
 except Exception:
     HAS_SIMPLE_WEBSOCKET = False
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    from flask_compress import Compress
+    HAS_FLASK_COMPRESS = True
+except Exception:
+    Compress = None
+    HAS_FLASK_COMPRESS = False
+
+# Shared keep-alive session for outbound requests made by the routes (historic
+# CSV proxy, notification service probes) so repeated calls reuse connections
+upstream_http = requests.Session()
+upstream_http.mount('https://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+upstream_http.mount('http://', HTTPAdapter(pool_connections=4, pool_maxsize=8))
+
 
 # --- Player Image Manager ---
 class PlayerImageManager:
@@ -127,10 +150,44 @@ image_manager = PlayerImageManager(DATA_DIR)
 threading.Thread(target=image_manager.scan_players, daemon=True).start()
 
 
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Serialize API responses with orjson. Keys stay sorted and dates and other
+    non-native types still go through Flask's default hook; unlike the stdlib
+    provider, non-ASCII text is sent as raw UTF-8 rather than \\u escapes.
+    """
+
+    def dumps(self, obj, **kwargs):
+        option = (
+            orjson.OPT_NON_STR_KEYS
+            | orjson.OPT_PASSTHROUGH_DATETIME
+            | orjson.OPT_SORT_KEYS
+        )
+        if kwargs.get('indent'):
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, default=self.default, option=option).decode('utf-8')
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 app = Flask(__name__)
+if HAS_ORJSON:
+    app.json = OrjsonJSONProvider(app)
 app.config['SECRET_KEY'] = 'tennis_dashboard_secret_2024'
 CORS(app, origins="*", resources={r"/api/*": {"origins": "*"}})
 
+# Gzip JSON API responses (rankings, brackets, live scores) when Flask-Compress is available.
+# Level 1 keeps CPU overhead negligible; tiny payloads are sent as-is.
+if HAS_FLASK_COMPRESS:
+    app.config.update(
+        COMPRESS_MIMETYPES=['application/json'],
+        COMPRESS_ALGORITHM=['gzip', 'deflate'],
+        COMPRESS_LEVEL=1,
+        COMPRESS_MIN_SIZE=1024,
+    )
+    Compress(app)
+
 # Keep console output focused on warnings/errors instead of per-request 200 logs.
 # Override with QUIET_HTTP_LOGS=false if detailed HTTP access logs are needed.
 if os.getenv('QUIET_HTTP_LOGS', 'true').strip().lower() in {'1', 'true', 'yes', 'on'}:
@@ -264,7 +321,7 @@ def _notification_healthcheck(timeout=1.2):
 
     for url in candidate_urls:
         try:
-            probe = requests.get(url, timeout=timeout)
+            probe = upstream_http.get(url, timeout=timeout)
             if probe.status_code == 200:
                 return True
         except Exception:
@@ -726,12 +783,11 @@ live_scores_thread_lock = threading.Lock()
 def broadcast_live_scores():
     """Broadcast live scores to all connected clients"""
     try:
-        atp_scores = tennis_fetcher.fetch_live_scores('atp')
-        wta_scores = tennis_fetcher.fetch_live_scores('wta')
+        scores = get_tennis_fetcher().fetch_live_scores_by_tour()
         
         socketio.emit('live_scores_update', {
-            'atp': atp_scores,
-            'wta': wta_scores,
+            'atp': scores['atp'],
+            'wta': scores['wta'],
             'timestamp': time.time()
         })
     except Exception as e:
@@ -776,7 +832,7 @@ def proxy_historic_atp_csv(year):
     timeout = request.args.get('timeout', default=45, type=int)
 
     try:
-        upstream = requests.get(source_url, timeout=max(5, min(timeout, 120)))
+        upstream = upstream_http.get(source_url, timeout=max(5, min(timeout, 120)))
         if upstream.status_code != 200:
             return jsonify({
                 'success': False,
@@ -830,7 +886,7 @@ def get_live_scores():
         tour = 'both'
     
     try:
-        scores = tennis_fetcher.fetch_live_scores(tour)
+        scores = get_tennis_fetcher().fetch_live_scores(tour)
         if tour == 'atp' and not scores:
             cached_live = _load_json_list(os.path.join(REPO_ROOT, 'data', 'atp_live_matches_cache.json'))
             if cached_live:
@@ -854,6 +910,25 @@ def get_live_scores():
         return jsonify({'success': False, 'error': str(e)}), 500
 
 
+@app.route('/api/dashboard', methods=['GET'])
+def get_dashboard_bundle():
+    """Get live scores, rankings and tournaments in one response (ETag-revalidated)"""
+    tour = str(request.args.get('tour', 'both')).strip().lower()
+    if tour not in {'atp', 'wta', 'both'}:
+        tour = 'both'
+
+    try:
+        bundle = get_tennis_fetcher().fetch_dashboard_bundle(tour)
+        response = jsonify({
+            'success': True,
+            'data': bundle
+        })
+        response.set_etag(hashlib.blake2b(response.get_data(), digest_size=8).hexdigest())
+        return response.make_conditional(request)
+    except Exception as e:
+        return jsonify({'success': False, 'error': str(e)}), 500
+
+
 @app.route('/api/recent-matches', methods=['GET'])
 def get_recent_matches():
     """Get recently completed matches"""
@@ -863,7 +938,7 @@ def get_recent_matches():
     limit = request.args.get('limit', 20, type=int)
     
     try:
-        matches = tennis_fetcher.fetch_recent_matches(tour, limit)
+        matches = get_tennis_fetcher().fetch_recent_matches(tour, limit)
         if tour == 'atp':
             matches = _normalize_matches_tour(matches, 'ATP')
         # Render safety net: if ATP feed is empty, reuse last cached ATP snapshot.
@@ -905,7 +980,7 @@ def get_upcoming_matches():
     days = request.args.get('days', 7, type=int)
     
     try:
-        matches = tennis_fetcher.fetch_upcoming_matches(tour, days=days)
+        matches = get_tennis_fetcher().fetch_upcoming_matches(tour, days=days)
         if tour == 'atp':
             matches = _normalize_matches_tour(matches, 'ATP')
         # Render safety net: if ATP feed is empty, reuse last cached ATP snapshot.
@@ -937,18 +1012,19 @@ def get_rankings(tour):
     """Get ATP or WTA rankings"""
     limit = request.args.get('limit', 200, type=int)
     limit = min(limit, 400 if tour == 'wta' else 200)
+    country = (request.args.get('country') or '').strip().upper() or None
     
     try:
-        rankings = tennis_fetcher.fetch_rankings(tour, limit)
+        rankings = get_tennis_fetcher().top_rankings(tour, limit, country)
         payload = {
             'success': True,
             'data': rankings,
             'count': len(rankings)
         }
         if tour == 'wta':
-            payload['meta'] = tennis_fetcher.get_wta_rankings_status()
+            payload['meta'] = get_tennis_fetcher().get_wta_rankings_status()
         elif tour == 'atp':
-            payload['meta'] = tennis_fetcher.get_atp_rankings_status()
+            payload['meta'] = get_tennis_fetcher().get_atp_rankings_status()
         return jsonify(payload)
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -960,7 +1036,7 @@ def get_wta_rankings_status():
     try:
         return jsonify({
             'success': True,
-            'data': tennis_fetcher.get_wta_rankings_status()
+            'data': get_tennis_fetcher().get_wta_rankings_status()
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -970,7 +1046,7 @@ def get_wta_rankings_status():
 def refresh_wta_rankings():
     """Refresh WTA rankings CSV and archive previous file."""
     try:
-        status = tennis_fetcher.refresh_wta_rankings_csv()
+        status = get_tennis_fetcher().refresh_wta_rankings_csv()
         # Broadcast scoreboard/rankings refresh event.
         socketio.emit('rankings_update', {
             'tour': 'wta',
@@ -990,7 +1066,7 @@ def get_atp_rankings_status():
     try:
         return jsonify({
             'success': True,
-            'data': tennis_fetcher.get_atp_rankings_status()
+            'data': get_tennis_fetcher().get_atp_rankings_status()
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1000,7 +1076,7 @@ def get_atp_rankings_status():
 def refresh_atp_rankings():
     """Refresh ATP rankings CSV and archive previous file."""
     try:
-        status = tennis_fetcher.refresh_atp_rankings_csv()
+        status = get_tennis_fetcher().refresh_atp_rankings_csv()
         socketio.emit('rankings_update', {
             'tour': 'atp',
             'timestamp': time.time()
@@ -1019,7 +1095,7 @@ def get_atp_stats_status():
     try:
         return jsonify({
             'success': True,
-            'data': tennis_fetcher.get_atp_stats_status()
+            'data': get_tennis_fetcher().get_atp_stats_status()
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1029,7 +1105,7 @@ def get_atp_stats_status():
 def get_atp_stats_leaderboard():
     """Get ATP Stat Zone leaderboard payload from cached CSV."""
     try:
-        data = tennis_fetcher.fetch_atp_stats_leaderboard()
+        data = get_tennis_fetcher().fetch_atp_stats_leaderboard()
         return jsonify({
             'success': True,
             'data': data
@@ -1042,7 +1118,7 @@ def get_atp_stats_leaderboard():
 def refresh_atp_stats():
     """Refresh ATP Stat Zone CSV and archive previous file."""
     try:
-        status = tennis_fetcher.refresh_atp_stats_csv()
+        status = get_tennis_fetcher().refresh_atp_stats_csv()
         socketio.emit('stats_update', {
             'tour': 'atp',
             'scope': 'stat_zone',
@@ -1062,7 +1138,7 @@ def get_wta_stats_status():
     try:
         return jsonify({
             'success': True,
-            'data': tennis_fetcher.get_wta_stats_status()
+            'data': get_tennis_fetcher().get_wta_stats_status()
         })
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1072,7 +1148,7 @@ def get_wta_stats_status():
 def get_wta_stats_leaderboard():
     """Get WTA Stat Zone leaderboard payload from cached CSV."""
     try:
-        data = tennis_fetcher.fetch_wta_stats_leaderboard()
+        data = get_tennis_fetcher().fetch_wta_stats_leaderboard()
         return jsonify({
             'success': True,
             'data': data
@@ -1085,7 +1161,7 @@ def get_wta_stats_leaderboard():
 def refresh_wta_stats():
     """Refresh WTA Stat Zone CSV and archive previous file."""
     try:
-        status = tennis_fetcher.refresh_wta_stats_csv()
+        status = get_tennis_fetcher().refresh_wta_stats_csv()
         socketio.emit('stats_update', {
             'tour': 'wta',
             'scope': 'stat_zone',
@@ -1105,7 +1181,7 @@ def get_tournaments(tour):
     year = request.args.get('year', type=int)
     
     try:
-        tournaments = tennis_fetcher.fetch_tournaments(tour, year)
+        tournaments = get_tennis_fetcher().fetch_tournaments(tour, year)
         return jsonify({
             'success': True,
             'data': tournaments,
@@ -1119,7 +1195,7 @@ def get_tournaments(tour):
 def get_tournaments_status(tour):
     """Get tournament file metadata for a tour."""
     try:
-        status = tennis_fetcher.get_tournaments_status(tour)
+        status = get_tennis_fetcher().get_tournaments_status(tour)
         return jsonify({
             'success': True,
             'data': status
@@ -1140,7 +1216,7 @@ def refresh_tournaments(tour):
         full_refresh = bool(payload.get('full_refresh'))
 
     try:
-        status = tennis_fetcher.refresh_tournaments_json(
+        status = get_tennis_fetcher().refresh_tournaments_json(
             tour=tour,
             year=year,
             full_refresh=full_refresh
@@ -1162,7 +1238,7 @@ def get_tournament_bracket(tournament_id):
     """Get tournament bracket/draw"""
     tour = request.args.get('tour', default='atp')
     try:
-        bracket = tennis_fetcher.fetch_tournament_bracket(tournament_id, tour)
+        bracket = get_tennis_fetcher().fetch_tournament_bracket(tournament_id, tour)
         return jsonify({
             'success': True,
             'data': bracket
@@ -1175,7 +1251,7 @@ def get_tournament_bracket(tournament_id):
 def get_player(player_id):
     """Get player details"""
     try:
-        player = tennis_fetcher.fetch_player_details(player_id)
+        player = get_tennis_fetcher().fetch_player_details(player_id)
         if player:
             return jsonify({
                 'success': True,
@@ -1202,7 +1278,7 @@ def get_wta_match_stats():
         }), 400
 
     try:
-        stats = tennis_fetcher.fetch_wta_match_stats(
+        stats = get_tennis_fetcher().fetch_wta_match_stats(
             event_id=event_id,
             event_year=event_year,
             match_id=match_id,
@@ -1226,7 +1302,7 @@ def get_atp_match_stats():
         }), 400
 
     try:
-        stats = tennis_fetcher.fetch_atp_match_stats(stats_url=stats_url)
+        stats = get_tennis_fetcher().fetch_atp_match_stats(stats_url=stats_url)
         if not stats:
             return jsonify({'success': False, 'error': 'Match stats not available'}), 404
         return jsonify({'success': True, 'data': stats})
@@ -1244,7 +1320,7 @@ def get_player_schedule():
         return jsonify({'success': False, 'error': 'name is required'}), 400
 
     try:
-        payload = tennis_fetcher.fetch_player_next_fixture(player_name=player_name, tour=tour)
+        payload = get_tennis_fetcher().fetch_player_next_fixture(player_name=player_name, tour=tour)
         return jsonify({'success': True, 'data': payload})
     except Exception as e:
         return jsonify({'success': False, 'error': str(e)}), 500
@@ -1259,7 +1335,7 @@ def search_wta_h2h_players():
         return jsonify({'success': True, 'data': [], 'count': 0})
 
     try:
-        players = tennis_fetcher.search_wta_players_for_h2h(query, limit=limit)
+        players = get_tennis_fetcher().search_wta_players_for_h2h(query, limit=limit)
         return jsonify({
             'success': True,
             'data': players,
@@ -1278,7 +1354,7 @@ def search_atp_h2h_players():
         return jsonify({'success': True, 'data': [], 'count': 0})
 
     try:
-        players = tennis_fetcher.search_atp_players_for_h2h(query, limit=limit)
+        players = get_tennis_fetcher().search_atp_players_for_h2h(query, limit=limit)
         return jsonify({
             'success': True,
             'data': players,
@@ -1302,7 +1378,7 @@ def get_wta_h2h():
         return jsonify({'success': False, 'error': 'Please choose two different players'}), 400
 
     try:
-        payload = tennis_fetcher.fetch_wta_h2h_details(
+        payload = get_tennis_fetcher().fetch_wta_h2h_details(
             player1_id=player1_id,
             player2_id=player2_id,
             year=year,
@@ -1330,7 +1406,7 @@ def get_atp_h2h():
         return jsonify({'success': False, 'error': 'Please choose two different players'}), 400
 
     try:
-        payload = tennis_fetcher.fetch_atp_h2h_details(
+        payload = get_tennis_fetcher().fetch_atp_h2h_details(
             player1_code=player1_code,
             player2_code=player2_code,
             year=year,
@@ -1364,11 +1440,10 @@ def handle_connect():
     emit('connected', {'message': 'Connected to Tennis Dashboard'})
     
     # Send current live scores
-    atp_scores = tennis_fetcher.fetch_live_scores('atp')
-    wta_scores = tennis_fetcher.fetch_live_scores('wta')
+    scores = get_tennis_fetcher().fetch_live_scores_by_tour()
     emit('live_scores_update', {
-        'atp': atp_scores,
-        'wta': wta_scores,
+        'atp': scores['atp'],
+        'wta': scores['wta'],
         'timestamp': time.time()
     })
 
@@ -1390,7 +1465,7 @@ def handle_subscribe_tournament(data):
 def handle_request_scores(data):
     """Handle manual score update request"""
     tour = data.get('tour', 'both')
-    scores = tennis_fetcher.fetch_live_scores(tour)
+    scores = get_tennis_fetcher().fetch_live_scores(tour)
     emit('live_scores_update', {
         tour: scores,
         'timestamp': time.time()
@@ -19,6 +19,11 @@ class Config:
     CACHE_LIVE_SCORES = 30  # Update live scores every 30 seconds
     CACHE_RANKINGS = 3600   # Update rankings every hour
     CACHE_TOURNAMENTS = 1800  # Update tournaments every 30 minutes
+    # Optional Redis shared by all workers as a second cache tier (e.g. redis://localhost:6379/0)
+    REDIS_URL = os.getenv('REDIS_URL', '')
+    # Optional directory where workers on one host share cached rankings/tournaments
+    # as files when Redis is not configured (e.g. /tmp/tennis-dashboard-cache)
+    CACHE_DIR = os.getenv('CACHE_DIR', '')
     
     # Tournament categories and their colors (for reference)
     TOURNAMENT_CATEGORIES = {
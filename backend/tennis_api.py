@@ -96,28 +96,355 @@ SECURITY NOTES:
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
-from datetime import datetime, timedelta
-from cachetools import TTLCache
+from datetime import date, datetime, timedelta
+from cachetools import LRUCache, TTLCache
+from concurrent.futures import ThreadPoolExecutor
 import random
 import json
 import csv
+import glob
+import os
+import pickle
+from dataclasses import dataclass
 import re
 import unicodedata
 import difflib
+import functools
+import itertools
 import shutil
 import subprocess
 import sys
+import threading
 import time
 import urllib.parse
 import zlib
 from pathlib import Path
+from types import MappingProxyType
 from config import Config
 
+try:
+    import orjson
+    HAS_ORJSON = True
+except Exception:
+    orjson = None
+    HAS_ORJSON = False
+
+try:
+    from rapidfuzz import fuzz, process as fuzz_process
+    HAS_RAPIDFUZZ = True
+except Exception:
+    fuzz = None
+    fuzz_process = None
+    HAS_RAPIDFUZZ = False
+
+try:
+    import redis
+    HAS_REDIS = True
+except Exception:
+    redis = None
+    HAS_REDIS = False
+
+# Live score freshness bounds (seconds)
+LIVE_SCORES_MIN_TTL = 2
+LIVE_SCORES_REFRESH_AHEAD = 2
+LIVE_SCORES_MAX_STALE = 120
+# Keep serving the last good rankings for up to a week if the source fails
+RANKINGS_STALE_IF_ERROR = 60 * 60 * 24 * 7
+# Bounds for the WTA recent/upcoming script arguments; each distinct value is
+# its own wta_matches_cache entry, so request values are clamped first
+WTA_RECENT_MATCHES_MAX_LIMIT = 100
+WTA_UPCOMING_MATCHES_MAX_DAYS = 14
+# Upper bound on memoized WTA match-card player resolutions; the memo starts
+# over once it fills, since names come from whatever the feeds return
+WTA_RESOLVED_PLAYERS_MAX = 2048
+
+
+class StaleWhileRevalidateCache:
+    """
+    Keyed cache that keeps serving an entry after it goes stale while a single
+    background refresh replaces it. Each entry carries its own TTL.
+    """
+
+    def __init__(self, ttl, max_stale, refresh_ahead=0):
+        self.ttl = ttl
+        self.max_stale = max_stale
+        self.refresh_ahead = refresh_ahead
+        self._entries = {}
+        self._refreshing = set()
+        self._load_locks = {}
+        self._lock = threading.Lock()
+
+    def set(self, key, value, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl
+        refresh_at = expires_at - min(self.refresh_ahead, ttl / 2)
+        with self._lock:
+            self._entries[key] = (value, refresh_at, expires_at)
+
+    def get(self, key, refresh, executor):
+        """
+        Return the cached value, or None when missing or too stale to serve.
+        A value close to or past expiry is still returned and `refresh` is
+        scheduled once on `executor` to replace it.
+        """
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, refresh_at, expires_at = entry
+            if now >= expires_at + self.max_stale:
+                return None
+            if now < refresh_at or key in self._refreshing:
+                return value
+            self._refreshing.add(key)
+        executor.submit(self._run_refresh, key, refresh)
+        return value
+
+    def get_or_load(self, key, refresh, executor):
+        """
+        Like `get`, but on a miss `refresh` runs in the calling thread and its
+        result is returned. Concurrent misses for the same key wait for that
+        single call and then read the value it stored instead of refreshing
+        again; `refresh` is expected to `set` the entry itself.
+        """
+        value = self.get(key, refresh, executor)
+        if value is not None:
+            return value
+        with self._lock:
+            load_lock = self._load_locks.setdefault(key, threading.Lock())
+        with load_lock:
+            value = self.get(key, refresh, executor)
+            if value is not None:
+                return value
+            return refresh()
+
+    def _run_refresh(self, key, refresh):
+        try:
+            refresh()
+        except Exception as e:
+            print(f"Background refresh failed for {key}: {e}")
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def pop(self, key, default=None):
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        return default if entry is None else entry[0]
+
+
+class TieredCache:
+    """
+    In-process TTLCache (L1) in front of a tier shared by all workers (L2):
+    Redis when configured, otherwise JSON files under `cache_dir` for workers
+    on the same host. Misses are single-flighted across workers with a lock in
+    the shared tier so only one of them calls the loader; with neither tier
+    this is a plain TTLCache.
+    """
+
+    LOCK_TTL = 10
+    LOCK_WAIT = 2.0
+    LOCK_POLL = 0.1
+
+    def __init__(self, namespace, maxsize, ttl, redis_client=None, cache_dir=None):
+        self.namespace = namespace
+        self.ttl = ttl
+        self.l1 = TTLCache(maxsize=maxsize, ttl=ttl)
+        self.redis = redis_client
+        self.cache_dir = None
+        if redis_client is None and cache_dir:
+            try:
+                self.cache_dir = Path(cache_dir) / namespace
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+            except Exception as e:
+                print(f"Shared file cache disabled for {namespace}: {e}")
+                self.cache_dir = None
+
+    @property
+    def shared(self):
+        return self.redis is not None or self.cache_dir is not None
+
+    def _l2_key(self, key):
+        return f"tennis:{self.namespace}:{key}"
+
+    def _l2_path(self, key, suffix='.json'):
+        return self.cache_dir / f"{urllib.parse.quote(str(key), safe='')}{suffix}"
+
+    def _l2_get(self, key):
+        if self.redis is None:
+            return self._file_get(key)
+        try:
+            raw = self.redis.get(self._l2_key(key))
+        except Exception as e:
+            print(f"Shared cache read failed for {key}: {e}")
+            return None
+        return json_loads(raw) if raw else None
+
+    def _l2_set(self, key, value):
+        if self.redis is None:
+            self._file_set(key, value)
+            return
+        try:
+            self.redis.setex(self._l2_key(key), self.ttl, json_dumps(value))
+        except Exception as e:
+            print(f"Shared cache write failed for {key}: {e}")
+
+    def _file_get(self, key):
+        try:
+            entry = json_loads(self._l2_path(key).read_bytes())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Shared cache read failed for {key}: {e}")
+            return None
+        if not isinstance(entry, dict) or entry.get('expires_at', 0) <= time.time():
+            return None
+        return entry.get('value')
+
+    def _file_set(self, key, value):
+        path = self._l2_path(key)
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            tmp_path.write_text(
+                json_dumps({'expires_at': time.time() + self.ttl, 'value': value}),
+                encoding='utf-8'
+            )
+            tmp_path.replace(path)
+        except Exception as e:
+            print(f"Shared cache write failed for {key}: {e}")
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def _acquire_lock(self, key):
+        if self.redis is not None:
+            try:
+                return bool(self.redis.set(f"{self._l2_key(key)}:lock", 1, nx=True, ex=self.LOCK_TTL))
+            except Exception:
+                return True
+        lock_path = self._l2_path(key, '.lock')
+        for _ in range(2):
+            try:
+                os.close(os.open(lock_path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+                return True
+            except FileExistsError:
+                # A crashed loader leaves its lock behind; treat it as expired after LOCK_TTL
+                try:
+                    if time.time() - lock_path.stat().st_mtime < self.LOCK_TTL:
+                        return False
+                    lock_path.unlink()
+                except FileNotFoundError:
+                    continue
+                except OSError:
+                    return True
+            except OSError:
+                return True
+        return False
+
+    def _release_lock(self, key):
+        try:
+            if self.redis is not None:
+                self.redis.delete(f"{self._l2_key(key)}:lock")
+            else:
+                self._l2_path(key, '.lock').unlink()
+        except Exception:
+            pass
+
+    def get(self, key, default=None):
+        if key in self.l1:
+            return self.l1[key]
+        if self.shared:
+            value = self._l2_get(key)
+            if value is not None:
+                self.l1[key] = value
+                return value
+        return default
+
+    def set(self, key, value):
+        self.l1[key] = value
+        if self.shared:
+            self._l2_set(key, value)
+
+    def get_or_load(self, key, loader):
+        value = self.get(key)
+        if value is not None:
+            return value
+        if not self.shared:
+            value = loader()
+            self.set(key, value)
+            return value
+
+        have_lock = self._acquire_lock(key)
+        if not have_lock:
+            # Another worker is loading; wait briefly for its result before loading anyway
+            deadline = time.monotonic() + self.LOCK_WAIT
+            while time.monotonic() < deadline:
+                time.sleep(self.LOCK_POLL)
+                value = self._l2_get(key)
+                if value is not None:
+                    self.l1[key] = value
+                    return value
+        try:
+            value = loader()
+            self.set(key, value)
+            return value
+        finally:
+            if have_lock:
+                self._release_lock(key)
+
+    def clear_prefix(self, prefix):
+        for key in list(self.l1.keys()):
+            if str(key).startswith(prefix):
+                self.l1.pop(key, None)
+        if self.redis is not None:
+            try:
+                stale = list(self.redis.scan_iter(match=f"{self._l2_key(prefix)}*"))
+                if stale:
+                    self.redis.delete(*stale)
+            except Exception as e:
+                print(f"Shared cache invalidation failed for {prefix}: {e}")
+        elif self.cache_dir is not None:
+            quoted = urllib.parse.quote(str(prefix), safe='')
+            try:
+                for path in self.cache_dir.glob(f"{glob.escape(quoted)}*.json"):
+                    path.unlink(missing_ok=True)
+            except Exception as e:
+                print(f"Shared cache invalidation failed for {prefix}: {e}")
+
+
+def _create_shared_cache_client():
+    if not (HAS_REDIS and Config.REDIS_URL):
+        return None
+    try:
+        return redis.Redis.from_url(Config.REDIS_URL, socket_timeout=0.5, socket_connect_timeout=0.5)
+    except Exception as e:
+        print(f"Shared cache disabled, could not configure Redis: {e}")
+        return None
+
+
+shared_cache_client = _create_shared_cache_client()
+
 # Caches for different data types
-live_scores_cache = TTLCache(maxsize=100, ttl=Config.CACHE_LIVE_SCORES)
-rankings_cache = TTLCache(maxsize=10, ttl=Config.CACHE_RANKINGS)
-tournaments_cache = TTLCache(maxsize=10, ttl=Config.CACHE_TOURNAMENTS)
+# Live scores: per-entry TTL adapts to how recently a live score changed (see
+# TennisDataFetcher._live_scores_ttl); stale values are served while refreshing
+live_scores_cache = StaleWhileRevalidateCache(
+    ttl=Config.CACHE_LIVE_SCORES,
+    max_stale=LIVE_SCORES_MAX_STALE,
+    refresh_ahead=LIVE_SCORES_REFRESH_AHEAD
+)
+# WTA recent/upcoming feeds: served for up to half a TTL past expiry while a
+# background refresh reruns the scraper
+wta_matches_cache = StaleWhileRevalidateCache(
+    ttl=Config.CACHE_LIVE_SCORES,
+    max_stale=Config.CACHE_LIVE_SCORES / 2
+)
+rankings_cache = TieredCache('rankings', maxsize=10, ttl=Config.CACHE_RANKINGS, redis_client=shared_cache_client, cache_dir=Config.CACHE_DIR)
+tournaments_cache = TieredCache('tournaments', maxsize=10, ttl=Config.CACHE_TOURNAMENTS, redis_client=shared_cache_client, cache_dir=Config.CACHE_DIR)
 h2h_summary_cache = TTLCache(maxsize=1000, ttl=60 * 60 * 6)
 atp_h2h_summary_cache = TTLCache(maxsize=1000, ttl=60 * 60 * 6)
 wta_match_stats_cache = TTLCache(maxsize=2000, ttl=30)
@@ -126,6 +453,29 @@ WTA_TENNIS_API_BASE = 'https://api.wtatennis.com/tennis'
 WTA_SEARCH_API_BASE = 'https://api.wtatennis.com/search/v2/wta/'
 ATP_H2H_BASE = 'https://www.atptour.com/en/players/atp-head-2-head'
 RJINA_HTTP_PREFIX = 'https://r.jina.ai/http://'
+SOFASCORE_PLAYER_IMAGE_URL = 'https://api.sofascore.com/api/v1/player/{}/image'
+
+# Outbound request throttling: overall concurrency cap, minimum spacing between
+# requests to the same host (seconds), connection pooling and the retry policy
+# for throttled/unavailable upstreams
+UPSTREAM_MAX_CONCURRENCY = 16
+UPSTREAM_POOL_CONNECTIONS = 32
+UPSTREAM_POOL_MAXSIZE = UPSTREAM_MAX_CONCURRENCY
+UPSTREAM_HOST_MIN_INTERVAL = {
+    'r.jina.ai': 0.25,
+    'api.wtatennis.com': 0.1,
+    'duckduckgo.com': 1.0,
+}
+UPSTREAM_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+UPSTREAM_MAX_RETRIES = 2
+UPSTREAM_RETRY_BACKOFF = 0.3
+
+# Pickled scraped-player index kept beside the per-player folders; bump the
+# version whenever the index layout changes
+SCRAPED_INDEX_CACHE_FILE = '.index_cache.pkl'
+SCRAPED_INDEX_CACHE_VERSION = 1
+SCRAPED_INDEX_READ_WORKERS = 16
+TOURNAMENT_FILE_READ_WORKERS = 16
 
 WTA_SERVING_METRICS = [
     {'key': 'aces', 'label': 'Aces', 'value_path': 'Aces', 'min_path': 'MinAces', 'avg_path': 'AverageAces', 'max_path': 'MaxAces', 'lower_is_better': False, 'is_percent': False},
@@ -149,6 +499,888 @@ WTA_RETURNING_METRICS = [
 ]
 
 
+# Sample tournament calendars; dates are (month, day) and get the requested year
+SAMPLE_ATP_TOURNAMENTS = [
+    # Grand Slams
+    {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia',
+     'start_md': (1, 14), 'end_md': (1, 28), 'surface': 'Hard'},
+    {'name': 'Roland Garros', 'category': 'grand_slam', 'location': 'Paris, France',
+     'start_md': (5, 26), 'end_md': (6, 9), 'surface': 'Clay'},
+    {'name': 'Wimbledon', 'category': 'grand_slam', 'location': 'London, UK',
+     'start_md': (7, 1), 'end_md': (7, 14), 'surface': 'Grass'},
+    {'name': 'US Open', 'category': 'grand_slam', 'location': 'New York, USA',
+     'start_md': (8, 26), 'end_md': (9, 8), 'surface': 'Hard'},
+    # Masters 1000
+    {'name': 'Indian Wells Masters', 'category': 'masters_1000', 'location': 'Indian Wells, USA',
+     'start_md': (3, 6), 'end_md': (3, 17), 'surface': 'Hard'},
+    {'name': 'Miami Open', 'category': 'masters_1000', 'location': 'Miami, USA',
+     'start_md': (3, 20), 'end_md': (3, 31), 'surface': 'Hard'},
+    {'name': 'Monte-Carlo Masters', 'category': 'masters_1000', 'location': 'Monte Carlo, Monaco',
+     'start_md': (4, 7), 'end_md': (4, 14), 'surface': 'Clay'},
+    {'name': 'Madrid Open', 'category': 'masters_1000', 'location': 'Madrid, Spain',
+     'start_md': (4, 25), 'end_md': (5, 5), 'surface': 'Clay'},
+    {'name': 'Italian Open', 'category': 'masters_1000', 'location': 'Rome, Italy',
+     'start_md': (5, 8), 'end_md': (5, 19), 'surface': 'Clay'},
+    {'name': 'Canadian Open', 'category': 'masters_1000', 'location': 'Toronto/Montreal, Canada',
+     'start_md': (8, 5), 'end_md': (8, 11), 'surface': 'Hard'},
+    {'name': 'Cincinnati Masters', 'category': 'masters_1000', 'location': 'Cincinnati, USA',
+     'start_md': (8, 12), 'end_md': (8, 18), 'surface': 'Hard'},
+    {'name': 'Shanghai Masters', 'category': 'masters_1000', 'location': 'Shanghai, China',
+     'start_md': (10, 2), 'end_md': (10, 13), 'surface': 'Hard'},
+    {'name': 'Paris Masters', 'category': 'masters_1000', 'location': 'Paris, France',
+     'start_md': (10, 28), 'end_md': (11, 3), 'surface': 'Hard (Indoor)'},
+    # ATP 500
+    {'name': 'Rotterdam Open', 'category': 'atp_500', 'location': 'Rotterdam, Netherlands',
+     'start_md': (2, 5), 'end_md': (2, 11), 'surface': 'Hard (Indoor)'},
+    {'name': 'Dubai Tennis Championships', 'category': 'atp_500', 'location': 'Dubai, UAE',
+     'start_md': (2, 26), 'end_md': (3, 2), 'surface': 'Hard'},
+    {'name': 'Barcelona Open', 'category': 'atp_500', 'location': 'Barcelona, Spain',
+     'start_md': (4, 15), 'end_md': (4, 21), 'surface': 'Clay'},
+    {'name': "Queen's Club Championships", 'category': 'atp_500', 'location': 'London, UK',
+     'start_md': (6, 17), 'end_md': (6, 23), 'surface': 'Grass'},
+    {'name': 'Halle Open', 'category': 'atp_500', 'location': 'Halle, Germany',
+     'start_md': (6, 17), 'end_md': (6, 23), 'surface': 'Grass'},
+    {'name': 'Washington Open', 'category': 'atp_500', 'location': 'Washington D.C., USA',
+     'start_md': (7, 29), 'end_md': (8, 4), 'surface': 'Hard'},
+    {'name': 'Tokyo Open', 'category': 'atp_500', 'location': 'Tokyo, Japan',
+     'start_md': (9, 25), 'end_md': (10, 1), 'surface': 'Hard'},
+    {'name': 'Basel Open', 'category': 'atp_500', 'location': 'Basel, Switzerland',
+     'start_md': (10, 21), 'end_md': (10, 27), 'surface': 'Hard (Indoor)'},
+    {'name': 'Vienna Open', 'category': 'atp_500', 'location': 'Vienna, Austria',
+     'start_md': (10, 21), 'end_md': (10, 27), 'surface': 'Hard (Indoor)'},
+    # ATP 250
+    {'name': 'Brisbane International', 'category': 'atp_250', 'location': 'Brisbane, Australia',
+     'start_md': (1, 1), 'end_md': (1, 7), 'surface': 'Hard'},
+    {'name': 'Adelaide International', 'category': 'atp_250', 'location': 'Adelaide, Australia',
+     'start_md': (1, 8), 'end_md': (1, 13), 'surface': 'Hard'},
+    {'name': 'Montpellier Open', 'category': 'atp_250', 'location': 'Montpellier, France',
+     'start_md': (2, 5), 'end_md': (2, 11), 'surface': 'Hard (Indoor)'},
+    {'name': 'Dallas Open', 'category': 'atp_250', 'location': 'Dallas, USA',
+     'start_md': (2, 5), 'end_md': (2, 11), 'surface': 'Hard (Indoor)'},
+    {'name': 'Lyon Open', 'category': 'atp_250', 'location': 'Lyon, France',
+     'start_md': (5, 20), 'end_md': (5, 25), 'surface': 'Clay'},
+    {'name': 'Stuttgart Open', 'category': 'atp_250', 'location': 'Stuttgart, Germany',
+     'start_md': (6, 10), 'end_md': (6, 16), 'surface': 'Grass'},
+    {'name': 'Eastbourne International', 'category': 'atp_250', 'location': 'Eastbourne, UK',
+     'start_md': (6, 24), 'end_md': (6, 29), 'surface': 'Grass'},
+    {'name': 'Atlanta Open', 'category': 'atp_250', 'location': 'Atlanta, USA',
+     'start_md': (7, 22), 'end_md': (7, 28), 'surface': 'Hard'},
+    {'name': 'Winston-Salem Open', 'category': 'atp_250', 'location': 'Winston-Salem, USA',
+     'start_md': (8, 19), 'end_md': (8, 24), 'surface': 'Hard'},
+    {'name': 'Chengdu Open', 'category': 'atp_250', 'location': 'Chengdu, China',
+     'start_md': (9, 16), 'end_md': (9, 22), 'surface': 'Hard'},
+    {'name': 'Stockholm Open', 'category': 'atp_250', 'location': 'Stockholm, Sweden',
+     'start_md': (10, 14), 'end_md': (10, 20), 'surface': 'Hard (Indoor)'},
+    {'name': 'Antwerp Open', 'category': 'atp_250', 'location': 'Antwerp, Belgium',
+     'start_md': (10, 14), 'end_md': (10, 20), 'surface': 'Hard (Indoor)'},
+]
+
+SAMPLE_WTA_TOURNAMENTS = [
+    # Grand Slams
+    {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia',
+     'start_md': (1, 14), 'end_md': (1, 28), 'surface': 'Hard'},
+    {'name': 'Roland Garros', 'category': 'grand_slam', 'location': 'Paris, France',
+     'start_md': (5, 26), 'end_md': (6, 9), 'surface': 'Clay'},
+    {'name': 'Wimbledon', 'category': 'grand_slam', 'location': 'London, UK',
+     'start_md': (7, 1), 'end_md': (7, 14), 'surface': 'Grass'},
+    {'name': 'US Open', 'category': 'grand_slam', 'location': 'New York, USA',
+     'start_md': (8, 26), 'end_md': (9, 8), 'surface': 'Hard'},
+    # WTA 1000
+    {'name': 'Qatar Open', 'category': 'wta_1000', 'location': 'Doha, Qatar',
+     'start_md': (2, 10), 'end_md': (2, 17), 'surface': 'Hard'},
+    {'name': 'Dubai Championships', 'category': 'wta_1000', 'location': 'Dubai, UAE',
+     'start_md': (2, 19), 'end_md': (2, 25), 'surface': 'Hard'},
+    {'name': 'Indian Wells Open', 'category': 'wta_1000', 'location': 'Indian Wells, USA',
+     'start_md': (3, 6), 'end_md': (3, 17), 'surface': 'Hard'},
+    {'name': 'Miami Open', 'category': 'wta_1000', 'location': 'Miami, USA',
+     'start_md': (3, 20), 'end_md': (3, 31), 'surface': 'Hard'},
+    {'name': 'Madrid Open', 'category': 'wta_1000', 'location': 'Madrid, Spain',
+     'start_md': (4, 25), 'end_md': (5, 5), 'surface': 'Clay'},
+    {'name': 'Italian Open', 'category': 'wta_1000', 'location': 'Rome, Italy',
+     'start_md': (5, 8), 'end_md': (5, 19), 'surface': 'Clay'},
+    {'name': 'Canadian Open', 'category': 'wta_1000', 'location': 'Toronto/Montreal, Canada',
+     'start_md': (8, 5), 'end_md': (8, 11), 'surface': 'Hard'},
+    {'name': 'Cincinnati Open', 'category': 'wta_1000', 'location': 'Cincinnati, USA',
+     'start_md': (8, 12), 'end_md': (8, 18), 'surface': 'Hard'},
+    {'name': 'Wuhan Open', 'category': 'wta_1000', 'location': 'Wuhan, China',
+     'start_md': (9, 21), 'end_md': (9, 29), 'surface': 'Hard'},
+    {'name': 'Beijing Open', 'category': 'wta_1000', 'location': 'Beijing, China',
+     'start_md': (10, 1), 'end_md': (10, 8), 'surface': 'Hard'},
+    # WTA 500
+    {'name': 'Adelaide International', 'category': 'wta_500', 'location': 'Adelaide, Australia',
+     'start_md': (1, 8), 'end_md': (1, 13), 'surface': 'Hard'},
+    {'name': 'Stuttgart Open', 'category': 'wta_500', 'location': 'Stuttgart, Germany',
+     'start_md': (4, 15), 'end_md': (4, 21), 'surface': 'Clay'},
+    {'name': 'Berlin Open', 'category': 'wta_500', 'location': 'Berlin, Germany',
+     'start_md': (6, 17), 'end_md': (6, 23), 'surface': 'Grass'},
+    {'name': 'Eastbourne International', 'category': 'wta_500', 'location': 'Eastbourne, UK',
+     'start_md': (6, 24), 'end_md': (6, 29), 'surface': 'Grass'},
+    {'name': 'San Diego Open', 'category': 'wta_500', 'location': 'San Diego, USA',
+     'start_md': (9, 9), 'end_md': (9, 15), 'surface': 'Hard'},
+    # WTA 250
+    {'name': 'Hobart International', 'category': 'wta_250', 'location': 'Hobart, Australia',
+     'start_md': (1, 8), 'end_md': (1, 13), 'surface': 'Hard'},
+    {'name': 'Auckland Open', 'category': 'wta_250', 'location': 'Auckland, New Zealand',
+     'start_md': (1, 1), 'end_md': (1, 7), 'surface': 'Hard'},
+    {'name': 'Linz Open', 'category': 'wta_250', 'location': 'Linz, Austria',
+     'start_md': (1, 27), 'end_md': (2, 2), 'surface': 'Hard (Indoor)'},
+    {'name': 'Charleston Open', 'category': 'wta_250', 'location': 'Charleston, USA',
+     'start_md': (4, 1), 'end_md': (4, 7), 'surface': 'Clay'},
+    {'name': 'Seoul Open', 'category': 'wta_250', 'location': 'Seoul, South Korea',
+     'start_md': (9, 16), 'end_md': (9, 22), 'surface': 'Hard'},
+]
+
+
+def _freeze_tournament_templates(templates):
+    """
+    Number templates in authored order (the sample tournament ids), then sort
+    them by start date once so generated calendars need no per-call sort.
+    Templates are shared by every call, so they are frozen against mutation.
+    """
+    numbered = [{**t, 'id': i} for i, t in enumerate(templates, 1)]
+    numbered.sort(key=lambda t: t['start_md'])
+    return tuple(MappingProxyType(t) for t in numbered)
+
+
+SAMPLE_ATP_TOURNAMENTS = _freeze_tournament_templates(SAMPLE_ATP_TOURNAMENTS)
+SAMPLE_WTA_TOURNAMENTS = _freeze_tournament_templates(SAMPLE_WTA_TOURNAMENTS)
+
+# Sample tournament status, indexed by (today > end) - (today < start) + 1
+SAMPLE_TOURNAMENT_STATUSES = ('upcoming', 'in_progress', 'finished')
+# Sample calendars kept per (tour, year); years come from the query string
+SAMPLE_TOURNAMENTS_MEMO_SIZE = 8
+
+
+@functools.lru_cache(maxsize=8)
+def _sample_calendar_dates(tour, year):
+    """(start_ordinal, end_ordinal, start_iso, end_iso) for each sample template in a year"""
+    templates = SAMPLE_ATP_TOURNAMENTS if tour == 'atp' else SAMPLE_WTA_TOURNAMENTS
+    dates = []
+    for t in templates:
+        start_date = date(year, *t['start_md'])
+        end_date = date(year, *t['end_md'])
+        dates.append((start_date.toordinal(), end_date.toordinal(), start_date.isoformat(), end_date.isoformat()))
+    return tuple(dates)
+
+
+SAMPLE_MATCH_ROUNDS = ('R32', 'R16', 'QF', 'SF', 'F')
+
+# Sample bracket draw size by category (32 otherwise), and each draw's rounds
+# as (round name, match count, first match id)
+SAMPLE_DRAW_SIZES = {'grand_slam': 128, 'masters_1000': 64, 'finals': 8}
+_BRACKET_ROUND_NAMES = ('R128', 'R64', 'R32', 'R16', 'QF', 'SF', 'F')
+
+
+def _bracket_structure(draw_size):
+    round_names = _BRACKET_ROUND_NAMES[-(draw_size.bit_length() - 1):]
+    structure = []
+    first_id = 1
+    for r, round_name in enumerate(round_names):
+        count = draw_size >> (r + 1)
+        structure.append((round_name, count, first_id))
+        first_id += count
+    return tuple(structure)
+
+
+_BRACKET_STRUCTURE = {draw_size: _bracket_structure(draw_size) for draw_size in (128, 64, 32, 8)}
+SAMPLE_LIVE_ROUNDS = ('R16', 'QF', 'SF', 'F')
+
+# Tournament pools used by the sample live/recent/upcoming match generators.
+# Treated as read-only; matches copy the fields they need.
+SAMPLE_ATP_LIVE_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia'},
+    {'name': 'Indian Wells Masters', 'category': 'masters_1000', 'location': 'Indian Wells, USA'},
+    {'name': 'Dubai Tennis Championships', 'category': 'atp_500', 'location': 'Dubai, UAE'},
+)
+SAMPLE_WTA_LIVE_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia'},
+    {'name': 'Qatar Open', 'category': 'wta_1000', 'location': 'Doha, Qatar'},
+    {'name': 'Dubai Championships', 'category': 'wta_1000', 'location': 'Dubai, UAE'},
+)
+SAMPLE_ATP_RECENT_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam'},
+    {'name': 'Rotterdam Open', 'category': 'atp_500'},
+    {'name': 'Qatar Open', 'category': 'atp_250'},
+)
+SAMPLE_WTA_RECENT_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam'},
+    {'name': 'Qatar Open', 'category': 'wta_1000'},
+    {'name': 'Doha Open', 'category': 'wta_500'},
+)
+SAMPLE_ATP_UPCOMING_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam'},
+    {'name': 'Rotterdam Open', 'category': 'atp_500'},
+    {'name': 'Dubai Championships', 'category': 'atp_500'},
+    {'name': 'Qatar Open', 'category': 'atp_250'},
+)
+SAMPLE_WTA_UPCOMING_TOURNAMENTS = (
+    {'name': 'Australian Open', 'category': 'grand_slam'},
+    {'name': 'Qatar Open', 'category': 'wta_1000'},
+    {'name': 'Dubai Championships', 'category': 'wta_1000'},
+    {'name': 'Abu Dhabi Open', 'category': 'wta_500'},
+)
+
+# Tiebreak points for 7-6/6-7 sets, keyed by ((p1, p2), is_decider).
+# Fixed winner points are ints; the loser's points are drawn from a tuple.
+_TIEBREAK = {
+    ((7, 6), False): (7, (4, 5, 6)),
+    ((7, 6), True): (10, (8, 9)),
+    ((6, 7), False): ((4, 5, 6), 7),
+    ((6, 7), True): ((8, 9), 10),
+}
+
+_BEST_OF = {('ATP', 'grand_slam'): 5}
+
+# Completed set scores for sample matches. Each player wins half the sets;
+# 70% of wins are 6-0..6-4 (14 each) and 30% are 7-5/7-6 (15 each).
+_SET_OUTCOMES = (
+    tuple((6, lost) for lost in range(5)) + ((7, 5), (7, 6))
+    + tuple((lost, 6) for lost in range(5)) + ((5, 7), (6, 7))
+)
+_SET_OUTCOME_CUM_WEIGHTS = tuple(itertools.accumulate((14,) * 5 + (15, 15) + (14,) * 5 + (15, 15)))
+
+
+@dataclass(frozen=True, slots=True)
+class SamplePlayer:
+    """Static sample player record; converted to a fresh dict per request."""
+    id: int
+    name: str
+    country: str
+    rank: int
+    player_code: str
+
+    def as_dict(self):
+        return {
+            'id': self.id,
+            'name': self.name,
+            'country': self.country,
+            'rank': self.rank,
+            'player_code': self.player_code,
+            'image_url': sofascore_image_url(self.id),
+        }
+
+
+SAMPLE_ATP_PLAYERS = (
+    SamplePlayer(4878, 'Novak Djokovic', 'SRB', 1, 'D643'),
+    SamplePlayer(216431, 'Carlos Alcaraz', 'ESP', 2, 'A0E2'),
+    SamplePlayer(139170, 'Jannik Sinner', 'ITA', 3, 'S0AG'),
+    SamplePlayer(38758, 'Daniil Medvedev', 'RUS', 4, 'MM58'),
+    SamplePlayer(39667, 'Andrey Rublev', 'RUS', 5, 'RE44'),
+    SamplePlayer(40285, 'Alexander Zverev', 'GER', 6, 'Z355'),
+    SamplePlayer(124335, 'Holger Rune', 'DEN', 7, 'R0DG'),
+    SamplePlayer(41379, 'Stefanos Tsitsipas', 'GRE', 8, 'TE51'),
+    SamplePlayer(59642, 'Hubert Hurkacz', 'POL', 9, 'HB71'),
+    SamplePlayer(63343, 'Casper Ruud', 'NOR', 10, 'RH16'),
+)
+
+
+def json_loads(data):
+    """Parse JSON text or bytes, using orjson when it is installed."""
+    if HAS_ORJSON:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def json_dumps(obj, indent=False):
+    """Serialize to a JSON string, using orjson when it is installed. Non-ASCII text is kept as-is."""
+    if HAS_ORJSON:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2 if indent else None)
+
+
+# Name and numeric clean-up patterns, compiled once
+NON_ALPHA_RE = re.compile(r"[^A-Za-z\s]")
+WHITESPACE_RE = re.compile(r"\s+")
+PRESENTED_BY_RE = re.compile(r"\s+(presented|powered)\s+by\s+.*$", re.IGNORECASE)
+NON_DIGIT_RE = re.compile(r'\D+')
+NON_SIGNED_DIGIT_RE = re.compile(r'[^-\d]+')
+SIGNED_INT_RE = re.compile(r'^[+-]\d+$')
+
+
+# WTA feed score fields per set: (games A, games B, loser's tiebreak points)
+_WTA_SET_KEYS = tuple(
+    (f'ScoreSet{idx}A', f'ScoreSet{idx}B', f'ScoreTbSet{idx}')
+    for idx in range(1, 6)
+)
+
+# str.translate table dropping every ASCII character except 0-9
+_ASCII_NON_DIGIT_DELETE = str.maketrans('', '', ''.join(chr(c) for c in range(128) if not '0' <= chr(c) <= '9'))
+
+# Round for a WTA match number, indexed by its bit length (1=F, 2-3=SF, 4-7=QF, ...)
+_MATCH_NUMBER_ROUNDS = ('', 'F', 'SF', 'QF', 'R16', 'R32', 'R64', 'R128')
+
+# Raw tournament status strings and WTA match_state codes used by the file loaders
+_FINISHED_TOURNAMENT_STATES = frozenset({'past', 'completed', 'complete', 'finished'})
+_IN_PROGRESS_TOURNAMENT_STATES = frozenset({'current', 'in_progress', 'in progress', 'live', 'running'})
+_LIVE_MATCH_STATES = frozenset({'L', 'IP', 'P'})
+
+# Prize-breakdown place names -> round key. One regex scan collects every token,
+# and the lowest priority wins, so "Semi-final"/"Quarterfinal" are not read as F
+_ROUND_KEY_RE = re.compile(r'winner|semi|quarter|final|round of (?:128|64|32|16)')
+_ROUND_KEY_BY_TOKEN = {
+    'winner': (0, 'W'),
+    'semi': (1, 'SF'),
+    'quarter': (2, 'QF'),
+    'final': (3, 'F'),
+    'round of 16': (4, 'R16'),
+    'round of 32': (5, 'R32'),
+    'round of 64': (6, 'R64'),
+    'round of 128': (7, 'R128'),
+}
+
+# Tournament name patterns for category detection, lowercased and compiled once
+GRAND_SLAM_NAMES = frozenset(Config.GRAND_SLAMS)
+GRAND_SLAM_NAMES_UPPER = tuple(name.upper() for name in Config.GRAND_SLAMS)
+GRAND_SLAM_NAME_RE = re.compile('|'.join(re.escape(name.lower()) for name in Config.GRAND_SLAMS))
+MASTERS_1000_NAME_RE = re.compile('|'.join(re.escape(name.lower()) for name in Config.MASTERS_1000))
+
+
+@functools.lru_cache(maxsize=4096)
+def sofascore_image_url(player_id):
+    """Sofascore headshot URL for a player id; one shared string per id."""
+    return SOFASCORE_PLAYER_IMAGE_URL.format(player_id)
+
+
+@functools.lru_cache(maxsize=4096)
+def normalize_player_name(name):
+    """ASCII-folded, lowercased player name with punctuation collapsed to single spaces"""
+    cleaned = unicodedata.normalize("NFKD", name)
+    cleaned = cleaned.encode("ascii", "ignore").decode("ascii")
+    cleaned = NON_ALPHA_RE.sub(" ", cleaned)
+    return WHITESPACE_RE.sub(" ", cleaned).strip().lower()
+
+
+def names_by_length(names):
+    """Group names into tuples keyed by string length, for closest_name"""
+    buckets = {}
+    for name in names:
+        buckets.setdefault(len(name), []).append(name)
+    return {length: tuple(group) for length, group in buckets.items()}
+
+
+def closest_name(norm, choices_by_length, cutoff=0.82):
+    """Closest normalized name scoring at least cutoff, or None.
+
+    Both scorers are bounded by 2 * min(len) / (len_a + len_b), so only the
+    length buckets that could still reach the cutoff are compared.
+    Uses RapidFuzz's fuzz.ratio when it is installed, otherwise difflib. The two
+    are not interchangeable: RapidFuzz scores the normalized Indel (LCS)
+    similarity while difflib uses Ratcliff-Obershelp matching blocks, and
+    RapidFuzz keeps the first best choice where difflib keeps the greatest
+    (score, name). Names scoring near the cutoff, and ties, can therefore
+    resolve differently depending on which backend is installed.
+    """
+    if not norm or not choices_by_length:
+        return None
+    size = len(norm)
+    shortest = int(size * cutoff / (2 - cutoff))
+    longest = int(size * (2 - cutoff) / cutoff) + 1
+    choices = [
+        name
+        for length in range(shortest, longest + 1)
+        for name in choices_by_length.get(length, ())
+    ]
+    if not choices:
+        return None
+    if HAS_RAPIDFUZZ:
+        match = fuzz_process.extractOne(
+            norm, choices, scorer=fuzz.ratio, processor=None, score_cutoff=cutoff * 100
+        )
+        return match[0] if match else None
+    # Same scoring and tie-break as difflib.get_close_matches(n=1), but each
+    # candidate only has to beat the best score seen so far, so the cheap upper
+    # bounds reject most of them before the full ratio runs
+    matcher = difflib.SequenceMatcher()
+    matcher.set_seq2(norm)
+    best_score, best_name = cutoff, None
+    for name in choices:
+        matcher.set_seq1(name)
+        if (
+            matcher.real_quick_ratio() >= best_score
+            and matcher.quick_ratio() >= best_score
+        ):
+            score = matcher.ratio()
+            if score >= best_score and (best_name is None or (score, name) > (best_score, best_name)):
+                best_score, best_name = score, name
+    return best_name
+
+
+@functools.lru_cache(maxsize=2048)
+def format_wta_match_time(value):
+    """WTA ISO timestamp as a local 'Mon DD HH:MM AM' label; None when unparseable"""
+    try:
+        dt = datetime.fromisoformat(value.replace('Z', '+00:00'))
+        return dt.astimezone().strftime('%b %d %I:%M %p').lstrip('0')
+    except Exception:
+        return None
+
+
+def _digit_run_end(text, start):
+    end = start
+    size = len(text)
+    while end < size and text[end].isdecimal():
+        end += 1
+    return end
+
+
+def scan_set_scores(text):
+    """
+    (games_a, games_b, tiebreak) digit strings for each set in a draw score
+    string such as "6-4 7-6(5)", "64, 76(5)" or "6-4 ret.". Compact two-digit
+    sets ("64", "76(5)") are read as one digit per side; tiebreak is '' when absent.
+    Scans characters directly instead of running regexes over every token.
+    """
+    sets = []
+    for part in text.replace(",", " ").split():
+        size = len(part)
+        # Compact form: exactly two digits, optionally followed by "(<digits>)"
+        if size >= 2 and part[0].isdecimal() and part[1].isdecimal():
+            if size == 2:
+                sets.append((part[0], part[1], ''))
+                continue
+            if part[2] == '(' and part[-1] == ')' and size > 4 and part[3:-1].isdecimal():
+                sets.append((part[0], part[1], part[3:-1]))
+                continue
+        # "<digits>-<digits>" optionally followed by "(<digits>)", anywhere in the token
+        pos = 0
+        while pos < size:
+            if not part[pos].isdecimal():
+                pos += 1
+                continue
+            a_end = _digit_run_end(part, pos)
+            if a_end + 1 < size and part[a_end] == '-' and part[a_end + 1].isdecimal():
+                b_end = _digit_run_end(part, a_end + 1)
+                tb = ''
+                end = b_end
+                if b_end + 1 < size and part[b_end] == '(' and part[b_end + 1].isdecimal():
+                    tb_end = _digit_run_end(part, b_end + 1)
+                    if tb_end < size and part[tb_end] == ')':
+                        tb = part[b_end + 1:tb_end]
+                        end = tb_end + 1
+                sets.append((part[pos:a_end], part[a_end + 1:b_end], tb))
+                pos = end
+            else:
+                pos = a_end + 1
+    return sets
+
+
+# Stateless helpers for _build_wta_bracket_from_files, kept at module scope so
+# they are not rebuilt on every draw.
+def _wta_draw_round_labels(size):
+    if size >= 128:
+        return ['R128', 'R64', 'R32', 'R16']
+    if size >= 64:
+        return ['R64', 'R32', 'R16']
+    if size >= 48:
+        return ['R64', 'R32', 'R16']
+    if size >= 32:
+        return ['R32', 'R16']
+    if size >= 16:
+        return ['R16']
+    return []
+
+
+def _short_player_name(name):
+    if not name:
+        return ''
+    parts = name.strip().split()
+    if len(parts) >= 2:
+        return f"{parts[0][0]}. {parts[-1]}"
+    return name
+
+
+def _winner_tiebreak(loser_tb):
+    try:
+        loser_val = int(loser_tb)
+    except Exception:
+        return None
+    return max(7, loser_val + 2)
+
+
+def _parse_draw_sets(score_string):
+    if score_string is None or score_string == '':
+        return []
+    sets = []
+    for a, b, tb in scan_set_scores(str(score_string)):
+        entry = {'p1': int(a), 'p2': int(b)}
+        if tb:
+            winner_tb = _winner_tiebreak(tb)
+            if winner_tb is not None:
+                if int(a) > int(b):
+                    entry['tiebreak'] = {'p1': winner_tb, 'p2': int(tb)}
+                else:
+                    entry['tiebreak'] = {'p1': int(tb), 'p2': winner_tb}
+        sets.append(entry)
+    return sets
+
+
+def _count_sets(sets):
+    """Return (p1_sets, p2_sets) won for a list of {'p1', 'p2'} set dicts."""
+    p1_sets = p2_sets = 0
+    for s in sets:
+        a = s['p1']
+        b = s['p2']
+        if a > b:
+            p1_sets += 1
+        elif b > a:
+            p2_sets += 1
+    return p1_sets, p2_sets
+
+
+def _align_sets_to_side(sets, winner_side):
+    if not sets or winner_side not in ('A', 'B'):
+        return sets
+    p1_sets, p2_sets = _count_sets(sets)
+    winner = 'A' if p1_sets > p2_sets else 'B' if p2_sets > p1_sets else None
+    if winner and winner != winner_side:
+        swapped = []
+        for s in sets:
+            entry = {'p1': s['p2'], 'p2': s['p1']}
+            if s.get('tiebreak'):
+                entry['tiebreak'] = {
+                    'p1': s['tiebreak'].get('p2'),
+                    'p2': s['tiebreak'].get('p1')
+                }
+            swapped.append(entry)
+        return swapped
+    return sets
+
+
+def _draw_round_maps(breakdown):
+    points_map = {}
+    prize_map = {}
+    for place in breakdown or []:
+        name = (place.get('name') or '').lower()
+        points = place.get('points')
+        prize = place.get('prize')
+        hits = _ROUND_KEY_RE.findall(name)
+        round_key = min(_ROUND_KEY_BY_TOKEN[hit] for hit in hits)[1] if hits else None
+
+        if round_key:
+            if points is not None:
+                points_map[round_key] = points
+            if prize:
+                prize_map[round_key] = prize
+    return points_map, prize_map
+
+
+def _round_id_sort_key(val):
+    try:
+        return int(val)
+    except Exception:
+        return 0
+
+
+def _draw_match_sort_key(item):
+    # Last digit run of the match id ("LS012" -> 12), found by scanning back from the end
+    match_id = (item.get('id') if isinstance(item, dict) else '') or ''
+    end = len(match_id)
+    while end and not match_id[end - 1].isdecimal():
+        end -= 1
+    start = end
+    while start and match_id[start - 1].isdecimal():
+        start -= 1
+    return int(match_id[start:end]) if end else 0
+
+
+def _match_id_sort_key(match):
+    return match.get('match_id') or ''
+
+
+def _draw_slot_player(slot):
+    p = slot.get('player') if isinstance(slot, dict) else None
+    if not isinstance(p, dict):
+        return None
+    return {
+        'id': p.get('id') or None,
+        'name': " ".join([p.get('first_name') or '', p.get('last_name') or '']).strip() or slot.get('display') or 'TBD',
+        'country': p.get('country') or None
+    }
+
+
+def _normalize_bye(player):
+    if not player:
+        return player
+    name = (player.get('name') or '').lower()
+    if 'bye' in name:
+        player['name'] = 'Bye'
+    return player
+
+
+def _bye_player_details(player):
+    # Byes carry no ranking, seed or profile, so they skip the scraped-player lookup
+    return {
+        'id': player.get('id'),
+        'name': 'Bye',
+        'display_name': 'Bye',
+        'country': player.get('country'),
+        'seed': None,
+        'rank': None,
+        'image_url': None
+    }
+
+
+def _decide_winner_slot(match_obj, sets):
+    slot = match_obj.get('winner_slot')
+    if slot in ('A', 'B'):
+        return slot
+    if not sets:
+        return None
+    p1_sets, p2_sets = _count_sets(sets)
+    if p1_sets > p2_sets:
+        return 'A'
+    if p2_sets > p1_sets:
+        return 'B'
+    return None
+
+
+@functools.lru_cache(maxsize=256)
+def _wta_level_category(level):
+    # Tournament levels are a handful of repeated strings, so each is upper-cased once
+    upper = level.upper() if level else ''
+    if "GRAND SLAM" in upper:
+        return 'grand_slam'
+    if "1000" in upper:
+        return 'wta_1000'
+    if "500" in upper:
+        return 'wta_500'
+    if "250" in upper:
+        return 'wta_250'
+    if "125" in upper:
+        return 'wta_125'
+    if "FINALS" in upper:
+        return 'wta_finals'
+    return 'other'
+
+
+@functools.lru_cache(maxsize=1024)
+def _wta_file_tournament_category(level, name):
+    upper = level.upper() if level else ''
+    if "GRAND SLAM" in upper or name in GRAND_SLAM_NAMES:
+        return 'grand_slam'
+    if "1000" in upper:
+        return 'wta_1000'
+    if "500" in upper:
+        return 'wta_500'
+    if "250" in upper:
+        return 'wta_250'
+    if "125" in upper:
+        return 'wta_125'
+    # "FINAL" already covers "FINALS"; the name is only upper-cased when the level misses
+    if "FINAL" in upper or (name and "WTA FINALS" in name.upper()):
+        return 'wta_finals'
+    return 'other'
+
+
+@functools.lru_cache(maxsize=4096)
+def _parse_ymd(value):
+    """Parse a YYYY-MM-DD date, returning None when it is missing or malformed.
+
+    Tournament start/end dates repeat across files and draw builds, and date
+    objects are immutable, so results are memoized per string.
+    """
+    try:
+        if len(value) == 10:
+            # Zero-padded ISO dates take the C fast path
+            return date.fromisoformat(value)
+        return datetime.strptime(value, "%Y-%m-%d").date()
+    except Exception:
+        return None
+
+
+@functools.lru_cache(maxsize=512)
+def _tournament_category_for_name(tournament_name):
+    name_lower = tournament_name.lower()
+    if GRAND_SLAM_NAME_RE.search(name_lower):
+        return 'grand_slam'
+    if MASTERS_1000_NAME_RE.search(name_lower) or '1000' in name_lower:
+        return 'masters_1000'
+
+    # Check for category in name
+    if '500' in name_lower:
+        return 'atp_500'
+    if '250' in name_lower:
+        return 'atp_250'
+    if '125' in name_lower:
+        return 'atp_125'
+
+    return 'other'
+
+
+# Fallback sample WTA top 10 (no player codes), image URLs baked in at import
+SAMPLE_WTA_PLAYERS = tuple(
+    {'id': player_id, 'name': name, 'country': country, 'rank': rank, 'image_url': sofascore_image_url(player_id)}
+    for player_id, name, country, rank in (
+        (126388, 'Iga Swiatek', 'POL', 1),
+        (83528, 'Aryna Sabalenka', 'BLR', 2),
+        (198151, 'Coco Gauff', 'USA', 3),
+        (98622, 'Elena Rybakina', 'KAZ', 4),
+        (56223, 'Jessica Pegula', 'USA', 5),
+        (47320, 'Ons Jabeur', 'TUN', 6),
+        (97090, 'Marketa Vondrousova', 'CZE', 7),
+        (137839, 'Qinwen Zheng', 'CHN', 8),
+        (42043, 'Maria Sakkari', 'GRE', 9),
+        (33634, 'Jelena Ostapenko', 'LAT', 10),
+    )
+)
+
+
+SAMPLE_TOP_RANKING_MOVEMENTS = (-2, -1, 0, 0, 0, 1, 1, 2)
+SAMPLE_RANKING_MOVEMENTS = (-3, -2, -1, 0, 0, 1, 2, 3)
+
+
+def _build_sample_ranking_top(top_players):
+    """
+    Sample top-20 ranking rows, built once at import.
+    'movement' is a placeholder that callers redraw on every request.
+    """
+    return tuple(
+        {
+            'rank': i,
+            'id': player_id,
+            'name': name,
+            'country': country,
+            'age': age,
+            'points': points,
+            'career_high': career_high,
+            'is_career_high': is_career_high,
+            'movement': 0,
+            'image_url': sofascore_image_url(player_id)
+        }
+        for i, (player_id, name, country, age, points, career_high, is_career_high) in enumerate(top_players, 1)
+    )
+
+
+SAMPLE_ATP_RANKING_TOP = _build_sample_ranking_top((
+    # id, name, country, age, points, career_high, is_career_high
+    (4878, 'Novak Djokovic', 'SRB', 36, 11245, 1, True),
+    (216431, 'Carlos Alcaraz', 'ESP', 20, 9255, 1, True),
+    (139170, 'Jannik Sinner', 'ITA', 22, 8710, 3, True),
+    (38758, 'Daniil Medvedev', 'RUS', 27, 7165, 1, False),
+    (39667, 'Andrey Rublev', 'RUS', 26, 5110, 5, True),
+    (40285, 'Alexander Zverev', 'GER', 26, 5085, 2, False),
+    (124335, 'Holger Rune', 'DEN', 20, 4210, 4, False),
+    (41379, 'Stefanos Tsitsipas', 'GRE', 25, 4175, 3, False),
+    (59642, 'Hubert Hurkacz', 'POL', 26, 3955, 9, True),
+    (63343, 'Casper Ruud', 'NOR', 25, 3825, 2, False),
+    (59333, 'Taylor Fritz', 'USA', 26, 3505, 11, True),
+    (67580, 'Tommy Paul', 'USA', 26, 3170, 12, True),
+    (247511, 'Ben Shelton', 'USA', 21, 2920, 13, True),
+    (17869, 'Grigor Dimitrov', 'BUL', 32, 2885, 3, False),
+    (67581, 'Felix Auger-Aliassime', 'CAN', 23, 2660, 6, False),
+    (43187, 'Karen Khachanov', 'RUS', 27, 2605, 8, False),
+    (67578, 'Frances Tiafoe', 'USA', 25, 2505, 10, False),
+    (56447, 'Ugo Humbert', 'FRA', 25, 2490, 18, True),
+    (107537, 'Sebastian Korda', 'USA', 23, 2385, 19, True),
+    (60121, 'Nicolas Jarry', 'CHI', 28, 2330, 20, True),
+))
+SAMPLE_WTA_RANKING_TOP = _build_sample_ranking_top((
+    # id, name, country, age, points, career_high, is_career_high
+    (126388, 'Iga Swiatek', 'POL', 22, 10715, 1, True),
+    (83528, 'Aryna Sabalenka', 'BLR', 25, 8725, 1, True),
+    (198151, 'Coco Gauff', 'USA', 19, 6770, 3, True),
+    (98622, 'Elena Rybakina', 'KAZ', 24, 5973, 3, True),
+    (56223, 'Jessica Pegula', 'USA', 29, 5580, 3, False),
+    (47320, 'Ons Jabeur', 'TUN', 29, 4316, 2, False),
+    (97090, 'Marketa Vondrousova', 'CZE', 24, 4075, 7, True),
+    (137839, 'Qinwen Zheng', 'CHN', 21, 4005, 8, True),
+    (42043, 'Maria Sakkari', 'GRE', 28, 3835, 3, False),
+    (42043, 'Jelena Ostapenko', 'LAT', 26, 3438, 5, False),
+    (68979, 'Daria Kasatkina', 'RUS', 26, 3130, 8, False),
+    (24452, 'Madison Keys', 'USA', 28, 2993, 7, False),
+    (82992, 'Liudmila Samsonova', 'RUS', 24, 2985, 11, False),
+    (82992, 'Beatriz Haddad Maia', 'BRA', 27, 2956, 10, False),
+    (88591, 'Karolina Muchova', 'CZE', 27, 2905, 8, False),
+    (64951, 'Ekaterina Alexandrova', 'RUS', 29, 2625, 12, False),
+    (24438, 'Caroline Garcia', 'FRA', 30, 2605, 4, False),
+    (68978, 'Veronika Kudermetova', 'RUS', 26, 2501, 9, False),
+    (88589, 'Barbora Krejcikova', 'CZE', 27, 2436, 2, False),
+    (242137, 'Emma Navarro', 'USA', 22, 2380, 20, True),
+))
+
+
+def _build_sample_ranking_fillers(id_offset, first_names, last_names, countries, ages, min_points):
+    """
+    Synthetic sample ranking rows for ranks 21-200, built once at import.
+    'movement' is a placeholder that callers redraw on every request.
+    """
+    ranks = range(21, 201)
+    n = len(ranks)
+    # One batched draw per column instead of several RNG calls per row
+    firsts = random.choices(first_names, k=n)
+    lasts = random.choices(last_names, k=n)
+    player_countries = random.choices(countries, k=n)
+    player_ages = random.choices(range(ages[0], ages[1] + 1), k=n)
+    points = [
+        max(min_points, 2300 - (i * 10) + jitter)
+        for i, jitter in zip(ranks, random.choices(range(-50, 51), k=n))
+    ]
+    # Career high is uniform over [max(1, rank - 50), rank]: ranks above 50 draw
+    # a 0-50 offset in one batch, the few below need their own narrower range
+    career_highs = [random.randint(1, i) for i in range(ranks.start, 51)]
+    career_highs.extend(i - offset for i, offset in zip(range(51, ranks.stop), random.choices(range(51), k=ranks.stop - 51)))
+    at_career_high = random.choices((True, False), weights=(1, 9), k=n)
+    fillers = []
+    for i, first, last, country, age, player_points, career_high, is_career_high in zip(
+        ranks, firsts, lasts, player_countries, player_ages, points, career_highs, at_career_high
+    ):
+        player_id = i + id_offset
+        fillers.append({
+            'rank': i,
+            'id': player_id,
+            'name': f'{first} {last}',
+            'country': country,
+            'age': age,
+            'points': player_points,
+            'career_high': career_high,
+            'is_career_high': is_career_high,
+            'movement': 0,
+            'image_url': sofascore_image_url(player_id)
+        })
+    return tuple(fillers)
+
+
+SAMPLE_ATP_RANKING_FILLERS = _build_sample_ranking_fillers(
+    5000,
+    ('Alex', 'Marco', 'Pablo', 'John', 'David', 'Lucas', 'Max', 'Leo', 'Hugo', 'Jack'),
+    ('Smith', 'Garcia', 'Muller', 'Martin', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis'),
+    ('USA', 'FRA', 'ESP', 'ITA', 'GER', 'ARG', 'AUS', 'GBR', 'JPN', 'KOR'),
+    (19, 35),
+    100,
+)
+SAMPLE_WTA_RANKING_FILLERS = _build_sample_ranking_fillers(
+    10000,
+    ('Anna', 'Maria', 'Emma', 'Sofia', 'Elena', 'Victoria', 'Anastasia', 'Nina', 'Sara', 'Julia'),
+    ('Smith', 'Garcia', 'Muller', 'Martin', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis'),
+    ('USA', 'FRA', 'ESP', 'ITA', 'GER', 'RUS', 'AUS', 'GBR', 'JPN', 'CHN'),
+    (17, 34),
+    50,
+)
+
+
+def _index_sample_rankings(rows):
+    # First row wins on a repeated id, as the previous linear scan did
+    by_id = {}
+    for row in rows:
+        by_id.setdefault(row['id'], row)
+    return by_id
+
+
+# Sample ranking rows by tour and player id, for single-player lookups
+SAMPLE_RANKINGS_BY_ID = {
+    'ATP': _index_sample_rankings(SAMPLE_ATP_RANKING_TOP + SAMPLE_ATP_RANKING_FILLERS),
+    'WTA': _index_sample_rankings(SAMPLE_WTA_RANKING_TOP + SAMPLE_WTA_RANKING_FILLERS),
+}
+# Players whose sample movement is drawn from SAMPLE_TOP_RANKING_MOVEMENTS
+SAMPLE_TOP_RANKING_IDS = {
+    'ATP': frozenset(p['id'] for p in SAMPLE_ATP_RANKING_TOP),
+    'WTA': frozenset(p['id'] for p in SAMPLE_WTA_RANKING_TOP),
+}
+
+
 class TennisDataFetcher:
     """Fetches and processes tennis data from various sources"""
     
@@ -157,13 +1389,46 @@ class TennisDataFetcher:
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        # Keep-alive pools sized to the concurrency cap; transient upstream
+        # failures are retried by urllib3 (honouring Retry-After)
+        adapter = HTTPAdapter(
+            pool_connections=UPSTREAM_POOL_CONNECTIONS,
+            pool_maxsize=UPSTREAM_POOL_MAXSIZE,
+            max_retries=Retry(
+                total=UPSTREAM_MAX_RETRIES,
+                backoff_factor=UPSTREAM_RETRY_BACKOFF,
+                status_forcelist=UPSTREAM_RETRY_STATUSES,
+                allowed_methods=frozenset({'GET'}),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        # Worker pool for running independent ATP/WTA fetches side by side
+        self._fetch_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='tennis-fetch')
+        self._upstream_slots = threading.BoundedSemaphore(UPSTREAM_MAX_CONCURRENCY)
+        self._upstream_host_lock = threading.Lock()
+        self._upstream_host_next = {}
+        # Background refreshes for stale-while-revalidate caches
+        self._refresh_executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix='tennis-refresh')
+        self._live_score_changes = {}
+        self._last_good_rankings = {}
+        self._rankings_country_index = {}
+        self._sample_tournaments_memo = LRUCache(maxsize=SAMPLE_TOURNAMENTS_MEMO_SIZE)
+        self._sample_tournaments_lock = threading.Lock()
 
         self._wta_scraped_index = None
         self._atp_scraped_index = None
+        # Guards the one-time WTA rankings/scraped index builds; see warm_wta_indexes
+        self._wta_index_lock = threading.RLock()
         self._wta_tournament_index = None
         self._atp_tournament_index = None
         self._wta_rankings_cache = None
         self._wta_rankings_index = None
+        self._wta_rankings_keys_by_len = {}
+        self._wta_rankings_by_id = {}
+        self._wta_rankings_csv_memo = None
+        self._wta_resolved_players = (None, {})
         self._atp_rankings_cache = None
         self._atp_rankings_index = None
         self._wta_connections_map = None
@@ -172,19 +1437,37 @@ class TennisDataFetcher:
         self._flashscore_rankings_player_urls = {}
         self._sofascore_player_cache = {}
 
+    def _wait_for_upstream_host(self, host):
+        """Block until the per-host minimum interval has passed, then reserve the next slot"""
+        interval = UPSTREAM_HOST_MIN_INTERVAL.get(host)
+        if not interval:
+            return
+        with self._upstream_host_lock:
+            now = time.monotonic()
+            start_at = max(now, self._upstream_host_next.get(host, 0.0))
+            self._upstream_host_next[host] = start_at + interval
+        if start_at > now:
+            time.sleep(start_at - now)
+
+    def _http_get(self, url, **kwargs):
+        """
+        GET through the shared session with a global concurrency cap and
+        per-host spacing; retries are handled by the session's adapter
+        """
+        host = (urllib.parse.urlsplit(url).hostname or '').lower()
+        self._wait_for_upstream_host(host)
+        with self._upstream_slots:
+            return self.session.get(url, **kwargs)
+
     def _normalize_player_name(self, name):
         if not name:
             return ""
-        cleaned = unicodedata.normalize("NFKD", name)
-        cleaned = cleaned.encode("ascii", "ignore").decode("ascii")
-        cleaned = re.sub(r"[^A-Za-z\s]", " ", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned).strip().lower()
-        return cleaned
+        return normalize_player_name(name)
 
     def _clean_tournament_name(self, name):
         if not name:
             return ""
-        cleaned = re.sub(r"\s+(presented|powered)\s+by\s+.*$", "", str(name), flags=re.IGNORECASE).strip()
+        cleaned = PRESENTED_BY_RE.sub("", str(name)).strip()
         return cleaned or str(name).strip()
 
     def _wta_data_root(self):
@@ -274,7 +1557,7 @@ class TennisDataFetcher:
             return []
         urls = []
         try:
-            response = self.session.get(rjina_url, timeout=25)
+            response = self._http_get(rjina_url, timeout=25)
             if response.status_code == 200:
                 urls = self._extract_flashscore_player_urls_from_text(response.text)
         except Exception:
@@ -329,7 +1612,7 @@ class TennisDataFetcher:
             ddg_url = f"https://duckduckgo.com/html/?q={urllib.parse.quote_plus(query)}"
             rjina_ddg_url = f"{RJINA_HTTP_PREFIX}duckduckgo.com/html/?q={urllib.parse.quote_plus(query)}"
             try:
-                response = self.session.get(rjina_ddg_url, timeout=20)
+                response = self._http_get(rjina_ddg_url, timeout=20)
                 if response.status_code == 200:
                     raw_urls.extend(self._extract_ddg_result_urls(response.text))
             except Exception:
@@ -338,7 +1621,7 @@ class TennisDataFetcher:
                 continue
             # Fallback path: direct DDG HTML.
             try:
-                response = self.session.get(ddg_url, timeout=20)
+                response = self._http_get(ddg_url, timeout=20)
                 if response.status_code == 200:
                     raw_urls.extend(self._extract_ddg_result_urls(response.text))
             except Exception:
@@ -616,7 +1899,7 @@ class TennisDataFetcher:
                 return None
             for attempt in range(2):
                 try:
-                    response = self.session.get(rjina_url, timeout=30)
+                    response = self._http_get(rjina_url, timeout=30)
                     if response.status_code != 200:
                         if attempt == 0:
                             time.sleep(0.5)
@@ -1033,7 +2316,7 @@ class TennisDataFetcher:
                     p.get('normalized_name') or ''
                 )
             )
-            out_path.write_text(json.dumps(payload, indent=2), encoding='utf-8')
+            out_path.write_text(json_dumps(payload, indent=True), encoding='utf-8')
             by_norm = {}
             by_player_id = {}
             for row in payload['players']:
@@ -1083,19 +2366,19 @@ class TennisDataFetcher:
     def invalidate_wta_rankings_cache(self):
         self._wta_rankings_cache = None
         self._wta_rankings_index = None
+        self._wta_rankings_keys_by_len = {}
+        self._wta_rankings_by_id = {}
+        self._wta_rankings_csv_memo = None
+        self._wta_resolved_players = (None, {})
         self._wta_scraped_index = None
         self._wta_connections_map = None
-        for key in list(rankings_cache.keys()):
-            if str(key).startswith('rankings_wta'):
-                rankings_cache.pop(key, None)
+        rankings_cache.clear_prefix('rankings_wta')
 
     def invalidate_atp_rankings_cache(self):
         self._atp_rankings_cache = None
         self._atp_rankings_index = None
         self._atp_scraped_index = None
-        for key in list(rankings_cache.keys()):
-            if str(key).startswith('rankings_atp'):
-                rankings_cache.pop(key, None)
+        rankings_cache.clear_prefix('rankings_atp')
 
     def get_wta_rankings_status(self):
         csv_path = self._wta_rankings_csv_path()
@@ -1421,13 +2704,10 @@ class TennisDataFetcher:
             self._wta_tournament_index = None
             self._atp_tournament_index = None
 
-        for key in list(tournaments_cache.keys()):
-            key_text = str(key)
-            if tour_name in {'wta', 'atp'}:
-                if key_text.startswith(f'tournaments_{tour_name}_'):
-                    tournaments_cache.pop(key, None)
-            elif key_text.startswith('tournaments_'):
-                tournaments_cache.pop(key, None)
+        if tour_name in {'wta', 'atp'}:
+            tournaments_cache.clear_prefix(f'tournaments_{tour_name}_')
+        else:
+            tournaments_cache.clear_prefix('tournaments_')
 
     def get_tournaments_status(self, tour='wta'):
         output_dir = self._tour_tournaments_dir(tour)
@@ -1688,56 +2968,49 @@ class TennisDataFetcher:
         return payload
 
     def _load_wta_scraped_index(self):
-        if self._wta_scraped_index is not None:
+        index = self._wta_scraped_index
+        if index is not None:
+            return index
+        # Built once even when the warm-up thread and a request race for it
+        with self._wta_index_lock:
+            if self._wta_scraped_index is None:
+                self._wta_scraped_index = self._build_wta_scraped_index()
             return self._wta_scraped_index
 
+    def _build_wta_scraped_index(self):
         base_dir = Path(__file__).resolve().parent.parent / 'data' / 'wta'
         index = {
             'by_full': {},
             'by_last_first': {},
             'by_last': {},
             'by_player_id': {},
+            'full_keys_by_len': {},
             'players': []
         }
         if not base_dir.exists():
-            self._wta_scraped_index = index
             return index
 
-        for folder in sorted(base_dir.iterdir()):
-            if not folder.is_dir():
-                continue
-            profile_path = folder / 'profile.json'
-            if not profile_path.exists():
-                continue
-            try:
-                profile = json.loads(profile_path.read_text(encoding='utf-8'))
-            except Exception:
-                continue
-            stats_path = folder / 'stats_2026.json'
-            stats = {}
-            if stats_path.exists():
-                try:
-                    stats = json.loads(stats_path.read_text(encoding='utf-8'))
-                except Exception:
-                    stats = {}
+        folders = [folder for folder in sorted(base_dir.iterdir()) if folder.is_dir()]
+        cache_path = base_dir / SCRAPED_INDEX_CACHE_FILE
+        fingerprint = self._scraped_folders_fingerprint(base_dir, folders, ('profile.json', 'stats_2026.json'))
+        cached = self._read_scraped_index_cache(cache_path, fingerprint)
+        if cached is not None:
+            cached['fingerprint'] = fingerprint
+            if not self._wta_connections_file_path().exists():
+                self._persist_wta_player_connections(cached)
+            return cached
 
-            name = (profile.get('name') or '').strip()
-            if not name:
+        # Folder reads are I/O bound, so they overlap on a pool; the index dicts
+        # are filled on this thread in folder order
+        with ThreadPoolExecutor(max_workers=SCRAPED_INDEX_READ_WORKERS, thread_name_prefix='tennis-index') as pool:
+            entries = list(pool.map(self._read_wta_scraped_folder, folders))
+
+        for entry in entries:
+            if entry is None:
                 continue
-            norm = self._normalize_player_name(name)
-            tokens = norm.split()
-            first = tokens[0] if tokens else ""
-            last = tokens[-1] if tokens else ""
-            entry = {
-                'name': name,
-                'norm': norm,
-                'first': first,
-                'last': last,
-                'player_id': self._extract_wta_player_id_from_url(profile.get('url')),
-                'profile': profile,
-                'stats': stats,
-                'folder': str(folder)
-            }
+            norm = entry['norm']
+            first = entry['first']
+            last = entry['last']
             index['players'].append(entry)
             if norm:
                 existing = index['by_full'].get(norm)
@@ -1756,10 +3029,96 @@ class TennisDataFetcher:
                 if existing is None or self._entry_quality_score(entry) > self._entry_quality_score(existing):
                     index['by_player_id'][pid] = entry
 
+        index['full_keys_by_len'] = names_by_length(index['by_full'])
+        # Lets memos built on this index survive a rebuild from unchanged files
+        index['fingerprint'] = fingerprint
         self._persist_wta_player_connections(index)
-        self._wta_scraped_index = index
+        self._write_scraped_index_cache(cache_path, fingerprint, index)
         return index
 
+    def _read_wta_scraped_folder(self, folder):
+        profile_path = folder / 'profile.json'
+        if not profile_path.exists():
+            return None
+        try:
+            profile = json_loads(profile_path.read_bytes())
+        except Exception:
+            return None
+        stats_path = folder / 'stats_2026.json'
+        stats = {}
+        if stats_path.exists():
+            try:
+                stats = json_loads(stats_path.read_bytes())
+            except Exception:
+                stats = {}
+
+        name = (profile.get('name') or '').strip()
+        if not name:
+            return None
+        norm = self._normalize_player_name(name)
+        tokens = norm.split()
+        return {
+            'name': name,
+            'norm': norm,
+            'first': tokens[0] if tokens else "",
+            'last': tokens[-1] if tokens else "",
+            'player_id': self._extract_wta_player_id_from_url(profile.get('url')),
+            'profile': profile,
+            'stats': stats,
+            'folder': str(folder)
+        }
+
+    def _scraped_folders_fingerprint(self, base_dir, folders, file_names):
+        """Size and mtime of every per-player file an index is built from"""
+        fingerprint = [str(base_dir)]
+        for folder in folders:
+            for file_name in file_names:
+                try:
+                    stat = (folder / file_name).stat()
+                except OSError:
+                    continue
+                fingerprint.append((folder.name, file_name, stat.st_mtime_ns, stat.st_size))
+        return tuple(fingerprint)
+
+    def _read_scraped_index_cache(self, cache_path, fingerprint):
+        try:
+            with cache_path.open('rb') as fh:
+                cached = pickle.load(fh)
+        except Exception:
+            return None
+        if (
+            not isinstance(cached, dict)
+            or cached.get('version') != SCRAPED_INDEX_CACHE_VERSION
+            or cached.get('fingerprint') != fingerprint
+        ):
+            return None
+        return cached.get('index')
+
+    def _write_scraped_index_cache(self, cache_path, fingerprint, index):
+        """Pickle the index next to the data it came from; written atomically so workers never read a partial file"""
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        try:
+            with tmp_path.open('wb') as fh:
+                pickle.dump(
+                    {'version': SCRAPED_INDEX_CACHE_VERSION, 'fingerprint': fingerprint, 'index': index},
+                    fh,
+                    protocol=pickle.HIGHEST_PROTOCOL
+                )
+            tmp_path.replace(cache_path)
+        except Exception:
+            try:
+                tmp_path.unlink()
+            except OSError:
+                pass
+
+    def warm_wta_indexes(self):
+        """Build the WTA rankings and scraped-player indexes ahead of the first match parse"""
+        try:
+            self._get_wta_rankings_index()
+            self._load_wta_scraped_index()
+        except Exception as e:
+            print(f"WTA index warm-up failed: {e}")
+
     def _match_wta_scraped(self, name):
         index = self._load_wta_scraped_index()
         if not name:
@@ -1776,11 +3135,9 @@ class TennisDataFetcher:
             if key in index['by_last_first']:
                 return index['by_last_first'][key]
 
-        choices = list(index['by_full'].keys())
-        if choices:
-            match = difflib.get_close_matches(norm, choices, n=1, cutoff=0.82)
-            if match:
-                return index['by_full'][match[0]]
+        match = closest_name(norm, index['full_keys_by_len'])
+        if match:
+            return index['by_full'][match]
         return None
 
     def _load_atp_scraped_index(self):
@@ -1792,6 +3149,7 @@ class TennisDataFetcher:
             'by_full': {},
             'by_last_first': {},
             'by_last': {},
+            'full_keys_by_len': {},
             'players': []
         }
         if not base_dir.exists():
@@ -1856,6 +3214,7 @@ class TennisDataFetcher:
             if last:
                 index['by_last'].setdefault(last, []).append(entry)
 
+        index['full_keys_by_len'] = names_by_length(index['by_full'])
         self._atp_scraped_index = index
         return index
 
@@ -1875,38 +3234,14 @@ class TennisDataFetcher:
             if key in index['by_last_first']:
                 return index['by_last_first'][key]
 
-        choices = list(index['by_full'].keys())
-        if choices:
-            match = difflib.get_close_matches(norm, choices, n=1, cutoff=0.82)
-            if match:
-                return index['by_full'][match[0]]
+        match = closest_name(norm, index['full_keys_by_len'])
+        if match:
+            return index['by_full'][match]
         return None
     
     def get_tournament_category(self, tournament_name):
         """Determine tournament category based on name"""
-        name_lower = tournament_name.lower()
-        
-        # Check Grand Slams
-        for gs in Config.GRAND_SLAMS:
-            if gs.lower() in name_lower:
-                return 'grand_slam'
-        
-        # Check Masters 1000
-        for m1000 in Config.MASTERS_1000:
-            if m1000.lower() in name_lower:
-                return 'masters_1000'
-        
-        # Check for category in name
-        if '1000' in name_lower:
-            return 'masters_1000'
-        if '500' in name_lower:
-            return 'atp_500'
-        if '250' in name_lower:
-            return 'atp_250'
-        if '125' in name_lower:
-            return 'atp_125'
-        
-        return 'other'
+        return _tournament_category_for_name(tournament_name)
 
     def _get_wta_rankings(self):
         if self._wta_rankings_cache is None:
@@ -1914,15 +3249,29 @@ class TennisDataFetcher:
         return self._wta_rankings_cache
 
     def _get_wta_rankings_index(self):
-        if self._wta_rankings_index is not None:
+        index = self._wta_rankings_index
+        if index is not None:
+            return index
+        with self._wta_index_lock:
+            if self._wta_rankings_index is None:
+                self._build_wta_rankings_index()
             return self._wta_rankings_index
+
+    def _build_wta_rankings_index(self):
+        # One pass builds the name index and the id lookup; the first row wins
+        # for duplicate names or ids, as a top-down scan would
         index = {}
+        by_id = {}
         for player in self._get_wta_rankings():
             norm = self._normalize_player_name(player.get('name') or '')
             if norm and norm not in index:
                 index[norm] = player
+            pid = self._to_int(player.get('id'))
+            if pid is not None and pid not in by_id:
+                by_id[pid] = player
+        self._wta_rankings_keys_by_len = names_by_length(index)
+        self._wta_rankings_by_id = by_id
         self._wta_rankings_index = index
-        return index
 
     def _match_wta_ranking(self, name):
         if not name:
@@ -1931,23 +3280,20 @@ class TennisDataFetcher:
         index = self._get_wta_rankings_index()
         if norm in index:
             return index[norm]
-        choices = list(index.keys())
-        if choices:
-            match = difflib.get_close_matches(norm, choices, n=1, cutoff=0.82)
-            if match:
-                return index[match[0]]
+        match = closest_name(norm, self._wta_rankings_keys_by_len)
+        if match:
+            return index[match]
         return None
 
     def _match_wta_ranking_strict(self, name='', player_id=None):
+        index = self._get_wta_rankings_index()
         pid = self._to_int(player_id)
-        if pid is not None:
-            for player in self._get_wta_rankings():
-                if self._to_int(player.get('id')) == pid:
-                    return player
+        if pid is not None and pid in self._wta_rankings_by_id:
+            return self._wta_rankings_by_id[pid]
         norm = self._normalize_player_name(name or '')
         if not norm:
             return None
-        return self._get_wta_rankings_index().get(norm)
+        return index.get(norm)
 
     def _get_atp_rankings(self):
         if self._atp_rankings_cache is None:
@@ -1974,6 +3320,7 @@ class TennisDataFetcher:
                 by_code[code] = player
         self._atp_rankings_index = {
             'by_norm': by_norm,
+            'norm_keys_by_len': names_by_length(by_norm),
             'by_code': by_code,
             'by_last_first': by_last_first
         }
@@ -1997,11 +3344,9 @@ class TennisDataFetcher:
             if key and key in index.get('by_last_first', {}):
                 return index['by_last_first'][key]
 
-        choices = list(by_norm.keys())
-        if choices and norm:
-            match = difflib.get_close_matches(norm, choices, n=1, cutoff=0.82)
-            if match:
-                return by_norm[match[0]]
+        match = closest_name(norm, index.get('norm_keys_by_len', {}))
+        if match:
+            return by_norm[match]
         return None
 
     def _match_wta_scraped_strict(self, name='', player_id=None):
@@ -2050,9 +3395,9 @@ class TennisDataFetcher:
         }
         if include_account_header:
             headers['account'] = 'wta'
-        response = self.session.get(url, params=params or {}, headers=headers, timeout=30)
+        response = self._http_get(url, params=params or {}, headers=headers, timeout=30)
         response.raise_for_status()
-        return response.json()
+        return json_loads(response.content)
 
     def _rjina_url(self, url):
         plain = str(url or '').strip()
@@ -2060,7 +3405,7 @@ class TennisDataFetcher:
         return f"{RJINA_HTTP_PREFIX}{plain}"
 
     def _fetch_rjina_markdown(self, url, timeout=30):
-        response = self.session.get(self._rjina_url(url), timeout=timeout)
+        response = self._http_get(self._rjina_url(url), timeout=timeout)
         response.raise_for_status()
         return response.text or ''
 
@@ -2458,7 +3803,7 @@ class TennisDataFetcher:
     def _wta_level_to_category(self, tournament_level='', tournament_name=''):
         raw_level = str(tournament_level or '').upper()
         raw_name = str(tournament_name or '').upper()
-        if 'GRAND' in raw_level or raw_level in ('GS',) or any(gs.upper() in raw_name for gs in Config.GRAND_SLAMS):
+        if 'GRAND' in raw_level or raw_level in ('GS',) or any(gs in raw_name for gs in GRAND_SLAM_NAMES_UPPER):
             return 'grand_slam'
         if any(token in raw_level for token in ('1000', 'PM', 'P1')):
             return 'wta_1000'
@@ -2623,7 +3968,7 @@ class TennisDataFetcher:
         }
 
     def _parse_h2h_set_scores(self, score_text, reverse_order=False):
-        text = re.sub(r"\s+", " ", str(score_text or "")).strip()
+        text = WHITESPACE_RE.sub(" ", str(score_text or "")).strip()
         if not text:
             return []
 
@@ -2991,7 +4336,7 @@ class TennisDataFetcher:
             tournament = self._clean_tournament_name(match.get('TournamentName') or 'Tournament')
             category = self._wta_level_to_category(match.get('TournamentLevel') or '', tournament)
             surface = str(match.get('Surface') or '').title()
-            score = re.sub(r"\s+", " ", str(match.get('scores') or '')).strip()
+            score = WHITESPACE_RE.sub(" ", str(match.get('scores') or '')).strip()
             reverse_order = int(api_player1_id or 0) != int(p1_id)
             set_scores = self._parse_h2h_set_scores(score, reverse_order=reverse_order)
 
@@ -3230,7 +4575,7 @@ class TennisDataFetcher:
             if not stdout:
                 return []
             try:
-                payload = json.loads(stdout)
+                payload = json_loads(stdout)
             except Exception as exc:
                 last_error = exc
                 if attempt < attempts:
@@ -3292,7 +4637,7 @@ class TennisDataFetcher:
         try:
             cache_path.parent.mkdir(parents=True, exist_ok=True)
             cache_path.write_text(
-                json.dumps(matches, ensure_ascii=False, indent=2),
+                json_dumps(matches, indent=True),
                 encoding='utf-8'
             )
         except Exception:
@@ -3314,24 +4659,15 @@ class TennisDataFetcher:
             return None
 
     def _parse_wta_match_time(self, value):
-        if not value:
-            return None
-        try:
-            ts = value.replace('Z', '+00:00')
-            dt = datetime.fromisoformat(ts)
-            local_dt = dt.astimezone()
-            return local_dt.strftime('%b %d %I:%M %p').lstrip('0')
-        except Exception:
+        if not value or not isinstance(value, str):
             return None
+        return format_wta_match_time(value)
 
     def _is_grand_slam_event(self, name, level):
         level_lower = (level or '').lower()
         if 'grand slam' in level_lower:
             return True
-        for gs in Config.GRAND_SLAMS:
-            if gs.lower() in (name or '').lower():
-                return True
-        return False
+        return bool(name) and GRAND_SLAM_NAME_RE.search(name.lower()) is not None
 
     def _wta_category_from_level(self, name, level):
         level_lower = (level or '').lower()
@@ -3370,7 +4706,10 @@ class TennisDataFetcher:
         round_id = str(match.get('RoundID') or '').strip()
         draw_level_type = str(match.get('DrawLevelType') or '').strip().upper()
         match_id = str(match.get('MatchID') or '')
-        match_digits = re.sub(r'\D', '', match_id)
+        if match_id.isascii():
+            match_digits = match_id.translate(_ASCII_NON_DIGIT_DELETE)
+        else:
+            match_digits = NON_DIGIT_RE.sub('', match_id)
         match_number = int(match_digits) if match_digits.isdigit() else 0
 
         round_upper = round_id.upper()
@@ -3445,43 +4784,28 @@ class TennisDataFetcher:
                 if 1 <= rid <= len(rounds):
                     return rounds[rid - 1]
 
-        if match_number:
-            if match_number == 1:
-                return 'F'
-            if match_number in (2, 3):
-                return 'SF'
-            if 4 <= match_number <= 7:
-                return 'QF'
-            if 8 <= match_number <= 15:
-                return 'R16'
-            if 16 <= match_number <= 31:
-                return 'R32'
-            if 32 <= match_number <= 63:
-                return 'R64'
-            if 64 <= match_number <= 127:
-                return 'R128'
+        # Match numbers count back from the final: 1, 2-3, 4-7, ... so the
+        # round is given by the number's bit length
+        if 0 < match_number < 128:
+            return _MATCH_NUMBER_ROUNDS[match_number.bit_length()]
         return ''
 
     def _parse_wta_sets(self, match):
         sets = []
-        for idx in range(1, 6):
-            raw_a = match.get(f'ScoreSet{idx}A')
-            raw_b = match.get(f'ScoreSet{idx}B')
-            if raw_a in (None, '', ' ') or raw_b in (None, '', ' '):
-                continue
+        for key_a, key_b, key_tb in _WTA_SET_KEYS:
+            # Blank scores fail int() like any other non-numeric value
             try:
-                games_a = int(raw_a)
-                games_b = int(raw_b)
+                games_a = int(match.get(key_a))
+                games_b = int(match.get(key_b))
             except Exception:
                 continue
             entry = {'p1': games_a, 'p2': games_b}
-            raw_tb = match.get(f'ScoreTbSet{idx}')
-            if raw_tb not in (None, '', ' '):
+            if (games_a == 7 and games_b == 6) or (games_a == 6 and games_b == 7):
                 try:
-                    loser_tb = int(raw_tb)
+                    loser_tb = int(match.get(key_tb))
                 except Exception:
                     loser_tb = None
-                if loser_tb is not None and ((games_a == 7 and games_b == 6) or (games_a == 6 and games_b == 7)):
+                if loser_tb is not None:
                     winner_tb = max(7, loser_tb + 2)
                     if games_a > games_b:
                         entry['tiebreak'] = {'p1': winner_tb, 'p2': loser_tb}
@@ -3491,10 +4815,12 @@ class TennisDataFetcher:
         return sets
 
     def _determine_sets_winner(self, sets):
-        if not sets:
-            return None
-        p1_sets = sum(1 for s in sets if s['p1'] > s['p2'])
-        p2_sets = sum(1 for s in sets if s['p2'] > s['p1'])
+        p1_sets = p2_sets = 0
+        for s in sets or ():
+            if s['p1'] > s['p2']:
+                p1_sets += 1
+            elif s['p2'] > s['p1']:
+                p2_sets += 1
         if p1_sets > p2_sets:
             return 1
         if p2_sets > p1_sets:
@@ -3502,6 +4828,25 @@ class TennisDataFetcher:
         return None
 
     def _resolve_wta_player(self, name, country, player_id):
+        """
+        Player block for a WTA match. Resolutions are memoized per
+        (name, country, player_id) against the current scraped index, so they
+        are dropped when the index is rebuilt or the WTA rankings are
+        invalidated; callers always get their own copy.
+        """
+        scraped_index = self._load_wta_scraped_index()
+        memo_index, memo = self._wta_resolved_players
+        if memo_index is not scraped_index or len(memo) >= WTA_RESOLVED_PLAYERS_MAX:
+            memo = {}
+            self._wta_resolved_players = (scraped_index, memo)
+        cache_key = (name, country, player_id)
+        resolved = memo.get(cache_key)
+        if resolved is None:
+            resolved = self._resolve_wta_player_uncached(name, country, player_id)
+            memo[cache_key] = resolved
+        return dict(resolved)
+
+    def _resolve_wta_player_uncached(self, name, country, player_id):
         rank_entry = self._match_wta_ranking(name)
         scraped_entry = self._match_wta_scraped(name)
         resolved_id = int(player_id) if player_id and str(player_id).isdigit() else None
@@ -3902,7 +5247,7 @@ class TennisDataFetcher:
                 print(f"Error in atp_match_stats script: {result.stderr}", file=sys.stderr)
                 return None
             
-            return json.loads(result.stdout)
+            return json_loads(result.stdout)
         except (subprocess.TimeoutExpired, json.JSONDecodeError, TypeError) as e:
             print(f"Failed to fetch or parse ATP match stats: {e}", file=sys.stderr)
             return None
@@ -3911,8 +5256,9 @@ class TennisDataFetcher:
         tournament = match.get('Tournament') or {}
         group = tournament.get('tournamentGroup') or {}
         title = tournament.get('title') or ''
-        if ' - ' in title:
-            event_name = title.split(' - ')[0].strip()
+        head, sep, _ = title.partition(' - ')
+        if sep:
+            event_name = head.strip()
         else:
             event_name = title.strip() or (group.get('name') or '').title()
         event_name = self._clean_tournament_name(event_name)
@@ -4024,11 +5370,43 @@ class TennisDataFetcher:
         Fetch live tennis scores
         tour: 'atp', 'wta', or 'both'
         """
+        return live_scores_cache.get_or_load(
+            f'live_scores_{tour}',
+            lambda: self._refresh_live_scores(tour),
+            self._refresh_executor
+        )
+
+    def _live_scores_ttl(self, cache_key, matches):
+        """
+        Cache TTL for a live scores payload: the time since the most recently
+        changed live score, clamped to [LIVE_SCORES_MIN_TTL, CACHE_LIVE_SCORES]
+        """
+        now = time.monotonic()
+        previous = self._live_score_changes.get(cache_key) or {}
+        changes = {}
+        ttl = Config.CACHE_LIVE_SCORES
+        for match in matches:
+            if not isinstance(match, dict) or match.get('status') != 'live':
+                continue
+            match_id = match.get('id')
+            signature = repr(match.get('score'))
+            last = previous.get(match_id)
+            changed_at = last[1] if last and last[0] == signature else now
+            changes[match_id] = (signature, changed_at)
+            ttl = min(ttl, max(LIVE_SCORES_MIN_TTL, now - changed_at))
+        self._live_score_changes[cache_key] = changes
+        return ttl
+
+    def _refresh_live_scores(self, tour):
         cache_key = f'live_scores_{tour}'
-        if cache_key in live_scores_cache:
-            return live_scores_cache[cache_key]
-        
         live_matches = []
+        # Start the ATP scraper alongside the WTA one when both tours are requested
+        atp_future = None
+        if tour == 'both':
+            atp_future = self._fetch_executor.submit(
+                self._run_atp_matches_script, '[Live] atp_live_matches.py'
+            )
+
         if tour in ('wta', 'both'):
             wta_raw = self._run_wta_matches_script('[Live] wta_live_matches.py')
             if wta_raw is None:
@@ -4042,7 +5420,10 @@ class TennisDataFetcher:
                 live_matches.extend(wta_live)
 
         if tour in ('atp', 'both'):
-            atp_raw = self._run_atp_matches_script('[Live] atp_live_matches.py')
+            if atp_future is not None:
+                atp_raw = atp_future.result()
+            else:
+                atp_raw = self._run_atp_matches_script('[Live] atp_live_matches.py')
             if atp_raw is None:
                 cached = self._load_atp_matches_cache('live')
                 if cached:
@@ -4067,29 +5448,65 @@ class TennisDataFetcher:
                         atp_live = cached
                 live_matches.extend(atp_live)
         
-        live_scores_cache[cache_key] = live_matches
+        live_scores_cache.set(cache_key, live_matches, ttl=self._live_scores_ttl(cache_key, live_matches))
         return live_matches
+
+    def fetch_live_scores_by_tour(self):
+        """Fetch ATP and WTA live scores concurrently, keyed by tour"""
+        wta_future = self._fetch_executor.submit(self.fetch_live_scores, 'wta')
+        atp_scores = self.fetch_live_scores('atp')
+        return {'atp': atp_scores, 'wta': wta_future.result()}
     
+    def _get_wta_matches(self, kind, args):
+        """
+        Parsed WTA matches from the '[Live] wta_<kind>_matches.py' feed, or None
+        when the script fails. Served from wta_matches_cache (stale-while-revalidate).
+        """
+        cache_key = f"wta_{kind}_{'_'.join(args)}"
+        return wta_matches_cache.get_or_load(
+            cache_key,
+            lambda: self._refresh_wta_matches(cache_key, kind, args),
+            self._refresh_executor
+        )
+
+    def _refresh_wta_matches(self, cache_key, kind, args):
+        wta_raw = self._run_wta_matches_script(f'[Live] wta_{kind}_matches.py', args=args)
+        if wta_raw is None:
+            return None
+        parsed = [self._parse_wta_match(match) for match in wta_raw if isinstance(match, dict)]
+        wta_matches_cache.set(cache_key, parsed)
+        return parsed
+
     def fetch_recent_matches(self, tour='both', limit=20):
         """Fetch recently completed matches"""
         matches = []
-        if tour in ('wta', 'both'):
-            wta_raw = self._run_wta_matches_script(
-                '[Live] wta_recent_matches.py',
-                args=['--limit', str(limit)]
+        atp_future = None
+        if tour == 'both':
+            atp_future = self._fetch_executor.submit(
+                self._run_atp_matches_script,
+                '[Live] atp_recent_matches.py',
+                args=['--limit', str(limit)],
+                timeout=90
             )
-            if wta_raw is None:
+
+        if tour in ('wta', 'both'):
+            wta_limit = min(max(int(limit), 1), WTA_RECENT_MATCHES_MAX_LIMIT)
+            wta_parsed = self._get_wta_matches('recent', ['--limit', str(wta_limit)])
+            if wta_parsed is None:
                 matches.extend(self._generate_sample_recent_matches('wta', limit))
             else:
-                parsed = [self._parse_wta_match(match) for match in wta_raw if isinstance(match, dict)]
-                matches.extend(parsed)
+                # Cached entries are shared; hand out copies
+                matches.extend(dict(match) for match in wta_parsed)
 
         if tour in ('atp', 'both'):
-            atp_raw = self._run_atp_matches_script(
-                '[Live] atp_recent_matches.py',
-                args=['--limit', str(limit)],
-                timeout=90
-            )
+            if atp_future is not None:
+                atp_raw = atp_future.result()
+            else:
+                atp_raw = self._run_atp_matches_script(
+                    '[Live] atp_recent_matches.py',
+                    args=['--limit', str(limit)],
+                    timeout=90
+                )
             if atp_raw is None:
                 cached = self._load_atp_matches_cache('recent')
                 if cached:
@@ -4123,32 +5540,40 @@ class TennisDataFetcher:
         days: number of days to look ahead (default 2)
         """
         matches = []
+        atp_future = None
+        if tour == 'both':
+            atp_future = self._fetch_executor.submit(
+                self._run_atp_matches_script,
+                '[Live] atp_upcoming_matches.py',
+                args=['--days', str(days)],
+                timeout=90
+            )
 
         if tour in ('wta', 'both'):
-            wta_raw = self._run_wta_matches_script(
-                '[Live] wta_upcoming_matches.py',
-                args=['--days', str(days)]
-            )
-            if wta_raw is None:
+            wta_days = min(max(int(days), 1), WTA_UPCOMING_MATCHES_MAX_DAYS)
+            wta_parsed = self._get_wta_matches('upcoming', ['--days', str(wta_days)])
+            if wta_parsed is None:
                 print(f"WTA upcoming: script failed, using generated matches")
                 matches.extend(self._generate_sample_upcoming_matches('wta', days))
-            elif len(wta_raw) == 0:
+            elif len(wta_parsed) == 0:
                 # Scraper ran successfully but found no matches - use generated matches as fallback
                 print(f"WTA upcoming: scraper returned empty, using generated matches")
                 matches.extend(self._generate_sample_upcoming_matches('wta', days))
             else:
-                parsed = [self._parse_wta_match(match) for match in wta_raw if isinstance(match, dict)]
-                # Filter out matches with TBD/empty player names
-                parsed = [m for m in parsed if m and m.get('player1', {}).get('name', '').strip() and m.get('player2', {}).get('name', '').strip()]
+                # Filter out matches with TBD/empty player names; cached entries are shared, so copy
+                parsed = [dict(m) for m in wta_parsed if m and m.get('player1', {}).get('name', '').strip() and m.get('player2', {}).get('name', '').strip()]
                 print(f"WTA upcoming: loaded {len(parsed)} real matches from scraper")
                 matches.extend(parsed)
 
         if tour in ('atp', 'both'):
-            atp_raw = self._run_atp_matches_script(
-                '[Live] atp_upcoming_matches.py',
-                args=['--days', str(days)],
-                timeout=90
-            )
+            if atp_future is not None:
+                atp_raw = atp_future.result()
+            else:
+                atp_raw = self._run_atp_matches_script(
+                    '[Live] atp_upcoming_matches.py',
+                    args=['--days', str(days)],
+                    timeout=90
+                )
             if atp_raw is None:
                 cached = self._load_atp_matches_cache('upcoming')
                 if cached:
@@ -4191,21 +5616,58 @@ class TennisDataFetcher:
         limit: number of players to fetch (max 200)
         """
         cache_key = f'rankings_{tour}'
-        if cache_key in rankings_cache:
-            return rankings_cache[cache_key][:limit]
+        rankings = rankings_cache.get_or_load(cache_key, lambda: self._load_rankings(tour))
+        return rankings[:limit]
 
+    def top_rankings(self, tour='atp', n=20, country=None):
+        """
+        Top `n` ranked players, optionally restricted to a country code.
+        The country filter uses a per-country column index built once per
+        cached rankings list instead of scanning every row on each request.
+        """
+        if not country:
+            return self.fetch_rankings(tour, n)
+        rankings = rankings_cache.get_or_load(
+            f'rankings_{tour}', lambda: self._load_rankings(tour)
+        )
+        return self._get_rankings_country_index(tour, rankings).get(str(country).strip().upper(), ())[:n]
+
+    def _get_rankings_country_index(self, tour, rankings):
+        cached = self._rankings_country_index.get(tour)
+        if cached and cached[0] is rankings:
+            return cached[1]
+        by_country = {}
+        for row in rankings:
+            code = str(row.get('country') or '').strip().upper()
+            if code:
+                by_country.setdefault(code, []).append(row)
+        by_country = {code: tuple(rows) for code, rows in by_country.items()}
+        self._rankings_country_index[tour] = (rankings, by_country)
+        return by_country
+
+    def _load_rankings(self, tour):
         rankings = None
-        if tour == 'wta':
-            rankings = self._load_wta_rankings_csv()
-        elif tour == 'atp':
-            rankings = self._load_atp_rankings_csv()
+        try:
+            if tour == 'wta':
+                rankings = self._load_wta_rankings_csv()
+            elif tour == 'atp':
+                rankings = self._load_atp_rankings_csv()
+        except Exception as e:
+            print(f"{tour.upper()} rankings: failed to load ({e})")
 
-        # Generate sample rankings data
-        if not rankings:
-            rankings = self._generate_sample_rankings(tour, limit)
+        if rankings:
+            self._last_good_rankings[tour] = (rankings, time.monotonic())
+        else:
+            # Serve the last good rankings (stale-if-error) before falling back to samples
+            last_good = self._last_good_rankings.get(tour)
+            if last_good and time.monotonic() - last_good[1] < RANKINGS_STALE_IF_ERROR:
+                print(f"{tour.upper()} rankings: source unavailable, serving last good rankings")
+                rankings = last_good[0]
 
-        rankings_cache[cache_key] = rankings
-        return rankings[:limit]
+        # Generate sample rankings data; the whole table is cached and callers slice it
+        if not rankings:
+            rankings = self._generate_sample_rankings(tour, None)
+        return rankings
     
     def fetch_tournaments(self, tour='atp', year=None):
         """Fetch tournament calendar"""
@@ -4213,9 +5675,9 @@ class TennisDataFetcher:
             year = datetime.now().year
         
         cache_key = f'tournaments_{tour}_{year}'
-        if cache_key in tournaments_cache:
-            return tournaments_cache[cache_key]
+        return tournaments_cache.get_or_load(cache_key, lambda: self._load_tournaments(tour, year))
 
+    def _load_tournaments(self, tour, year):
         tournaments = []
         if tour == 'wta':
             tournaments = self._load_wta_tournaments_from_files(year)
@@ -4224,9 +5686,23 @@ class TennisDataFetcher:
 
         if not tournaments:
             tournaments = self._generate_sample_tournaments(tour, year)
-        tournaments_cache[cache_key] = tournaments
         return tournaments
     
+    def fetch_dashboard_bundle(self, tour='both'):
+        """
+        Live scores, rankings and tournament calendars for the dashboard in one
+        payload, with the independent fetches run concurrently
+        """
+        tours = ('atp', 'wta') if tour == 'both' else (tour,)
+        rankings_futures = {t: self._fetch_executor.submit(self.fetch_rankings, t) for t in tours}
+        tournaments_futures = {t: self._fetch_executor.submit(self.fetch_tournaments, t) for t in tours}
+        live = self.fetch_live_scores(tour)
+        return {
+            'live': live,
+            'rankings': {t: future.result() for t, future in rankings_futures.items()},
+            'tournaments': {t: future.result() for t, future in tournaments_futures.items()}
+        }
+
     def fetch_tournament_bracket(self, tournament_id, tour='atp'):
         """Fetch tournament bracket/draw"""
         if tour == 'wta':
@@ -4255,14 +5731,13 @@ class TennisDataFetcher:
 
     def _get_wta_player_from_csv(self, player_id):
         """Resolve WTA player details from CSV-backed rankings."""
-        rankings = self._load_wta_rankings_csv()
-        if not rankings:
+        lookup = self._get_wta_rankings_csv_lookup()
+        if not lookup:
             return None
-        player = next((p for p in rankings if p.get('id') == player_id), None)
+        player = lookup['by_id'].get(player_id)
         # Backward compatibility for old synthetic IDs (100000 + rank).
         if not player and player_id >= 100000:
-            rank = player_id - 100000
-            player = next((p for p in rankings if p.get('rank') == rank), None)
+            player = lookup['by_rank'].get(player_id - 100000)
         if not player:
             return None
         resolved_id = player.get('id') or player_id
@@ -4301,7 +5776,7 @@ class TennisDataFetcher:
         height = player.get('height') or f"{random.randint(175, 200)} cm"
         plays = player.get('plays') or random.choice(['Right-Handed', 'Left-Handed'])
         titles = player.get('titles') or random.randint(0, 25)
-        image_url = player.get('image_url') or f'https://api.sofascore.com/api/v1/player/{resolved_id}/image'
+        image_url = player.get('image_url') or sofascore_image_url(resolved_id)
         stats_2026 = player.get('stats_2026') or {}
 
         prize_money_career = (
@@ -4358,7 +5833,7 @@ class TennisDataFetcher:
 
         for file_path in base_dir.glob("*.json"):
             try:
-                tournament = json.loads(file_path.read_text(encoding='utf-8'))
+                tournament = json_loads(file_path.read_bytes())
             except Exception:
                 continue
             tid = tournament.get('tournament_group_id') or tournament.get('id') or tournament.get('order')
@@ -4380,7 +5855,10 @@ class TennisDataFetcher:
 
         for file_path in base_dir.glob("*.json"):
             try:
-                tournament = json.loads(file_path.read_text(encoding='utf-8'))
+                raw = file_path.read_bytes()
+                if not raw:
+                    continue
+                tournament = json_loads(raw)
             except Exception:
                 continue
             tid = tournament.get('tournament_group_id') or tournament.get('id') or tournament.get('order')
@@ -4429,12 +5907,8 @@ class TennisDataFetcher:
         if not draw_size:
             draw_size = 32
 
-        rankings = self._load_wta_rankings_csv()
-        rank_map = {}
-        for player in rankings or []:
-            norm = self._normalize_player_name(player.get('name') or '')
-            if norm and player.get('rank'):
-                rank_map[norm] = player.get('rank')
+        # Normalized name -> rank, built once per parsed rankings CSV
+        rank_map = (self._get_wta_rankings_csv_lookup() or {}).get('rank_by_norm') or {}
 
         # Seed lookup from draw lines
         seed_map = {}
@@ -4445,22 +5919,9 @@ class TennisDataFetcher:
             if pid and seed:
                 seed_map[str(pid)] = seed
 
-        def round_labels_for_draw(size):
-            if size >= 128:
-                return ['R128', 'R64', 'R32', 'R16']
-            if size >= 64:
-                return ['R64', 'R32', 'R16']
-            if size >= 48:
-                return ['R64', 'R32', 'R16']
-            if size >= 32:
-                return ['R32', 'R16']
-            if size >= 16:
-                return ['R16']
-            return []
-
         # Build round mapping
         numeric_rounds = sorted({int(r) for r in [m.get('round_id') for m in matches] if isinstance(r, str) and r.isdigit()})
-        labels = round_labels_for_draw(draw_size)
+        labels = _wta_draw_round_labels(draw_size)
         round_map = {}
         for idx, rid in enumerate(numeric_rounds):
             if idx < len(labels):
@@ -4473,70 +5934,20 @@ class TennisDataFetcher:
         round_map['R'] = 'RR'
         round_map['RR'] = 'RR'
 
-        def _short_name(name):
-            if not name:
-                return ''
-            parts = name.strip().split()
-            if len(parts) >= 2:
-                return f"{parts[0][0]}. {parts[-1]}"
-            return name
-
-        def _winner_tb(loser_tb):
-            try:
-                loser_val = int(loser_tb)
-            except Exception:
-                return None
-            return max(7, loser_val + 2)
-
-        def parse_sets(score_string):
-            if score_string is None or score_string == '':
-                return []
-            normalized = str(score_string).replace(",", " ").strip()
-            parts = normalized.split()
-            rebuilt = []
-            for part in parts:
-                match = re.match(r"^(\d)(\d)(\(\d+\))?$", part)
-                if match:
-                    rebuilt.append(f"{match.group(1)}-{match.group(2)}{match.group(3) or ''}")
-                else:
-                    rebuilt.append(part)
-            normalized = " ".join(rebuilt)
-            tokens = re.findall(r"(\d+)-(\d+)(?:\((\d+)\))?", normalized)
-            sets = []
-            for a, b, tb in tokens:
-                entry = {'p1': int(a), 'p2': int(b)}
-                if tb:
-                    winner_tb = _winner_tb(tb)
-                    if winner_tb is not None:
-                        if int(a) > int(b):
-                            entry['tiebreak'] = {'p1': winner_tb, 'p2': int(tb)}
-                        else:
-                            entry['tiebreak'] = {'p1': int(tb), 'p2': winner_tb}
-                sets.append(entry)
-            return sets
-
-        def _align_sets_to_side(sets, winner_side):
-            if not sets or winner_side not in ('A', 'B'):
-                return sets
-            p1_sets = sum(1 for s in sets if s['p1'] > s['p2'])
-            p2_sets = sum(1 for s in sets if s['p2'] > s['p1'])
-            winner = 'A' if p1_sets > p2_sets else 'B' if p2_sets > p1_sets else None
-            if winner and winner != winner_side:
-                swapped = []
-                for s in sets:
-                    entry = {'p1': s['p2'], 'p2': s['p1']}
-                    if s.get('tiebreak'):
-                        entry['tiebreak'] = {
-                            'p1': s['tiebreak'].get('p2'),
-                            'p2': s['tiebreak'].get('p1')
-                        }
-                    swapped.append(entry)
-                return swapped
-            return sets
+        # Players recur across rounds; resolve each (id, name, country) once per draw
+        player_details_cache = {}
 
         def add_player_details(player):
             if not player:
                 return None
+            cache_key = (player.get('id'), player.get('name') or '', player.get('country'))
+            details = player_details_cache.get(cache_key)
+            if details is None:
+                details = _resolve_player_details(player)
+                player_details_cache[cache_key] = details
+            return dict(details)
+
+        def _resolve_player_details(player):
             name = player.get('name') or ''
             entry = self._match_wta_scraped(name)
             image_url = entry.get('profile', {}).get('image_url') if entry else None
@@ -4544,7 +5955,7 @@ class TennisDataFetcher:
             seed = seed_map.get(str(pid))
             norm_name = self._normalize_player_name(name)
             rank = rank_map.get(norm_name)
-            display_name = _short_name(name)
+            display_name = _short_player_name(name)
             if not seed and rank:
                 seed = rank
             return {
@@ -4557,56 +5968,18 @@ class TennisDataFetcher:
                 'image_url': image_url
             }
 
-        def _build_round_maps(breakdown):
-            points_map = {}
-            prize_map = {}
-            for place in breakdown or []:
-                name = (place.get('name') or '').lower()
-                points = place.get('points')
-                prize = place.get('prize')
-                round_key = None
-                if 'winner' in name:
-                    round_key = 'W'
-                elif 'final' in name and 'semi' not in name:
-                    round_key = 'F'
-                elif 'semi' in name:
-                    round_key = 'SF'
-                elif 'quarter' in name:
-                    round_key = 'QF'
-                elif 'round of 16' in name:
-                    round_key = 'R16'
-                elif 'round of 32' in name:
-                    round_key = 'R32'
-                elif 'round of 64' in name:
-                    round_key = 'R64'
-                elif 'round of 128' in name:
-                    round_key = 'R128'
-
-                if round_key:
-                    if points is not None:
-                        points_map[round_key] = points
-                    if prize:
-                        prize_map[round_key] = prize
-            return points_map, prize_map
-
-        round_points, round_prize = _build_round_maps(draw.get('breakdown') or [])
+        round_points, round_prize = _draw_round_maps(draw.get('breakdown') or [])
 
         draw_results = draw.get('results') or []
 
-        def _parse_date(value):
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except Exception:
-                return None
-
         def _tournament_status():
             status_raw = (tournament.get('status') or '').lower()
-            if status_raw in ['past', 'completed', 'complete', 'finished']:
+            if status_raw in _FINISHED_TOURNAMENT_STATES:
                 return 'finished'
-            if status_raw in ['current', 'in_progress', 'in progress', 'live', 'running']:
+            if status_raw in _IN_PROGRESS_TOURNAMENT_STATES:
                 return 'in_progress'
-            start_dt = _parse_date(tournament.get('start_date') or '')
-            end_dt = _parse_date(tournament.get('end_date') or '')
+            start_dt = _parse_ymd(tournament.get('start_date') or '')
+            end_dt = _parse_ymd(tournament.get('end_date') or '')
             today = datetime.now().date()
             if start_dt and end_dt:
                 if end_dt < today:
@@ -4615,6 +5988,50 @@ class TennisDataFetcher:
                     return 'in_progress'
                 return 'upcoming'
             return 'upcoming'
+
+        def _match_entry(match_id, round_label, idx, player1, player2, score_sets, status, winner, points, prize_money):
+            return {
+                'id': match_id or f"{round_label}_{idx}",
+                'round': round_label,
+                'match_number': idx,
+                'player1': player1,
+                'player2': player2,
+                'score': {'sets': score_sets} if score_sets else None,
+                'status': status,
+                'points': points,
+                'prize_money': prize_money,
+                'winner': winner
+            }
+
+        def _build_match_from_scores(match_obj, round_label, idx, points, prize_money, side_keys=('winner_side', 'winner_slot')):
+            player1 = add_player_details(match_obj.get('player_a') or {})
+            player2 = add_player_details(match_obj.get('player_b') or {})
+            winner_side = None
+            for key in side_keys:
+                winner_side = match_obj.get(key)
+                if winner_side:
+                    break
+            score_sets = _parse_draw_sets(match_obj.get('score_string') or '')
+            score_sets = _align_sets_to_side(score_sets, winner_side)
+            status = 'scheduled'
+            match_state = match_obj.get('match_state')
+            if match_state == 'F':
+                status = 'finished'
+            elif match_state in _LIVE_MATCH_STATES:
+                status = 'live'
+            winner = None
+            if winner_side == 'A':
+                winner = player1
+            elif winner_side == 'B':
+                winner = player2
+            elif status == 'finished' and score_sets:
+                p1_sets, p2_sets = _count_sets(score_sets)
+                if p1_sets > p2_sets:
+                    winner = player1
+                elif p2_sets > p1_sets:
+                    winner = player2
+            return _match_entry(match_obj.get('match_id'), round_label, idx, player1, player2, score_sets, status, winner, points, prize_money)
+
         champion_info = tournament.get('champion') or {}
         champion_name = champion_info.get('name') if isinstance(champion_info, dict) else None
         champion_entry = self._match_wta_scraped(champion_name) if champion_name else None
@@ -4639,12 +6056,7 @@ class TennisDataFetcher:
                 full_rounds = ['QF', 'SF', 'F']
 
             round_ids = [r.get('round_id') for r in draw_results if r.get('round_id') is not None]
-            def _round_sort(val):
-                try:
-                    return int(val)
-                except Exception:
-                    return 0
-            ordered_round_ids = sorted(set(round_ids), key=_round_sort, reverse=True)
+            ordered_round_ids = sorted(set(round_ids), key=_round_id_sort_key, reverse=True)
             round_map = {}
             for idx, rid in enumerate(ordered_round_ids):
                 if idx < len(full_rounds):
@@ -4656,66 +6068,34 @@ class TennisDataFetcher:
                 round_label = round_map.get(str(round_id))
                 if not round_label:
                     continue
-                round_matches = []
                 matches_list = round_block.get('matches') or []
-                def _match_sort_key(item):
-                    match_id = item.get('id') if isinstance(item, dict) else ''
-                    nums = re.findall(r"(\\d+)", match_id or '')
-                    return int(nums[-1]) if nums else 0
-                matches_list = sorted(matches_list, key=_match_sort_key)
+                matches_list = sorted(matches_list, key=_draw_match_sort_key)
+                # Every match in the round yields one entry, so the list is sized up front
+                round_matches = [None] * len(matches_list)
+                points = round_points.get(round_label)
+                prize_money = round_prize.get(round_label)
 
                 for idx, match in enumerate(matches_list, start=1):
                     players = match.get('players') or []
                     player_a = players[0] if len(players) > 0 else {}
                     player_b = players[1] if len(players) > 1 else {}
 
-                    def _to_player(slot):
-                        p = slot.get('player') if isinstance(slot, dict) else None
-                        if not isinstance(p, dict):
-                            return None
-                        return {
-                            'id': p.get('id') or None,
-                            'name': " ".join([p.get('first_name') or '', p.get('last_name') or '']).strip() or slot.get('display') or 'TBD',
-                            'country': p.get('country') or None
-                        }
-
-                    p1 = _to_player(player_a)
-                    p2 = _to_player(player_b)
-                    def _normalize_bye(player):
-                        if not player:
-                            return player
-                        name = (player.get('name') or '').lower()
-                        if 'bye' in name:
-                            player['name'] = 'Bye'
-                        return player
+                    p1 = _draw_slot_player(player_a)
+                    p2 = _draw_slot_player(player_b)
                     p1 = _normalize_bye(p1)
                     p2 = _normalize_bye(p2)
 
-                    p1 = add_player_details(p1 or {})
-                    p2 = add_player_details(p2 or {})
+                    p1 = _bye_player_details(p1) if p1 and p1['name'] == 'Bye' else add_player_details(p1 or {})
+                    p2 = _bye_player_details(p2) if p2 and p2['name'] == 'Bye' else add_player_details(p2 or {})
 
                     score_text = match.get('result_score')
-                    score_sets = parse_sets(score_text)
+                    score_sets = _parse_draw_sets(score_text)
 
                     score_sets = _align_sets_to_side(score_sets, match.get('winner_slot'))
                     status = 'scheduled'
                     if score_sets or match.get('winner_slot'):
                         status = 'finished'
 
-                    def _decide_winner_slot(match_obj, sets):
-                        slot = match_obj.get('winner_slot')
-                        if slot in ('A', 'B'):
-                            return slot
-                        if not sets:
-                            return None
-                        p1_sets = sum(1 for s in sets if s['p1'] > s['p2'])
-                        p2_sets = sum(1 for s in sets if s['p2'] > s['p1'])
-                        if p1_sets > p2_sets:
-                            return 'A'
-                        if p2_sets > p1_sets:
-                            return 'B'
-                        return None
-
                     winner_slot = _decide_winner_slot(match, score_sets)
                     winner = None
                     if winner_slot == 'A':
@@ -4723,56 +6103,9 @@ class TennisDataFetcher:
                     elif winner_slot == 'B':
                         winner = p2
 
-                    round_matches.append({
-                        'id': match.get('id') or f"{round_label}_{idx}",
-                        'round': round_label,
-                        'match_number': idx,
-                        'player1': p1,
-                        'player2': p2,
-                        'score': {'sets': score_sets} if score_sets else None,
-                        'status': status,
-                        'points': round_points.get(round_label),
-                        'prize_money': round_prize.get(round_label),
-                        'winner': winner
-                    })
+                    round_matches[idx - 1] = _match_entry(match.get('id'), round_label, idx, p1, p2, score_sets, status, winner, points, prize_money)
                 bracket_matches.append({'round': round_label, 'matches': round_matches})
 
-            def _build_match_from_scores(match_obj, round_label, idx):
-                player1 = add_player_details(match_obj.get('player_a') or {})
-                player2 = add_player_details(match_obj.get('player_b') or {})
-                score_sets = parse_sets(match_obj.get('score_string') or '')
-                score_sets = _align_sets_to_side(score_sets, match_obj.get('winner_side') or match_obj.get('winner_slot'))
-                status = 'scheduled'
-                if match_obj.get('match_state') == 'F':
-                    status = 'finished'
-                elif match_obj.get('match_state') in ['L', 'IP', 'P']:
-                    status = 'live'
-                winner = None
-                winner_side = match_obj.get('winner_side') or match_obj.get('winner_slot')
-                if winner_side == 'A':
-                    winner = player1
-                elif winner_side == 'B':
-                    winner = player2
-                elif status == 'finished' and score_sets:
-                    p1_sets = sum(1 for s in score_sets if s['p1'] > s['p2'])
-                    p2_sets = sum(1 for s in score_sets if s['p2'] > s['p1'])
-                    if p1_sets > p2_sets:
-                        winner = player1
-                    elif p2_sets > p1_sets:
-                        winner = player2
-                return {
-                    'id': match_obj.get('match_id') or f"{round_label}_{idx}",
-                    'round': round_label,
-                    'match_number': idx,
-                    'player1': player1,
-                    'player2': player2,
-                    'score': {'sets': score_sets} if score_sets else None,
-                    'status': status,
-                    'points': round_points.get(round_label),
-                    'prize_money': round_prize.get(round_label),
-                    'winner': winner
-                }
-
             final_round = next((r for r in bracket_matches if r.get('round') == 'F'), None)
             if not final_round or not final_round.get('matches'):
                 finals = [
@@ -4780,7 +6113,7 @@ class TennisDataFetcher:
                     if m.get('round_id') == 'F' and m.get('draw_match_type') == 'S'
                 ]
                 if finals:
-                    final_match = _build_match_from_scores(finals[0], 'F', 1)
+                    final_match = _build_match_from_scores(finals[0], 'F', 1, round_points.get('F'), round_prize.get('F'))
                     if final_round:
                         final_round['matches'] = [final_match]
                     else:
@@ -4834,54 +6167,23 @@ class TennisDataFetcher:
                 continue
             grouped.setdefault(round_label, []).append(match)
 
-        rounds_order = [label for label in labels if label in grouped]
-        if 'QF' in grouped:
-            rounds_order.append('QF')
-        if 'SF' in grouped:
-            rounds_order.append('SF')
-        if 'F' in grouped:
-            rounds_order.append('F')
+        # Draw labels only run R128..R16, so RR can never already be in the list
+        rounds_order = [label for label in (*labels, 'QF', 'SF', 'F') if label in grouped]
         if 'RR' in grouped:
-            rounds_order = ['RR'] + [r for r in rounds_order if r != 'RR']
-
-        bracket_matches = []
-        for round_label in rounds_order:
-            round_matches = []
-            for idx, match in enumerate(sorted(grouped.get(round_label, []), key=lambda m: m.get('match_id') or ''), start=1):
-                player1 = add_player_details(match.get('player_a') or {})
-                player2 = add_player_details(match.get('player_b') or {})
-                score_sets = parse_sets(match.get('score_string') or '')
-                score_sets = _align_sets_to_side(score_sets, match.get('winner_side'))
-                status = 'scheduled'
-                if match.get('match_state') == 'F':
-                    status = 'finished'
-                elif match.get('match_state') in ['L', 'IP', 'P']:
-                    status = 'live'
-                winner = None
-                if match.get('winner_side') == 'A':
-                    winner = player1
-                elif match.get('winner_side') == 'B':
-                    winner = player2
-                elif status == 'finished' and score_sets:
-                    p1_sets = sum(1 for s in score_sets if s['p1'] > s['p2'])
-                    p2_sets = sum(1 for s in score_sets if s['p2'] > s['p1'])
-                    if p1_sets > p2_sets:
-                        winner = player1
-                    elif p2_sets > p1_sets:
-                        winner = player2
-                round_matches.append({
-                    'id': match.get('match_id') or f"{round_label}_{idx}",
-                    'round': round_label,
-                    'match_number': idx,
-                    'player1': player1,
-                    'player2': player2,
-                    'score': {'sets': score_sets} if score_sets else None,
-                    'status': status,
-                    'points': round_points.get(round_label),
-                    'prize_money': round_prize.get(round_label),
-                    'winner': winner
-                })
-            bracket_matches.append({'round': round_label, 'matches': round_matches})
+            rounds_order.insert(0, 'RR')
+
+        bracket_matches = [None] * len(rounds_order)
+        for round_idx, round_label in enumerate(rounds_order):
+            # grouped lists are built above, so sort them in place; key= computes each key once
+            round_list = grouped.get(round_label, [])
+            round_list.sort(key=_match_id_sort_key)
+            points = round_points.get(round_label)
+            prize_money = round_prize.get(round_label)
+            round_matches = [
+                _build_match_from_scores(match, round_label, idx, points, prize_money, side_keys=('winner_side',))
+                for idx, match in enumerate(round_list, start=1)
+            ]
+            bracket_matches[round_idx] = {'round': round_label, 'matches': round_matches}
 
         return {
             'tournament_id': tournament_id,
@@ -4901,42 +6203,32 @@ class TennisDataFetcher:
         }
 
     def _normalize_wta_level(self, level):
-        upper = (level or "").upper()
-        if "GRAND SLAM" in upper:
-            return 'grand_slam'
-        if "1000" in upper:
-            return 'wta_1000'
-        if "500" in upper:
-            return 'wta_500'
-        if "250" in upper:
-            return 'wta_250'
-        if "125" in upper:
-            return 'wta_125'
-        if "FINALS" in upper:
-            return 'wta_finals'
-        return 'other'
+        return _wta_level_category(level)
+
+    def _read_tournament_files(self, files):
+        """Parse tournament JSON files on a small pool, returning results in file order."""
+        if not files:
+            return []
+        workers = min(TOURNAMENT_FILE_READ_WORKERS, len(files))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='tennis-tournaments') as pool:
+            return list(pool.map(self._read_tournament_file, files))
+
+    @staticmethod
+    def _read_tournament_file(file_path):
+        try:
+            raw = file_path.read_bytes()
+            if not raw:
+                return None
+            tournament = json_loads(raw)
+        except Exception:
+            return None
+        return tournament if isinstance(tournament, dict) else None
 
     def _load_wta_tournaments_from_files(self, year):
         base_dir = Path(__file__).resolve().parent.parent / 'data' / 'wta' / 'tournaments'
         if not base_dir.exists():
             return []
 
-        def _normalize_level(level, name):
-            upper = (level or "").upper()
-            if "GRAND SLAM" in upper or (name in Config.GRAND_SLAMS):
-                return 'grand_slam'
-            if "1000" in upper:
-                return 'wta_1000'
-            if "500" in upper:
-                return 'wta_500'
-            if "250" in upper:
-                return 'wta_250'
-            if "125" in upper:
-                return 'wta_125'
-            if "FINAL" in upper or "FINALS" in upper or "WTA FINALS" in (name or "").upper():
-                return 'wta_finals'
-            return 'other'
-
         def _title_case(value):
             if not value:
                 return ''
@@ -4944,43 +6236,36 @@ class TennisDataFetcher:
                 return value.title()
             return value
 
-        def _parse_date(value):
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except Exception:
-                return None
-
         today = datetime.now().date()
         tournaments = []
         files = sorted(base_dir.glob("*.json"))
-        for file_path in files:
-            try:
-                tournament = json.loads(file_path.read_text(encoding='utf-8'))
-            except Exception:
+        for tournament in self._read_tournament_files(files):
+            if tournament is None:
                 continue
 
             if year and tournament.get('year') and tournament.get('year') != year:
                 continue
 
             title = tournament.get('title') or ''
-            if ' - ' in title:
-                name = title.split(' - ')[0].strip()
+            head, sep, _ = title.partition(' - ')
+            if sep:
+                name = head.strip()
             else:
                 name = tournament.get('name') or title or 'Tournament'
             name = self._clean_tournament_name(name)
             name = _title_case(name)
             level = tournament.get('level') or ''
-            category = _normalize_level(level, name)
+            category = _wta_file_tournament_category(level, name)
 
             start_date = tournament.get('start_date') or ''
             end_date = tournament.get('end_date') or ''
-            start_dt = _parse_date(start_date)
-            end_dt = _parse_date(end_date)
+            start_dt = _parse_ymd(start_date)
+            end_dt = _parse_ymd(end_date)
 
             status_raw = (tournament.get('status') or '').lower()
-            if status_raw in ['past', 'completed', 'complete', 'finished']:
+            if status_raw in _FINISHED_TOURNAMENT_STATES:
                 status = 'finished'
-            elif status_raw in ['current', 'in_progress', 'in progress', 'live', 'running']:
+            elif status_raw in _IN_PROGRESS_TOURNAMENT_STATES:
                 status = 'in_progress'
             else:
                 if start_dt and end_dt:
@@ -5032,19 +6317,11 @@ class TennisDataFetcher:
         if not base_dir.exists():
             return []
 
-        def _parse_date(value):
-            try:
-                return datetime.strptime(value, "%Y-%m-%d").date()
-            except Exception:
-                return None
-
         today = datetime.now().date()
         tournaments = []
         files = sorted(base_dir.glob("*.json"))
-        for file_path in files:
-            try:
-                tournament = json.loads(file_path.read_text(encoding='utf-8'))
-            except Exception:
+        for tournament in self._read_tournament_files(files):
+            if tournament is None:
                 continue
 
             record_year = tournament.get('year')
@@ -5053,13 +6330,13 @@ class TennisDataFetcher:
 
             start_date = tournament.get('start_date') or ''
             end_date = tournament.get('end_date') or ''
-            start_dt = _parse_date(start_date)
-            end_dt = _parse_date(end_date)
+            start_dt = _parse_ymd(start_date)
+            end_dt = _parse_ymd(end_date)
 
             status_raw = str(tournament.get('status') or '').strip().lower()
-            if status_raw in {'past', 'completed', 'complete', 'finished'}:
+            if status_raw in _FINISHED_TOURNAMENT_STATES:
                 status = 'finished'
-            elif status_raw in {'current', 'in_progress', 'in progress', 'live', 'running'}:
+            elif status_raw in _IN_PROGRESS_TOURNAMENT_STATES:
                 status = 'in_progress'
             else:
                 if start_dt and end_dt:
@@ -5112,23 +6389,21 @@ class TennisDataFetcher:
     
     def _generate_sample_live_matches(self, tour):
         """Generate sample live matches data"""
-        atp_players = self._get_sample_atp_players()
-        wta_players = self._get_sample_wta_players()
+        # Only build the player pools this tour filter will draw from
+        atp_players = self._get_sample_atp_players() if tour in ('atp', 'both') else []
+        wta_players = self._get_sample_wta_players() if tour in ('wta', 'both') else []
         
-        atp_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia'},
-            {'name': 'Indian Wells Masters', 'category': 'masters_1000', 'location': 'Indian Wells, USA'},
-            {'name': 'Dubai Tennis Championships', 'category': 'atp_500', 'location': 'Dubai, UAE'},
-        ]
-        wta_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia'},
-            {'name': 'Qatar Open', 'category': 'wta_1000', 'location': 'Doha, Qatar'},
-            {'name': 'Dubai Championships', 'category': 'wta_1000', 'location': 'Dubai, UAE'},
-        ]
+        atp_tournaments = SAMPLE_ATP_LIVE_TOURNAMENTS
+        wta_tournaments = SAMPLE_WTA_LIVE_TOURNAMENTS
         
         matches = []
+        start_time = datetime.now().strftime('%H:%M')
         
         if tour in ['atp', 'both']:
+            # Round, court and server for each of the 3 matches, drawn in batches
+            rounds = random.choices(SAMPLE_LIVE_ROUNDS, k=3)
+            courts = random.choices(range(1, 4), k=3)
+            servers = random.choices((1, 2), k=3)
             for i in range(3):
                 p1 = atp_players[i * 2]
                 p2 = atp_players[i * 2 + 1]
@@ -5141,17 +6416,20 @@ class TennisDataFetcher:
                     'tournament': tournament['name'],
                     'tournament_category': tournament['category'],
                     'location': tournament['location'],
-                    'round': ['R128', 'R64', 'R32', 'R16', 'QF', 'SF', 'F'][random.randint(3, 6)],
-                    'court': f'Court {random.randint(1, 3)}',
+                    'round': rounds[i],
+                    'court': f'Court {courts[i]}',
                     'player1': p1,
                     'player2': p2,
                     'score': self._generate_live_score(best_of=best_of),
                     'status': 'live',
-                    'serving': random.choice([1, 2]),
-                    'start_time': datetime.now().strftime('%H:%M')
+                    'serving': servers[i],
+                    'start_time': start_time
                 })
         
         if tour in ['wta', 'both']:
+            rounds = random.choices(SAMPLE_LIVE_ROUNDS, k=3)
+            courts = random.choices(range(1, 4), k=3)
+            servers = random.choices((1, 2), k=3)
             for i in range(3):
                 p1 = wta_players[i * 2]
                 p2 = wta_players[i * 2 + 1]
@@ -5164,14 +6442,14 @@ class TennisDataFetcher:
                     'tournament': tournament['name'],
                     'tournament_category': tournament['category'],
                     'location': tournament['location'],
-                    'round': ['R64', 'R32', 'R16', 'QF', 'SF', 'F'][random.randint(2, 5)],
-                    'court': f'Court {random.randint(1, 3)}',
+                    'round': rounds[i],
+                    'court': f'Court {courts[i]}',
                     'player1': p1,
                     'player2': p2,
                     'score': self._generate_live_score(best_of=best_of),
                     'status': 'live',
-                    'serving': random.choice([1, 2]),
-                    'start_time': datetime.now().strftime('%H:%M')
+                    'serving': servers[i],
+                    'start_time': start_time
                 })
         
         return matches
@@ -5185,35 +6463,24 @@ class TennisDataFetcher:
         
         # Generate completed sets
         num_completed = random.randint(0, max_sets - 1)
-        for _ in range(num_completed):
-            if random.random() > 0.5:
-                if random.random() > 0.3:
-                    set_score = {'p1': 6, 'p2': random.randint(0, 4)}
-                else:
-                    set_score = {'p1': 7, 'p2': random.choice([5, 6])}
+        for p1_games, p2_games in random.choices(_SET_OUTCOMES, cum_weights=_SET_OUTCOME_CUM_WEIGHTS, k=num_completed):
+            if p1_games > p2_games:
                 p1_sets += 1
             else:
-                if random.random() > 0.3:
-                    set_score = {'p1': random.randint(0, 4), 'p2': 6}
-                else:
-                    set_score = {'p1': random.choice([5, 6]), 'p2': 7}
                 p2_sets += 1
             is_decider = (p1_sets == max_sets) or (p2_sets == max_sets)
-            sets.append(self._apply_tiebreak(set_score, is_decider))
+            sets.append(self._apply_tiebreak({'p1': p1_games, 'p2': p2_games}, is_decider))
         
         # Current set
         if p1_sets < max_sets and p2_sets < max_sets:
-            current_set = {
-                'p1': random.randint(0, 5),
-                'p2': random.randint(0, 5)
-            }
-            sets.append(current_set)
+            p1_games, p2_games = random.choices(range(6), k=2)
+            sets.append({'p1': p1_games, 'p2': p2_games})
         
         # Current game score
-        game_points = ['0', '15', '30', '40', 'AD']
+        p1_points, p2_points = random.choices(('0', '15', '30', '40'), k=2)
         current_game = {
-            'p1': game_points[random.randint(0, 3)],
-            'p2': game_points[random.randint(0, 3)]
+            'p1': p1_points,
+            'p2': p2_points
         }
         
         return {
@@ -5227,44 +6494,32 @@ class TennisDataFetcher:
         """Attach tiebreak scores for 7-6/6-7 sets."""
         if not set_score:
             return set_score
-        p1 = set_score.get('p1')
-        p2 = set_score.get('p2')
-        if (p1, p2) == (7, 6):
-            if is_decider:
-                set_score['tiebreak'] = {'p1': 10, 'p2': random.choice([8, 9])}
-            else:
-                set_score['tiebreak'] = {'p1': 7, 'p2': random.choice([4, 5, 6])}
-        elif (p1, p2) == (6, 7):
-            if is_decider:
-                set_score['tiebreak'] = {'p1': random.choice([8, 9]), 'p2': 10}
-            else:
-                set_score['tiebreak'] = {'p1': random.choice([4, 5, 6]), 'p2': 7}
+        entry = _TIEBREAK.get(((set_score.get('p1'), set_score.get('p2')), bool(is_decider)))
+        if entry:
+            a, b = entry
+            set_score['tiebreak'] = {
+                'p1': a if isinstance(a, int) else random.choice(a),
+                'p2': b if isinstance(b, int) else random.choice(b),
+            }
         return set_score
 
     def _get_best_of(self, tour_name, category):
         """Determine best-of format."""
-        tour = (tour_name or '').upper()
-        if tour == 'ATP' and category == 'grand_slam':
-            return 5
-        return 3
+        return _BEST_OF.get(((tour_name or '').upper(), category), 3)
     
     def _generate_sample_recent_matches(self, tour, limit):
         """Generate sample recently completed matches"""
         matches = []
-        atp_players = self._get_sample_atp_players()
-        wta_players = self._get_sample_wta_players()
+        # Only build the player pools this tour filter will draw from
+        atp_players = self._get_sample_atp_players() if tour in ('atp', 'both') else []
+        wta_players = self._get_sample_wta_players() if tour in ('wta', 'both') else []
         
-        atp_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam'},
-            {'name': 'Rotterdam Open', 'category': 'atp_500'},
-            {'name': 'Qatar Open', 'category': 'atp_250'},
-        ]
-        wta_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam'},
-            {'name': 'Qatar Open', 'category': 'wta_1000'},
-            {'name': 'Doha Open', 'category': 'wta_500'},
-        ]
+        atp_tournaments = SAMPLE_ATP_RECENT_TOURNAMENTS
+        wta_tournaments = SAMPLE_WTA_RECENT_TOURNAMENTS
         
+        now = datetime.now()
+        # Only 24 possible end times; format each at most once per batch
+        end_times = {}
         for i in range(limit):
             if tour == 'atp' or (tour == 'both' and i % 2 == 0):
                 players = atp_players
@@ -5273,28 +6528,30 @@ class TennisDataFetcher:
                 players = wta_players
                 tour_name = 'WTA'
             
-            p1_idx = random.randint(0, len(players) - 1)
-            p2_idx = random.randint(0, len(players) - 1)
-            while p2_idx == p1_idx:
-                p2_idx = random.randint(0, len(players) - 1)
+            p1_idx, p2_idx = random.sample(range(len(players)), 2)
             
             tournament = random.choice(atp_tournaments if tour_name == 'ATP' else wta_tournaments)
             best_of = self._get_best_of(tour_name, tournament['category'])
             final_score = self._generate_final_score(best_of=best_of)
             winner = 1 if final_score['p1_sets'] > final_score['p2_sets'] else 2
+            match_round = random.choice(SAMPLE_MATCH_ROUNDS)
+            hours_ago = random.randint(1, 24)
+            end_time = end_times.get(hours_ago)
+            if end_time is None:
+                end_time = end_times[hours_ago] = (now - timedelta(hours=hours_ago)).strftime('%Y-%m-%d %H:%M')
             
             matches.append({
                 'id': f'recent_{i}',
                 'tour': tour_name,
                 'tournament': tournament['name'],
                 'tournament_category': tournament['category'],
-                'round': random.choice(['R32', 'R16', 'QF', 'SF', 'F']),
-                'player1': players[p1_idx],
-                'player2': players[p2_idx],
+                'round': match_round,
+                'player1': dict(players[p1_idx]),
+                'player2': dict(players[p2_idx]),
                 'winner': winner,
                 'final_score': final_score,
                 'status': 'finished',
-                'end_time': (datetime.now() - timedelta(hours=random.randint(1, 24))).strftime('%Y-%m-%d %H:%M')
+                'end_time': end_time
             })
         
         return matches
@@ -5314,20 +6571,11 @@ class TennisDataFetcher:
             atp_players = []
         
         # Use WTA players
-        wta_players = self._get_sample_wta_players()
+        wta_players = self._get_sample_wta_players() if tour in ('wta', 'both') else []
         
-        atp_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam'},
-            {'name': 'Rotterdam Open', 'category': 'atp_500'},
-            {'name': 'Dubai Championships', 'category': 'atp_500'},
-            {'name': 'Qatar Open', 'category': 'atp_250'},
-        ]
-        wta_tournaments = [
-            {'name': 'Australian Open', 'category': 'grand_slam'},
-            {'name': 'Qatar Open', 'category': 'wta_1000'},
-            {'name': 'Dubai Championships', 'category': 'wta_1000'},
-            {'name': 'Abu Dhabi Open', 'category': 'wta_500'},
-        ]
+        atp_tournaments = SAMPLE_ATP_UPCOMING_TOURNAMENTS
+        wta_tournaments = SAMPLE_WTA_UPCOMING_TOURNAMENTS
+        now = datetime.now()
         
         # Generate 2-4 upcoming matches
         for i in range(random.randint(2, 4)):
@@ -5353,20 +6601,17 @@ class TennisDataFetcher:
             if len(players) < 2:
                 continue
                 
-            p1_idx = random.randint(0, len(players) - 1)
-            p2_idx = random.randint(0, len(players) - 1)
-            while p2_idx == p1_idx:
-                p2_idx = random.randint(0, len(players) - 1)
+            p1_idx, p2_idx = random.sample(range(len(players)), 2)
             
             tournament = random.choice(tournaments)
-            scheduled_time = datetime.now() + timedelta(hours=random.randint(1, days * 24))
+            scheduled_time = now + timedelta(hours=random.randint(1, days * 24))
             
             matches.append({
                 'id': f'upcoming_{tour_name}_{i}',
                 'tour': tour_name,
                 'tournament': tournament['name'],
                 'tournament_category': tournament['category'],
-                'round': random.choice(['R32', 'R16', 'QF', 'SF', 'F']),
+                'round': random.choice(SAMPLE_MATCH_ROUNDS),
                 'player1': dict(players[p1_idx]),
                 'player2': dict(players[p2_idx]),
                 'scheduled_time': scheduled_time.isoformat() + 'Z'
@@ -5381,21 +6626,16 @@ class TennisDataFetcher:
         p2_sets = 0
         max_sets = best_of // 2 + 1
         
-        while p1_sets < max_sets and p2_sets < max_sets:
-            if random.random() > 0.5:
-                if random.random() > 0.3:
-                    set_score = {'p1': 6, 'p2': random.randint(0, 4)}
-                else:
-                    set_score = {'p1': 7, 'p2': random.choice([5, 6])}
+        # Draw the most sets the match can need in one call and play them until it is decided
+        for p1_games, p2_games in random.choices(_SET_OUTCOMES, cum_weights=_SET_OUTCOME_CUM_WEIGHTS, k=best_of):
+            if p1_games > p2_games:
                 p1_sets += 1
             else:
-                if random.random() > 0.3:
-                    set_score = {'p1': random.randint(0, 4), 'p2': 6}
-                else:
-                    set_score = {'p1': random.choice([5, 6]), 'p2': 7}
                 p2_sets += 1
             is_decider = (p1_sets == max_sets) or (p2_sets == max_sets)
-            sets.append(self._apply_tiebreak(set_score, is_decider))
+            sets.append(self._apply_tiebreak({'p1': p1_games, 'p2': p2_games}, is_decider))
+            if is_decider:
+                break
         
         return {'sets': sets, 'p1_sets': p1_sets, 'p2_sets': p2_sets}
     
@@ -5416,6 +6656,16 @@ class TennisDataFetcher:
 
         scraped_index = self._load_wta_scraped_index()
         connections = self._load_wta_connections_map()
+        # Reuse the last parse while the CSV and the scraped files it was joined with are
+        # unchanged; the scraped index is compared by its file fingerprint because
+        # fetch_player_details drops and rebuilds it on every call
+        stat = csv_path.stat()
+        memo_key = (str(csv_path), stat.st_mtime_ns, stat.st_size)
+        scraped_key = scraped_index.get('fingerprint', scraped_index)
+        memo = self._wta_rankings_csv_memo
+        if memo and memo[0] == memo_key and memo[1] == scraped_key and memo[2] is connections:
+            return memo[3]
+
         used_ids = set()
         rankings = []
         with csv_path.open('r', encoding='utf-8') as f:
@@ -5468,26 +6718,26 @@ class TennisDataFetcher:
                 else:
                     used_ids.add(resolved_id)
 
-                points_raw = re.sub(r'[^\d]', '', row.get('points') or '')
+                points_raw = NON_DIGIT_RE.sub('', row.get('points') or '')
                 points = int(points_raw) if points_raw else 0
-                age_raw = re.sub(r'[^\d]', '', row.get('age') or '')
+                age_raw = NON_DIGIT_RE.sub('', row.get('age') or '')
                 age = int(age_raw) if age_raw else None
                 if age is None:
-                    profile_age = re.sub(r'[^\d]', '', str(profile_data.get('age') or ''))
+                    profile_age = NON_DIGIT_RE.sub('', str(profile_data.get('age') or ''))
                     age = int(profile_age) if profile_age else None
 
-                ch_raw = re.sub(r'[^\d]', '', row.get('career_high') or '')
+                ch_raw = NON_DIGIT_RE.sub('', row.get('career_high') or '')
                 career_high = int(ch_raw) if ch_raw else rank
                 at_ch = (row.get('at_career_high') or '').strip().lower() == 'yes'
                 is_new_ch = (row.get('is_new_career_high') or '').strip().lower() == 'yes'
 
                 rank_change_raw = row.get('rank_change') or ''
-                rank_change_clean = re.sub(r'[^-\d]', '', rank_change_raw)
+                rank_change_clean = NON_SIGNED_DIGIT_RE.sub('', rank_change_raw)
                 rank_change = int(rank_change_clean) if rank_change_clean else 0
 
                 current_raw = (row.get('current') or '').strip()
                 points_change = 0
-                if re.match(r'^[+-]\d+$', current_raw):
+                if SIGNED_INT_RE.match(current_raw):
                     points_change = int(current_raw)
 
                 # If rank change looks like points change, move it over
@@ -5539,8 +6789,27 @@ class TennisDataFetcher:
                     'records_summary': records_summary
                 })
 
+        by_id = {}
+        by_rank = {}
+        rank_by_norm = {}
+        for player in rankings:
+            by_id.setdefault(player['id'], player)
+            by_rank.setdefault(player['rank'], player)
+            norm = self._normalize_player_name(player.get('name') or '')
+            if norm and player.get('rank'):
+                rank_by_norm[norm] = player.get('rank')
+        self._wta_rankings_csv_memo = (
+            memo_key, scraped_key, connections, rankings,
+            {'by_id': by_id, 'by_rank': by_rank, 'rank_by_norm': rank_by_norm}
+        )
         return rankings
 
+    def _get_wta_rankings_csv_lookup(self):
+        """Id, rank and normalized-name lookups over the parsed WTA rankings CSV, rebuilt together with it."""
+        if not self._load_wta_rankings_csv():
+            return None
+        return self._wta_rankings_csv_memo[4]
+
     def _load_atp_rankings_csv(self):
         """Load ATP rankings from CSV created by live-tennis.eu scraper."""
         csv_path = self._atp_rankings_csv_path()
@@ -5575,26 +6844,26 @@ class TennisDataFetcher:
                     used_ids
                 )
 
-                points_raw = re.sub(r'[^\d]', '', row.get('points') or '')
+                points_raw = NON_DIGIT_RE.sub('', row.get('points') or '')
                 points = int(points_raw) if points_raw else 0
-                age_raw = re.sub(r'[^\d]', '', row.get('age') or '')
+                age_raw = NON_DIGIT_RE.sub('', row.get('age') or '')
                 age = int(age_raw) if age_raw else None
                 if age is None:
-                    profile_age = re.sub(r'[^\d]', '', str(profile_data.get('age') or ''))
+                    profile_age = NON_DIGIT_RE.sub('', str(profile_data.get('age') or ''))
                     age = int(profile_age) if profile_age else None
 
-                ch_raw = re.sub(r'[^\d]', '', row.get('career_high') or '')
+                ch_raw = NON_DIGIT_RE.sub('', row.get('career_high') or '')
                 career_high = int(ch_raw) if ch_raw else rank
                 at_ch = (row.get('at_career_high') or '').strip().lower() == 'yes'
                 is_new_ch = (row.get('is_new_career_high') or '').strip().lower() == 'yes'
 
                 rank_change_raw = row.get('rank_change') or ''
-                rank_change_clean = re.sub(r'[^-\d]', '', rank_change_raw)
+                rank_change_clean = NON_SIGNED_DIGIT_RE.sub('', rank_change_raw)
                 rank_change = int(rank_change_clean) if rank_change_clean else 0
 
                 current_raw = (row.get('current') or '').strip()
                 points_change = 0
-                if re.match(r'^[+-]\d+$', current_raw):
+                if SIGNED_INT_RE.match(current_raw):
                     points_change = int(current_raw)
                 if abs(rank_change) >= 100:
                     if points_change == 0:
@@ -5656,21 +6925,7 @@ class TennisDataFetcher:
     
     def _get_sample_atp_players(self):
         """Get sample ATP players with real IDs, player codes, and image URLs"""
-        players = [
-            {'id': 4878, 'name': 'Novak Djokovic', 'country': 'SRB', 'rank': 1, 'player_code': 'D643'},
-            {'id': 216431, 'name': 'Carlos Alcaraz', 'country': 'ESP', 'rank': 2, 'player_code': 'A0E2'},
-            {'id': 139170, 'name': 'Jannik Sinner', 'country': 'ITA', 'rank': 3, 'player_code': 'S0AG'},
-            {'id': 38758, 'name': 'Daniil Medvedev', 'country': 'RUS', 'rank': 4, 'player_code': 'MM58'},
-            {'id': 39667, 'name': 'Andrey Rublev', 'country': 'RUS', 'rank': 5, 'player_code': 'RE44'},
-            {'id': 40285, 'name': 'Alexander Zverev', 'country': 'GER', 'rank': 6, 'player_code': 'Z355'},
-            {'id': 124335, 'name': 'Holger Rune', 'country': 'DEN', 'rank': 7, 'player_code': 'R0DG'},
-            {'id': 41379, 'name': 'Stefanos Tsitsipas', 'country': 'GRE', 'rank': 8, 'player_code': 'TE51'},
-            {'id': 59642, 'name': 'Hubert Hurkacz', 'country': 'POL', 'rank': 9, 'player_code': 'HB71'},
-            {'id': 63343, 'name': 'Casper Ruud', 'country': 'NOR', 'rank': 10, 'player_code': 'RH16'},
-        ]
-        for player in players:
-            player['image_url'] = f'https://api.sofascore.com/api/v1/player/{player["id"]}/image'
-        return players
+        return [player.as_dict() for player in SAMPLE_ATP_PLAYERS]
     
     def _get_sample_wta_players(self):
         """Get sample WTA players with current ranking data when available."""
@@ -5687,87 +6942,26 @@ class TennisDataFetcher:
                     'points': player.get('points'),
                     'career_high': player.get('career_high'),
                     'is_career_high': player.get('is_career_high'),
-                    'image_url': player.get('image_url') or f'https://api.sofascore.com/api/v1/player/{player["id"]}/image'
+                    'image_url': player.get('image_url') or sofascore_image_url(player["id"])
                 })
             return players
 
-        players = [
-            {'id': 126388, 'name': 'Iga Swiatek', 'country': 'POL', 'rank': 1},
-            {'id': 83528, 'name': 'Aryna Sabalenka', 'country': 'BLR', 'rank': 2},
-            {'id': 198151, 'name': 'Coco Gauff', 'country': 'USA', 'rank': 3},
-            {'id': 98622, 'name': 'Elena Rybakina', 'country': 'KAZ', 'rank': 4},
-            {'id': 56223, 'name': 'Jessica Pegula', 'country': 'USA', 'rank': 5},
-            {'id': 47320, 'name': 'Ons Jabeur', 'country': 'TUN', 'rank': 6},
-            {'id': 97090, 'name': 'Marketa Vondrousova', 'country': 'CZE', 'rank': 7},
-            {'id': 137839, 'name': 'Qinwen Zheng', 'country': 'CHN', 'rank': 8},
-            {'id': 42043, 'name': 'Maria Sakkari', 'country': 'GRE', 'rank': 9},
-            {'id': 33634, 'name': 'Jelena Ostapenko', 'country': 'LAT', 'rank': 10},
-        ]
-        for player in players:
-            player['image_url'] = f'https://api.sofascore.com/api/v1/player/{player["id"]}/image'
-        return players
+        return [dict(player) for player in SAMPLE_WTA_PLAYERS]
     
     def _get_full_atp_rankings(self):
         """Generate full ATP rankings (top 200)"""
-        top_players = [
-            # id, name, country, age, points, career_high, is_career_high
-            (4878, 'Novak Djokovic', 'SRB', 36, 11245, 1, True),
-            (216431, 'Carlos Alcaraz', 'ESP', 20, 9255, 1, True),
-            (139170, 'Jannik Sinner', 'ITA', 22, 8710, 3, True),
-            (38758, 'Daniil Medvedev', 'RUS', 27, 7165, 1, False),
-            (39667, 'Andrey Rublev', 'RUS', 26, 5110, 5, True),
-            (40285, 'Alexander Zverev', 'GER', 26, 5085, 2, False),
-            (124335, 'Holger Rune', 'DEN', 20, 4210, 4, False),
-            (41379, 'Stefanos Tsitsipas', 'GRE', 25, 4175, 3, False),
-            (59642, 'Hubert Hurkacz', 'POL', 26, 3955, 9, True),
-            (63343, 'Casper Ruud', 'NOR', 25, 3825, 2, False),
-            (59333, 'Taylor Fritz', 'USA', 26, 3505, 11, True),
-            (67580, 'Tommy Paul', 'USA', 26, 3170, 12, True),
-            (247511, 'Ben Shelton', 'USA', 21, 2920, 13, True),
-            (17869, 'Grigor Dimitrov', 'BUL', 32, 2885, 3, False),
-            (67581, 'Felix Auger-Aliassime', 'CAN', 23, 2660, 6, False),
-            (43187, 'Karen Khachanov', 'RUS', 27, 2605, 8, False),
-            (67578, 'Frances Tiafoe', 'USA', 25, 2505, 10, False),
-            (56447, 'Ugo Humbert', 'FRA', 25, 2490, 18, True),
-            (107537, 'Sebastian Korda', 'USA', 23, 2385, 19, True),
-            (60121, 'Nicolas Jarry', 'CHI', 28, 2330, 20, True),
+        movements = random.choices(SAMPLE_TOP_RANKING_MOVEMENTS, k=len(SAMPLE_ATP_RANKING_TOP))
+        rankings = [
+            {**player, 'movement': movement}
+            for player, movement in zip(SAMPLE_ATP_RANKING_TOP, movements)
         ]
         
-        rankings = []
-        for i, (player_id, name, country, age, points, career_high, is_career_high) in enumerate(top_players, 1):
-            movement = random.choice([-2, -1, 0, 0, 0, 1, 1, 2])
-            rankings.append({
-                'rank': i,
-                'id': player_id,
-                'name': name,
-                'country': country,
-                'age': age,
-                'points': points,
-                'career_high': career_high,
-                'is_career_high': is_career_high,
-                'movement': movement,
-                'image_url': f'https://api.sofascore.com/api/v1/player/{player_id}/image'
-            })
-        
-        # Generate remaining players
-        countries = ['USA', 'FRA', 'ESP', 'ITA', 'GER', 'ARG', 'AUS', 'GBR', 'JPN', 'KOR']
-        first_names = ['Alex', 'Marco', 'Pablo', 'John', 'David', 'Lucas', 'Max', 'Leo', 'Hugo', 'Jack']
-        last_names = ['Smith', 'Garcia', 'Muller', 'Martin', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis']
-        
-        for i in range(len(top_players) + 1, 201):
-            player_id = i + 5000 # Use a high, random ID
-            rankings.append({
-                'rank': i,
-                'id': player_id,
-                'name': f'{random.choice(first_names)} {random.choice(last_names)}',
-                'country': random.choice(countries),
-                'age': random.randint(19, 35),
-                'points': max(100, 2300 - (i * 10) + random.randint(-50, 50)),
-                'career_high': random.randint(max(1, i - 50), i),
-                'is_career_high': random.random() > 0.9,
-                'movement': random.choice([-3, -2, -1, 0, 0, 1, 2, 3]),
-                'image_url': f'https://api.sofascore.com/api/v1/player/{player_id}/image'
-            })
+        # Remaining players come from the fillers built at import; only movement is redrawn
+        movements = random.choices(SAMPLE_RANKING_MOVEMENTS, k=len(SAMPLE_ATP_RANKING_FILLERS))
+        rankings.extend(
+            {**player, 'movement': movement}
+            for player, movement in zip(SAMPLE_ATP_RANKING_FILLERS, movements)
+        )
         
         return rankings
     
@@ -5777,285 +6971,105 @@ class TennisDataFetcher:
         if rankings:
             return rankings[:200]
 
-        top_players = [
-            # id, name, country, age, points, career_high, is_career_high
-            (126388, 'Iga Swiatek', 'POL', 22, 10715, 1, True),
-            (83528, 'Aryna Sabalenka', 'BLR', 25, 8725, 1, True),
-            (198151, 'Coco Gauff', 'USA', 19, 6770, 3, True),
-            (98622, 'Elena Rybakina', 'KAZ', 24, 5973, 3, True),
-            (56223, 'Jessica Pegula', 'USA', 29, 5580, 3, False),
-            (47320, 'Ons Jabeur', 'TUN', 29, 4316, 2, False),
-            (97090, 'Marketa Vondrousova', 'CZE', 24, 4075, 7, True),
-            (137839, 'Qinwen Zheng', 'CHN', 21, 4005, 8, True),
-            (42043, 'Maria Sakkari', 'GRE', 28, 3835, 3, False),
-            (42043, 'Jelena Ostapenko', 'LAT', 26, 3438, 5, False),
-            (68979, 'Daria Kasatkina', 'RUS', 26, 3130, 8, False),
-            (24452, 'Madison Keys', 'USA', 28, 2993, 7, False),
-            (82992, 'Liudmila Samsonova', 'RUS', 24, 2985, 11, False),
-            (82992, 'Beatriz Haddad Maia', 'BRA', 27, 2956, 10, False),
-            (88591, 'Karolina Muchova', 'CZE', 27, 2905, 8, False),
-            (64951, 'Ekaterina Alexandrova', 'RUS', 29, 2625, 12, False),
-            (24438, 'Caroline Garcia', 'FRA', 30, 2605, 4, False),
-            (68978, 'Veronika Kudermetova', 'RUS', 26, 2501, 9, False),
-            (88589, 'Barbora Krejcikova', 'CZE', 27, 2436, 2, False),
-            (242137, 'Emma Navarro', 'USA', 22, 2380, 20, True),
+        movements = random.choices(SAMPLE_TOP_RANKING_MOVEMENTS, k=len(SAMPLE_WTA_RANKING_TOP))
+        rankings = [
+            {**player, 'movement': movement}
+            for player, movement in zip(SAMPLE_WTA_RANKING_TOP, movements)
         ]
         
-        rankings = []
-        for i, (player_id, name, country, age, points, career_high, is_career_high) in enumerate(top_players, 1):
-            movement = random.choice([-2, -1, 0, 0, 0, 1, 1, 2])
-            rankings.append({
-                'rank': i,
-                'id': player_id,
-                'name': name,
-                'country': country,
-                'age': age,
-                'points': points,
-                'career_high': career_high,
-                'is_career_high': is_career_high,
-                'movement': movement,
-                'image_url': f'https://api.sofascore.com/api/v1/player/{player_id}/image'
-            })
-        
-        # Generate remaining players
-        countries = ['USA', 'FRA', 'ESP', 'ITA', 'GER', 'RUS', 'AUS', 'GBR', 'JPN', 'CHN']
-        first_names = ['Anna', 'Maria', 'Emma', 'Sofia', 'Elena', 'Victoria', 'Anastasia', 'Nina', 'Sara', 'Julia']
-        last_names = ['Smith', 'Garcia', 'Muller', 'Martin', 'Johnson', 'Williams', 'Brown', 'Jones', 'Miller', 'Davis']
-        
-        for i in range(len(top_players) + 1, 201):
-            player_id = i + 10000 # Use a high, random ID
-            rankings.append({
-                'rank': i,
-                'id': player_id,
-                'name': f'{random.choice(first_names)} {random.choice(last_names)}',
-                'country': random.choice(countries),
-                'age': random.randint(17, 34),
-                'points': max(50, 2300 - (i * 10) + random.randint(-50, 50)),
-                'career_high': random.randint(max(1, i - 50), i),
-                'is_career_high': random.random() > 0.9,
-                'movement': random.choice([-3, -2, -1, 0, 0, 1, 2, 3]),
-                'image_url': f'https://api.sofascore.com/api/v1/player/{player_id}/image'
-            })
+        # Remaining players come from the fillers built at import; only movement is redrawn
+        movements = random.choices(SAMPLE_RANKING_MOVEMENTS, k=len(SAMPLE_WTA_RANKING_FILLERS))
+        rankings.extend(
+            {**player, 'movement': movement}
+            for player, movement in zip(SAMPLE_WTA_RANKING_FILLERS, movements)
+        )
         
         return rankings
     
     def _generate_sample_tournaments(self, tour, year):
-        """Generate sample tournament calendar"""
-        tournaments = []
-        
-        if tour == 'atp':
-            tournament_data = [
-                # Grand Slams
-                {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia',
-                 'start': f'{year}-01-14', 'end': f'{year}-01-28', 'surface': 'Hard'},
-                {'name': 'Roland Garros', 'category': 'grand_slam', 'location': 'Paris, France',
-                 'start': f'{year}-05-26', 'end': f'{year}-06-09', 'surface': 'Clay'},
-                {'name': 'Wimbledon', 'category': 'grand_slam', 'location': 'London, UK',
-                 'start': f'{year}-07-01', 'end': f'{year}-07-14', 'surface': 'Grass'},
-                {'name': 'US Open', 'category': 'grand_slam', 'location': 'New York, USA',
-                 'start': f'{year}-08-26', 'end': f'{year}-09-08', 'surface': 'Hard'},
-                # Masters 1000
-                {'name': 'Indian Wells Masters', 'category': 'masters_1000', 'location': 'Indian Wells, USA',
-                 'start': f'{year}-03-06', 'end': f'{year}-03-17', 'surface': 'Hard'},
-                {'name': 'Miami Open', 'category': 'masters_1000', 'location': 'Miami, USA',
-                 'start': f'{year}-03-20', 'end': f'{year}-03-31', 'surface': 'Hard'},
-                {'name': 'Monte-Carlo Masters', 'category': 'masters_1000', 'location': 'Monte Carlo, Monaco',
-                 'start': f'{year}-04-07', 'end': f'{year}-04-14', 'surface': 'Clay'},
-                {'name': 'Madrid Open', 'category': 'masters_1000', 'location': 'Madrid, Spain',
-                 'start': f'{year}-04-25', 'end': f'{year}-05-05', 'surface': 'Clay'},
-                {'name': 'Italian Open', 'category': 'masters_1000', 'location': 'Rome, Italy',
-                 'start': f'{year}-05-08', 'end': f'{year}-05-19', 'surface': 'Clay'},
-                {'name': 'Canadian Open', 'category': 'masters_1000', 'location': 'Toronto/Montreal, Canada',
-                 'start': f'{year}-08-05', 'end': f'{year}-08-11', 'surface': 'Hard'},
-                {'name': 'Cincinnati Masters', 'category': 'masters_1000', 'location': 'Cincinnati, USA',
-                 'start': f'{year}-08-12', 'end': f'{year}-08-18', 'surface': 'Hard'},
-                {'name': 'Shanghai Masters', 'category': 'masters_1000', 'location': 'Shanghai, China',
-                 'start': f'{year}-10-02', 'end': f'{year}-10-13', 'surface': 'Hard'},
-                {'name': 'Paris Masters', 'category': 'masters_1000', 'location': 'Paris, France',
-                 'start': f'{year}-10-28', 'end': f'{year}-11-03', 'surface': 'Hard (Indoor)'},
-                # ATP 500
-                {'name': 'Rotterdam Open', 'category': 'atp_500', 'location': 'Rotterdam, Netherlands',
-                 'start': f'{year}-02-05', 'end': f'{year}-02-11', 'surface': 'Hard (Indoor)'},
-                {'name': 'Dubai Tennis Championships', 'category': 'atp_500', 'location': 'Dubai, UAE',
-                 'start': f'{year}-02-26', 'end': f'{year}-03-02', 'surface': 'Hard'},
-                {'name': 'Barcelona Open', 'category': 'atp_500', 'location': 'Barcelona, Spain',
-                 'start': f'{year}-04-15', 'end': f'{year}-04-21', 'surface': 'Clay'},
-                {'name': "Queen's Club Championships", 'category': 'atp_500', 'location': 'London, UK',
-                 'start': f'{year}-06-17', 'end': f'{year}-06-23', 'surface': 'Grass'},
-                {'name': 'Halle Open', 'category': 'atp_500', 'location': 'Halle, Germany',
-                 'start': f'{year}-06-17', 'end': f'{year}-06-23', 'surface': 'Grass'},
-                {'name': 'Washington Open', 'category': 'atp_500', 'location': 'Washington D.C., USA',
-                 'start': f'{year}-07-29', 'end': f'{year}-08-04', 'surface': 'Hard'},
-                {'name': 'Tokyo Open', 'category': 'atp_500', 'location': 'Tokyo, Japan',
-                 'start': f'{year}-09-25', 'end': f'{year}-10-01', 'surface': 'Hard'},
-                {'name': 'Basel Open', 'category': 'atp_500', 'location': 'Basel, Switzerland',
-                 'start': f'{year}-10-21', 'end': f'{year}-10-27', 'surface': 'Hard (Indoor)'},
-                {'name': 'Vienna Open', 'category': 'atp_500', 'location': 'Vienna, Austria',
-                 'start': f'{year}-10-21', 'end': f'{year}-10-27', 'surface': 'Hard (Indoor)'},
-                # ATP 250
-                {'name': 'Brisbane International', 'category': 'atp_250', 'location': 'Brisbane, Australia',
-                 'start': f'{year}-01-01', 'end': f'{year}-01-07', 'surface': 'Hard'},
-                {'name': 'Adelaide International', 'category': 'atp_250', 'location': 'Adelaide, Australia',
-                 'start': f'{year}-01-08', 'end': f'{year}-01-13', 'surface': 'Hard'},
-                {'name': 'Montpellier Open', 'category': 'atp_250', 'location': 'Montpellier, France',
-                 'start': f'{year}-02-05', 'end': f'{year}-02-11', 'surface': 'Hard (Indoor)'},
-                {'name': 'Dallas Open', 'category': 'atp_250', 'location': 'Dallas, USA',
-                 'start': f'{year}-02-05', 'end': f'{year}-02-11', 'surface': 'Hard (Indoor)'},
-                {'name': 'Lyon Open', 'category': 'atp_250', 'location': 'Lyon, France',
-                 'start': f'{year}-05-20', 'end': f'{year}-05-25', 'surface': 'Clay'},
-                {'name': 'Stuttgart Open', 'category': 'atp_250', 'location': 'Stuttgart, Germany',
-                 'start': f'{year}-06-10', 'end': f'{year}-06-16', 'surface': 'Grass'},
-                {'name': 'Eastbourne International', 'category': 'atp_250', 'location': 'Eastbourne, UK',
-                 'start': f'{year}-06-24', 'end': f'{year}-06-29', 'surface': 'Grass'},
-                {'name': 'Atlanta Open', 'category': 'atp_250', 'location': 'Atlanta, USA',
-                 'start': f'{year}-07-22', 'end': f'{year}-07-28', 'surface': 'Hard'},
-                {'name': 'Winston-Salem Open', 'category': 'atp_250', 'location': 'Winston-Salem, USA',
-                 'start': f'{year}-08-19', 'end': f'{year}-08-24', 'surface': 'Hard'},
-                {'name': 'Chengdu Open', 'category': 'atp_250', 'location': 'Chengdu, China',
-                 'start': f'{year}-09-16', 'end': f'{year}-09-22', 'surface': 'Hard'},
-                {'name': 'Stockholm Open', 'category': 'atp_250', 'location': 'Stockholm, Sweden',
-                 'start': f'{year}-10-14', 'end': f'{year}-10-20', 'surface': 'Hard (Indoor)'},
-                {'name': 'Antwerp Open', 'category': 'atp_250', 'location': 'Antwerp, Belgium',
-                 'start': f'{year}-10-14', 'end': f'{year}-10-20', 'surface': 'Hard (Indoor)'},
-            ]
-        else:
-            tournament_data = [
-                # Grand Slams
-                {'name': 'Australian Open', 'category': 'grand_slam', 'location': 'Melbourne, Australia',
-                 'start': f'{year}-01-14', 'end': f'{year}-01-28', 'surface': 'Hard'},
-                {'name': 'Roland Garros', 'category': 'grand_slam', 'location': 'Paris, France',
-                 'start': f'{year}-05-26', 'end': f'{year}-06-09', 'surface': 'Clay'},
-                {'name': 'Wimbledon', 'category': 'grand_slam', 'location': 'London, UK',
-                 'start': f'{year}-07-01', 'end': f'{year}-07-14', 'surface': 'Grass'},
-                {'name': 'US Open', 'category': 'grand_slam', 'location': 'New York, USA',
-                 'start': f'{year}-08-26', 'end': f'{year}-09-08', 'surface': 'Hard'},
-                # WTA 1000
-                {'name': 'Qatar Open', 'category': 'wta_1000', 'location': 'Doha, Qatar',
-                 'start': f'{year}-02-10', 'end': f'{year}-02-17', 'surface': 'Hard'},
-                {'name': 'Dubai Championships', 'category': 'wta_1000', 'location': 'Dubai, UAE',
-                 'start': f'{year}-02-19', 'end': f'{year}-02-25', 'surface': 'Hard'},
-                {'name': 'Indian Wells Open', 'category': 'wta_1000', 'location': 'Indian Wells, USA',
-                 'start': f'{year}-03-06', 'end': f'{year}-03-17', 'surface': 'Hard'},
-                {'name': 'Miami Open', 'category': 'wta_1000', 'location': 'Miami, USA',
-                 'start': f'{year}-03-20', 'end': f'{year}-03-31', 'surface': 'Hard'},
-                {'name': 'Madrid Open', 'category': 'wta_1000', 'location': 'Madrid, Spain',
-                 'start': f'{year}-04-25', 'end': f'{year}-05-05', 'surface': 'Clay'},
-                {'name': 'Italian Open', 'category': 'wta_1000', 'location': 'Rome, Italy',
-                 'start': f'{year}-05-08', 'end': f'{year}-05-19', 'surface': 'Clay'},
-                {'name': 'Canadian Open', 'category': 'wta_1000', 'location': 'Toronto/Montreal, Canada',
-                 'start': f'{year}-08-05', 'end': f'{year}-08-11', 'surface': 'Hard'},
-                {'name': 'Cincinnati Open', 'category': 'wta_1000', 'location': 'Cincinnati, USA',
-                 'start': f'{year}-08-12', 'end': f'{year}-08-18', 'surface': 'Hard'},
-                {'name': 'Wuhan Open', 'category': 'wta_1000', 'location': 'Wuhan, China',
-                 'start': f'{year}-09-21', 'end': f'{year}-09-29', 'surface': 'Hard'},
-                {'name': 'Beijing Open', 'category': 'wta_1000', 'location': 'Beijing, China',
-                 'start': f'{year}-10-01', 'end': f'{year}-10-08', 'surface': 'Hard'},
-                # WTA 500
-                {'name': 'Adelaide International', 'category': 'wta_500', 'location': 'Adelaide, Australia',
-                 'start': f'{year}-01-08', 'end': f'{year}-01-13', 'surface': 'Hard'},
-                {'name': 'Stuttgart Open', 'category': 'wta_500', 'location': 'Stuttgart, Germany',
-                 'start': f'{year}-04-15', 'end': f'{year}-04-21', 'surface': 'Clay'},
-                {'name': 'Berlin Open', 'category': 'wta_500', 'location': 'Berlin, Germany',
-                 'start': f'{year}-06-17', 'end': f'{year}-06-23', 'surface': 'Grass'},
-                {'name': 'Eastbourne International', 'category': 'wta_500', 'location': 'Eastbourne, UK',
-                 'start': f'{year}-06-24', 'end': f'{year}-06-29', 'surface': 'Grass'},
-                {'name': 'San Diego Open', 'category': 'wta_500', 'location': 'San Diego, USA',
-                 'start': f'{year}-09-09', 'end': f'{year}-09-15', 'surface': 'Hard'},
-                # WTA 250
-                {'name': 'Hobart International', 'category': 'wta_250', 'location': 'Hobart, Australia',
-                 'start': f'{year}-01-08', 'end': f'{year}-01-13', 'surface': 'Hard'},
-                {'name': 'Auckland Open', 'category': 'wta_250', 'location': 'Auckland, New Zealand',
-                 'start': f'{year}-01-01', 'end': f'{year}-01-07', 'surface': 'Hard'},
-                {'name': 'Linz Open', 'category': 'wta_250', 'location': 'Linz, Austria',
-                 'start': f'{year}-01-27', 'end': f'{year}-02-02', 'surface': 'Hard (Indoor)'},
-                {'name': 'Charleston Open', 'category': 'wta_250', 'location': 'Charleston, USA',
-                 'start': f'{year}-04-01', 'end': f'{year}-04-07', 'surface': 'Clay'},
-                {'name': 'Seoul Open', 'category': 'wta_250', 'location': 'Seoul, South Korea',
-                 'start': f'{year}-09-16', 'end': f'{year}-09-22', 'surface': 'Hard'},
-            ]
-        
+        """
+        Generate sample tournament calendar. Memoized per (tour, year) for the
+        current day, since statuses only change when the date does.
+        """
+        return self._sample_tournaments_entry(tour, year)[0]
+
+    def _sample_tournaments_entry(self, tour, year):
+        """(tournaments, by_id) for the memoized sample calendar, rebuilt when stale or evicted"""
         today = datetime.now().date()
+        with self._sample_tournaments_lock:
+            memo = self._sample_tournaments_memo.get((tour, year))
+        if memo and memo[0] == today:
+            return memo[1], memo[2]
+
+        tournaments = []
         
-        for i, t in enumerate(tournament_data):
-            start_date = datetime.strptime(t['start'], '%Y-%m-%d').date()
-            end_date = datetime.strptime(t['end'], '%Y-%m-%d').date()
-            
-            if end_date < today:
-                status = 'finished'
-                # Generate winners for finished tournaments
-                if tour == 'atp':
-                    winner = random.choice(self._get_sample_atp_players())
-                    runner_up = random.choice(self._get_sample_atp_players())
-                    while runner_up['id'] == winner['id']:
-                        runner_up = random.choice(self._get_sample_atp_players())
-                else:
-                    winner = random.choice(self._get_sample_wta_players())
-                    runner_up = random.choice(self._get_sample_wta_players())
-                    while runner_up['id'] == winner['id']:
-                        runner_up = random.choice(self._get_sample_wta_players())
-            elif start_date <= today <= end_date:
-                status = 'in_progress'
-                winner = None
-                runner_up = None
-            else:
-                status = 'upcoming'
-                # Show last year's winner for upcoming tournaments
-                if tour == 'atp':
-                    winner = random.choice(self._get_sample_atp_players())
-                    runner_up = random.choice(self._get_sample_atp_players())
-                    while runner_up['id'] == winner['id']:
-                        runner_up = random.choice(self._get_sample_atp_players())
-                else:
-                    winner = random.choice(self._get_sample_wta_players())
-                    runner_up = random.choice(self._get_sample_wta_players())
-                    while runner_up['id'] == winner['id']:
-                        runner_up = random.choice(self._get_sample_wta_players())
-            
+        tournament_data = SAMPLE_ATP_TOURNAMENTS if tour == 'atp' else SAMPLE_WTA_TOURNAMENTS
+
+        pool = self._get_sample_atp_players() if tour == 'atp' else self._get_sample_wta_players()
+        finalists = self._pick_finalist_pairs(pool, len(tournament_data))
+        tour_upper = tour.upper()
+        today_ord = today.toordinal()
+
+        for i, (t, (start_ord, end_ord, start_iso, end_iso)) in enumerate(
+            zip(tournament_data, _sample_calendar_dates(tour, year))
+        ):
+            status = SAMPLE_TOURNAMENT_STATUSES[(today_ord > end_ord) - (today_ord < start_ord) + 1]
+
+            # Upcoming tournaments show last year's winner
+            winner = None
+            runner_up = None
+            if status != 'in_progress':
+                winner, runner_up = finalists[i]
+
             tournaments.append({
-                'id': i + 1,
+                'id': t['id'],
                 'name': t['name'],
                 'category': t['category'],
                 'location': t['location'],
-                'start_date': t['start'],
-                'end_date': t['end'],
+                'start_date': start_iso,
+                'end_date': end_iso,
                 'surface': t['surface'],
                 'status': status,
                 'winner': winner,
                 'runner_up': runner_up,
-                'tour': tour.upper()
+                'tour': tour_upper
             })
-        
-        # Sort by start date
-        tournaments.sort(key=lambda x: x['start_date'])
-        
-        return tournaments
+
+        by_id = {t['id']: t for t in tournaments}
+        with self._sample_tournaments_lock:
+            self._sample_tournaments_memo[(tour, year)] = (today, tournaments, by_id)
+        return tournaments, by_id
+
+    def _get_sample_tournament(self, tour, year, tournament_id):
+        """Look up one sample tournament by id via the memoized calendar's index"""
+        return self._sample_tournaments_entry(tour, year)[1].get(tournament_id)
     
+    def _pick_finalist_pairs(self, players, count):
+        """
+        (winner, runner_up) pairs for `count` tournaments in two batched draws;
+        the runner-up is offset from the winner by 1..n-1 so a pair is never
+        the same player
+        """
+        pool_size = len(players)
+        if pool_size < 2:
+            return [(None, None)] * count
+        winner_picks = random.choices(range(pool_size), k=count)
+        runner_up_offsets = random.choices(range(1, pool_size), k=count)
+        return [
+            (players[w], players[(w + offset) % pool_size])
+            for w, offset in zip(winner_picks, runner_up_offsets)
+        ]
+
     def _generate_sample_bracket(self, tournament_id, tour='atp'):
         """Generate sample tournament bracket"""
-        year = datetime.now().year
-        tournaments = self._generate_sample_tournaments(tour, year)
-        tournament = next((t for t in tournaments if t['id'] == tournament_id), None)
+        tournament = self._get_sample_tournament(tour, datetime.now().year, tournament_id)
         category = tournament['category'] if tournament else 'atp_250'
         surface = tournament['surface'] if tournament else 'Hard'
         name = tournament['name'] if tournament else f'Tournament {tournament_id}'
 
-        # Determine bracket size by category
-        if category == 'grand_slam':
-            draw_size = 128
-        elif category == 'masters_1000':
-            draw_size = 64
-        elif category == 'finals':
-            draw_size = 8
-        else:
-            draw_size = 32
-        
-        rounds = ['R128', 'R64', 'R32', 'R16', 'QF', 'SF', 'F']
-        if draw_size == 64:
-            rounds = ['R64', 'R32', 'R16', 'QF', 'SF', 'F']
-        elif draw_size == 32:
-            rounds = ['R32', 'R16', 'QF', 'SF', 'F']
-        elif draw_size == 8:
-            rounds = ['QF', 'SF', 'F']
+        # Determine bracket size and round layout by category
+        draw_size = SAMPLE_DRAW_SIZES.get(category, 32)
+        structure = _BRACKET_STRUCTURE[draw_size]
         
         bracket = {
             'tournament_id': tournament_id,
@@ -6063,92 +7077,90 @@ class TennisDataFetcher:
             'tournament_category': category,
             'tournament_surface': surface,
             'draw_size': draw_size,
-            'rounds': rounds,
+            'rounds': [round_name for round_name, _, _ in structure],
             'matches': []
         }
         
-        # Generate seeded players (top 32)
+        # Generate seeded players (top 32), copied so the rankings pool stays untouched,
+        # and padded with empty slots so the draw can be indexed directly
         players = self._get_full_atp_rankings()[:draw_size] if tour == 'atp' else self._get_full_wta_rankings()[:draw_size]
-        seeds = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16,
-                 17, 18, 19, 20, 21, 22, 23, 24, 25, 26, 27, 28, 29, 30, 31, 32]
-        
-        # Generate first round matches
-        match_id = 1
-        matches_per_round = draw_size // 2
-        
-        for round_idx, round_name in enumerate(rounds):
-            round_matches = []
-            
-            for i in range(matches_per_round):
-                if round_idx == 0:
-                    # First round - assign players
-                    p1_idx = i * 2
-                    p2_idx = i * 2 + 1
-                    p1 = players[p1_idx] if p1_idx < len(players) else None
-                    p2 = players[p2_idx] if p2_idx < len(players) else None
-                    
-                    # Add seed info
-                    if p1 and p1['rank'] <= 32:
-                        p1['seed'] = p1['rank']
-                    if p2 and p2['rank'] <= 32:
-                        p2['seed'] = p2['rank']
-                    
-                    status = 'finished' if random.random() > 0.3 else 'scheduled'
-                    winner = None
-                    score = None
-                    if p1 and p2 and status == 'finished':
-                        best_of = self._get_best_of('ATP' if tour == 'atp' else 'WTA', category)
-                        score = self._generate_final_score(best_of=best_of)
-                        winner = p1 if score['p1_sets'] > score['p2_sets'] else p2
-                    
-                    round_matches.append({
-                        'id': match_id,
-                        'round': round_name,
-                        'match_number': i + 1,
-                        'player1': p1,
-                        'player2': p2,
-                        'winner': winner,
-                        'score': score,
-                        'status': status
-                    })
-                else:
-                    # Later rounds - winners from previous round
-                    round_matches.append({
-                        'id': match_id,
-                        'round': round_name,
-                        'match_number': i + 1,
-                        'player1': None,  # Would be filled from previous round
-                        'player2': None,
-                        'winner': None,
-                        'score': None,
-                        'status': 'scheduled'
-                    })
-                
-                match_id += 1
-            
-            bracket['matches'].extend(round_matches)
-            matches_per_round = matches_per_round // 2
-        
+        players = [{**p, 'seed': p['rank'] if p['rank'] <= 32 else None} for p in players]
+        players.extend([None] * (draw_size - len(players)))
+
+        first_round, first_count, _ = structure[0]
+        # Draw every first-round status in one call (70% finished, 30% scheduled)
+        finished_mask = random.choices((True, False), weights=(7, 3), k=first_count)
+        best_of = self._get_best_of('ATP' if tour == 'atp' else 'WTA', category)
+        pairs = list(zip(players[0::2], players[1::2]))
+        # Every finished match with two players needs a score; generate them up front in one burst
+        played = [bool(finished and p1 and p2) for (p1, p2), finished in zip(pairs, finished_mask)]
+        scores = iter([self._generate_final_score(best_of=best_of) for _ in range(sum(played))])
+
+        # First round - assign players
+        round_matches = []
+        for i, ((p1, p2), finished) in enumerate(zip(pairs, finished_mask)):
+            status = 'finished' if finished else 'scheduled'
+            winner = None
+            score = None
+            if played[i]:
+                score = next(scores)
+                winner = (p2, p1)[score['p1_sets'] > score['p2_sets']]
+
+            round_matches.append({
+                'id': i + 1,
+                'round': first_round,
+                'match_number': i + 1,
+                'player1': p1,
+                'player2': p2,
+                'winner': winner,
+                'score': score,
+                'status': status
+            })
+        bracket['matches'].extend(round_matches)
+
+        # Later rounds - winners from previous round, filled in as play progresses
+        bracket['matches'].extend(
+            {
+                'id': first_id + i,
+                'round': round_name,
+                'match_number': i + 1,
+                'player1': None,
+                'player2': None,
+                'winner': None,
+                'score': None,
+                'status': 'scheduled'
+            }
+            for round_name, count, first_id in structure[1:]
+            for i in range(count)
+        )
+
         return bracket
     
     def _generate_sample_player(self, player_id):
         """Generate sample player details"""
-        if player_id <= 100:
-            # ATP player
-            rankings = self._get_full_atp_rankings()
-            player = next((p for p in rankings if p['id'] == player_id), None)
-            tour = 'ATP'
-        else:
-            # WTA player
-            rankings = self._get_full_wta_rankings()
-            player = next((p for p in rankings if p['id'] == player_id), None)
-            tour = 'WTA'
-        
+        # Same sources as the full rankings: WTA rows come from the rankings CSV when it exists
+        wta_lookup = self._get_wta_rankings_csv_lookup()
+        by_tour = {
+            'ATP': SAMPLE_RANKINGS_BY_ID['ATP'],
+            'WTA': wta_lookup['by_id'] if wta_lookup else SAMPLE_RANKINGS_BY_ID['WTA'],
+        }
+        # ATP ids are <= 100, everything else is WTA
+        tour = 'ATP' if player_id <= 100 else 'WTA'
+        player = by_tour[tour].get(player_id)
         if not player:
             return None
-        
+
+        # Import-time sample rows carry a placeholder movement; draw it from the
+        # table the full rankings use for that row
+        if player is SAMPLE_RANKINGS_BY_ID[tour].get(player_id):
+            top = player_id in SAMPLE_TOP_RANKING_IDS[tour]
+            movement = random.choice(SAMPLE_TOP_RANKING_MOVEMENTS if top else SAMPLE_RANKING_MOVEMENTS)
+        else:
+            movement = player.get('movement')
+
         return {
             **player,
+            'movement': movement,
             'tour': tour,
             'height': f"{random.randint(170, 200)} cm",
             'plays': random.choice(['Right-Handed', 'Left-Handed']),
@@ -6156,9 +7168,27 @@ class TennisDataFetcher:
             'titles': random.randint(0, 30),
             'prize_money': f"${random.randint(1, 150)},{random.randint(100, 999)},{random.randint(100, 999)}",
             'biography': f"Professional tennis player from {player['country']}.",
-            'image_url': f'https://api.sofascore.com/api/v1/player/{player_id}/image'
+            'image_url': sofascore_image_url(player_id)
         }
 
 
-# Singleton instance
-tennis_fetcher = TennisDataFetcher()
+_tennis_fetcher = None
+_tennis_fetcher_lock = threading.Lock()
+
+
+def get_tennis_fetcher():
+    """Shared fetcher, created on first use rather than at import"""
+    global _tennis_fetcher
+    if _tennis_fetcher is None:
+        # Double-checked so concurrent first callers share one fetcher and its executors
+        with _tennis_fetcher_lock:
+            if _tennis_fetcher is None:
+                _tennis_fetcher = TennisDataFetcher()
+                # Build the WTA name indexes in the background so the first
+                # match request does not pay for them
+                threading.Thread(
+                    target=_tennis_fetcher.warm_wta_indexes,
+                    name='tennis-wta-warmup',
+                    daemon=True
+                ).start()
+    return _tennis_fetcher
@@ -0,0 +1,26 @@
+import os
+import sys
+import unittest
+from datetime import date
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import app as app_module  # noqa: E402
+
+
+@unittest.skipUnless(app_module.HAS_ORJSON, 'orjson is not installed')
+class OrjsonJSONProviderTest(unittest.TestCase):
+    def test_response_bytes(self):
+        payload = {'tour': 'wta', 'player': 'Beatriz Haddad Maia', 'city': 'São Paulo',
+                   'rank': 14, 'date': date(2024, 1, 15)}
+        with app_module.app.test_request_context():
+            response = app_module.app.json.response(payload)
+        self.assertEqual(
+            response.get_data(),
+            b'{"city":"S\xc3\xa3o Paulo","date":"Mon, 15 Jan 2024 00:00:00 GMT",'
+            b'"player":"Beatriz Haddad Maia","rank":14,"tour":"wta"}\n',
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
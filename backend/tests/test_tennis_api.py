@@ -0,0 +1,66 @@
+import csv
+import os
+import sys
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import tennis_api  # noqa: E402
+from tennis_api import TennisDataFetcher  # noqa: E402
+
+
+RANKINGS_CSV = (
+    "rank,player,country,age,points\n"
+    "1,Iga Swiatek,POL,22,\"10,715\"\n"
+    "2,Aryna Sabalenka,BLR,25,\"8,725\"\n"
+)
+
+
+def _empty_scraped_index(fingerprint):
+    return {
+        'by_full': {},
+        'by_last_first': {},
+        'by_last': {},
+        'by_player_id': {},
+        'full_keys_by_len': {},
+        'players': [],
+        'fingerprint': fingerprint,
+    }
+
+
+class WtaRankingsCsvMemoTest(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.csv_path = Path(self.tmp.name) / 'wta_live_ranking.csv'
+        self.csv_path.write_text(RANKINGS_CSV, encoding='utf-8')
+        self.fetcher = TennisDataFetcher()
+        self.fetcher._wta_rankings_csv_path = lambda: self.csv_path
+        self.fetcher._wta_connections_map = {'by_norm': {}, 'by_player_id': {}}
+        # Every rebuild yields a new index object over the same files, as happens
+        # when fetch_player_details drops the scraped index
+        self.fetcher._build_wta_scraped_index = lambda: _empty_scraped_index(('wta', 'unchanged'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_player_details_parse_rankings_csv_once(self):
+        with mock.patch.object(tennis_api.csv, 'DictReader', wraps=csv.DictReader) as reader:
+            first = self.fetcher.fetch_player_details(100001)
+            second = self.fetcher.fetch_player_details(100002)
+        self.assertEqual(first['name'], 'Iga Swiatek')
+        self.assertEqual(second['name'], 'Aryna Sabalenka')
+        self.assertEqual(reader.call_count, 1)
+
+    def test_changed_scraped_files_reparse_rankings_csv(self):
+        with mock.patch.object(tennis_api.csv, 'DictReader', wraps=csv.DictReader) as reader:
+            self.fetcher.fetch_player_details(100001)
+            self.fetcher._build_wta_scraped_index = lambda: _empty_scraped_index(('wta', 'changed'))
+            self.fetcher.fetch_player_details(100001)
+        self.assertEqual(reader.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,35 +8,11 @@ import json
 import sys
 from typing import Any, Dict, List
 
-import requests
-
-WTA_GLOBAL_MATCHES_URL = "https://api.wtatennis.com/tennis/matches/global"
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    "Referer": "https://www.wtatennis.com/scores?type=S",
-}
-
-
-def fetch_global_matches(timeout: int) -> List[Dict[str, Any]]:
-    response = requests.get(WTA_GLOBAL_MATCHES_URL, headers=HEADERS, timeout=timeout)
-    response.raise_for_status()
-    data = response.json()
-    if isinstance(data, list):
-        return [row for row in data if isinstance(row, dict)]
-    if isinstance(data, dict):
-        for key in ("Matches", "matches", "data"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return [row for row in value if isinstance(row, dict)]
-    return []
+from wta_scores_common import classify_singles, fetch_global_matches
 
 
 def filter_live_singles(matches: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    return [
-        match
-        for match in matches
-        if match.get("DrawMatchType") == "S" and match.get("MatchState") == "P"
-    ]
+    return classify_singles(matches)["live"]
 
 
 def main() -> int:
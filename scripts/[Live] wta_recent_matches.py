@@ -4,6 +4,7 @@
 from __future__ import annotations
 
 import argparse
+import heapq
 import json
 import sys
 from datetime import datetime, timezone
@@ -12,7 +13,8 @@ from typing import Any, Dict, List, Optional
 
 import requests
 
-WTA_GLOBAL_MATCHES_URL = "https://api.wtatennis.com/tennis/matches/global"
+from wta_scores_common import HEADERS, classify_singles, fetch_global_matches
+
 WTA_MATCH_STATS_URL_TEMPLATE = (
     "https://api.wtatennis.com/tennis/tournaments/{event_id}/{event_year}/matches/{match_id}/stats"
 )
@@ -20,34 +22,15 @@ DEFAULT_CACHE_FILE = (
     Path(__file__).resolve().parent.parent / "data" / "wta_recent_match_stats_cache.json"
 )
 MAX_CACHE_ENTRIES = 1200
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    "Referer": "https://www.wtatennis.com/scores?type=S",
-}
-
-
-def fetch_global_matches(timeout: int) -> List[Dict[str, Any]]:
-    response = requests.get(WTA_GLOBAL_MATCHES_URL, headers=HEADERS, timeout=timeout)
-    response.raise_for_status()
-    data = response.json()
-    if isinstance(data, list):
-        return [row for row in data if isinstance(row, dict)]
-    if isinstance(data, dict):
-        for key in ("Matches", "matches", "data"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return [row for row in value if isinstance(row, dict)]
-    return []
 
 
 def filter_recent_singles(matches: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
-    finished = [
-        match
-        for match in matches
-        if match.get("DrawMatchType") == "S" and match.get("MatchState") == "F"
-    ]
-    finished.sort(key=lambda row: row.get("MatchTimeStamp") or "", reverse=True)
-    return finished[: max(1, limit)]
+    # Same result as sorting newest-first and slicing, without sorting every finished match
+    return heapq.nlargest(
+        max(1, limit),
+        classify_singles(matches)["finished"],
+        key=lambda row: row.get("MatchTimeStamp") or "",
+    )
 
 
 def _iso_now() -> str:
@@ -230,6 +213,7 @@ def enrich_recent_matches_with_stats(
     matches: List[Dict[str, Any]],
     timeout: int,
     cache_path: Path,
+    session: Optional[requests.Session] = None,
 ) -> List[Dict[str, Any]]:
     if not matches:
         return matches
@@ -240,7 +224,7 @@ def enrich_recent_matches_with_stats(
         by_match = {}
         cache["matches"] = by_match
 
-    session = requests.Session()
+    session = session or requests.Session()
     for match in matches:
         key = _match_cache_key(match)
         if not key.strip("|"):
@@ -281,12 +265,15 @@ def main() -> int:
     args = parser.parse_args()
 
     try:
-        payload = filter_recent_singles(fetch_global_matches(args.timeout), args.limit)
-        payload = enrich_recent_matches_with_stats(
-            matches=payload,
-            timeout=args.timeout,
-            cache_path=Path(args.cache_file),
-        )
+        # One keep-alive session for the match list and every stats request
+        with requests.Session() as session:
+            payload = filter_recent_singles(fetch_global_matches(args.timeout, session), args.limit)
+            payload = enrich_recent_matches_with_stats(
+                matches=payload,
+                timeout=args.timeout,
+                cache_path=Path(args.cache_file),
+                session=session,
+            )
     except Exception as exc:
         print(f"[wta_recent_matches] {exc}", file=sys.stderr)
         return 1
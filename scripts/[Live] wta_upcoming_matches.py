@@ -9,49 +9,31 @@ import sys
 from datetime import datetime, timedelta
 from typing import Any, Dict, List
 
-import requests
-
-WTA_GLOBAL_MATCHES_URL = "https://api.wtatennis.com/tennis/matches/global"
-HEADERS = {
-    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-    "Referer": "https://www.wtatennis.com/scores?type=S",
-}
-
-
-def fetch_global_matches(timeout: int) -> List[Dict[str, Any]]:
-    response = requests.get(WTA_GLOBAL_MATCHES_URL, headers=HEADERS, timeout=timeout)
-    response.raise_for_status()
-    data = response.json()
-    if isinstance(data, list):
-        return [row for row in data if isinstance(row, dict)]
-    if isinstance(data, dict):
-        for key in ("Matches", "matches", "data"):
-            value = data.get(key)
-            if isinstance(value, list):
-                return [row for row in value if isinstance(row, dict)]
-    return []
+from wta_scores_common import classify_singles, fetch_global_matches
 
 
 def filter_upcoming_singles(matches: List[Dict[str, Any]], days: int) -> List[Dict[str, Any]]:
     cutoff = datetime.now().date() + timedelta(days=max(0, days))
+    cutoff_iso = cutoff.isoformat()
     upcoming = []
-    for match in matches:
-        if match.get("DrawMatchType") != "S":
-            continue
-        if match.get("MatchState") in ("P", "F"):
-            continue
+    for match in classify_singles(matches)["upcoming"]:
         # Skip matches where either player is TBD / undetermined
         name_a = f"{match.get('PlayerNameFirstA', '')} {match.get('PlayerNameLastA', '')}".strip()
         name_b = f"{match.get('PlayerNameFirstB', '')} {match.get('PlayerNameLastB', '')}".strip()
         if not name_a or not name_b or str(match.get("PlayerIDA", "")).upper() == "TBD" or str(match.get("PlayerIDB", "")).upper() == "TBD":
             continue
         ts = match.get("MatchTimeStamp") or ""
-        try:
-            dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-            if dt.date() > cutoff:
+        # ISO timestamps start with their YYYY-MM-DD date, which compares as a string
+        if isinstance(ts, str) and len(ts) >= 10 and ts[4] == "-" and ts[7] == "-":
+            if ts[:10] > cutoff_iso:
                 continue
-        except Exception:
-            pass
+        else:
+            try:
+                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                if dt.date() > cutoff:
+                    continue
+            except Exception:
+                pass
         upcoming.append(match)
     upcoming.sort(key=lambda row: row.get("MatchTimeStamp") or "")
     return upcoming
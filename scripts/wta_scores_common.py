@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Shared helpers for WTA live/recent/upcoming score scripts."""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Optional
+
+import requests
+
+WTA_GLOBAL_MATCHES_URL = "https://api.wtatennis.com/tennis/matches/global"
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Referer": "https://www.wtatennis.com/scores?type=S",
+}
+
+
+def fetch_global_matches(
+    timeout: int,
+    session: Optional[requests.Session] = None,
+) -> List[Dict[str, Any]]:
+    response = (session or requests).get(WTA_GLOBAL_MATCHES_URL, headers=HEADERS, timeout=timeout)
+    response.raise_for_status()
+    data = response.json()
+    if isinstance(data, list):
+        return [row for row in data if isinstance(row, dict)]
+    if isinstance(data, dict):
+        for key in ("Matches", "matches", "data"):
+            value = data.get(key)
+            if isinstance(value, list):
+                return [row for row in value if isinstance(row, dict)]
+    return []
+
+
+def classify_singles(matches: List[Dict[str, Any]]) -> Dict[str, List[Dict[str, Any]]]:
+    """Split singles matches into live (P), finished (F) and upcoming buckets in one pass."""
+    buckets: Dict[str, List[Dict[str, Any]]] = {"live": [], "finished": [], "upcoming": []}
+    live = buckets["live"]
+    finished = buckets["finished"]
+    upcoming = buckets["upcoming"]
+    for match in matches:
+        if match.get("DrawMatchType") != "S":
+            continue
+        state = match.get("MatchState")
+        if state == "P":
+            live.append(match)
+        elif state == "F":
+            finished.append(match)
+        else:
+            upcoming.append(match)
+    return buckets